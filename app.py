@@ -1,10 +1,15 @@
 import streamlit as st
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
-import math
+import os
+import threading
+import time
+
+rerun_start = time.perf_counter()
+
+# Modul berat (matplotlib, scipy, plotly.subplots) diimpor saat dibutuhkan
+# agar cold start tetap cepat; lihat benchmarks/bench_startup.py
+from dclistrik import assets, cache, core, figures, state, units
+from dclistrik.profiling import PROFILER as profiler
 
 # Konfigurasi halaman
 st.set_page_config(
@@ -14,106 +19,14 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Load CSS
+# Load CSS: stylesheet diminifikasi sekali per proses dan disajikan lewat
+# static file serving Streamlit (nama file memuat hash isi untuk cache browser)
+@st.cache_resource
+def stylesheet_tag():
+    return assets.stylesheet_tag()
+
 def load_css():
-    st.markdown("""
-    <style>
-    /* Import dari file CSS terpisah */
-    @import url('physics_listrik.css');
-    
-    /* Style utama aplikasi */
-    .main-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        text-align: center;
-        color: white;
-        margin-bottom: 2rem;
-        box-shadow: 0 8px 32px rgba(102, 126, 234, 0.3);
-    }
-    
-    .calc-container {
-        background: linear-gradient(145deg, #f8f9ff 0%, #e8f0fe 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        border: 1px solid #e1e8ed;
-        margin-bottom: 1.5rem;
-        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.05);
-    }
-    
-    .result-box {
-        background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        border-left: 4px solid #667eea;
-        margin: 1rem 0;
-        font-weight: 600;
-        color: #2d3748;
-    }
-    
-    .formula-box {
-        background: linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%);
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 0.5rem 0;
-        font-family: 'Courier New', monospace;
-        font-weight: bold;
-        color: #2d3748;
-        text-align: center;
-    }
-    
-    .illustration-box {
-        background: linear-gradient(145deg, #f0f8ff 0%, #e6f3ff 100%);
-        padding: 1.5rem;
-        border-radius: 12px;
-        border: 2px dashed #87ceeb;
-        text-align: center;
-        margin: 1rem 0;
-    }
-    
-    .comparison-table {
-        background: white;
-        border-radius: 10px;
-        overflow: hidden;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
-        margin: 1rem 0;
-    }
-    
-    .footer-watermark {
-        position: fixed;
-        bottom: 10px;
-        right: 20px;
-        font-size: 12px;
-        color: #8a9ba8;
-        font-weight: 500;
-        z-index: 999;
-    }
-    
-    /* Styling untuk sidebar */
-    .css-1d391kg {
-        background: linear-gradient(180deg, #f7fafc 0%, #edf2f7 100%);
-    }
-    
-    /* Styling untuk input widgets */
-    .stNumberInput > div > div > input {
-        border-radius: 8px;
-        border: 2px solid #e2e8f0;
-        padding: 0.5rem;
-    }
-    
-    .stSelectbox > div > div > select {
-        border-radius: 8px;
-        border: 2px solid #e2e8f0;
-    }
-    
-    /* Hover effects */
-    .calc-container:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.1);
-        transition: all 0.3s ease;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(stylesheet_tag(), unsafe_allow_html=True)
 
 load_css()
 
@@ -131,46 +44,138 @@ st.sidebar.markdown("### 🔧 Panel Kontrol")
 # Pilihan kalkulator
 calc_option = st.sidebar.selectbox(
     "Pilih Kalkulator:",
-    ["Hukum Ohm", "Hambatan Seri-Paralel", "Daya Listrik", "Energi Listrik", "GGL & Tegangan Jepit"]
+    ["Hukum Ohm", "Hambatan Seri-Paralel", "Daya Listrik", "Energi Listrik", "GGL & Tegangan Jepit", "Rangkaian Umum (Netlist)", "Sweep Parameter", "Optimasi Daya Baterai", "Simulasi Baterai & Beban"]
 )
 
-# Fungsi untuk membuat grafik dengan style konsisten
-def create_plotly_graph(fig, title):
-    fig.update_layout(
-        title=dict(text=title, x=0.5, font=dict(size=16, color='#2d3748')),
-        plot_bgcolor='rgba(248, 249, 255, 0.8)',
-        paper_bgcolor='rgba(255, 255, 255, 0.9)',
-        font=dict(color='#2d3748'),
-        showlegend=True,
-        legend=dict(
-            bgcolor='rgba(255, 255, 255, 0.8)',
-            bordercolor='#e2e8f0',
-            borderwidth=1
-        ),
-        margin=dict(t=60, l=60, r=30, b=60)
-    )
-    fig.update_xaxes(
-        showgrid=True, 
-        gridwidth=1, 
-        gridcolor='rgba(135, 206, 235, 0.3)',
-        showline=True,
-        linewidth=2,
-        linecolor='#cbd5e0'
-    )
-    fig.update_yaxes(
-        showgrid=True, 
-        gridwidth=1, 
-        gridcolor='rgba(135, 206, 235, 0.3)',
-        showline=True,
-        linewidth=2,
-        linecolor='#cbd5e0'
-    )
-    return fig
+# Instrumentasi opt-in (DCLISTRIK_PROFILE=1); ringkasan JSON disajikan di
+# app/static/profiling.json dan dicatat berkala sebagai baris log
+profiler.export_path = os.path.join(assets.STATIC_DIR, "profiling.json")
+profiler.begin_rerun(calc_option, start=rerun_start)
+
+# Ekspor grafik ke gambar statis untuk handout cetak
+export_format = st.sidebar.selectbox("Ekspor Gambar:", ["Tidak", "PNG", "SVG"])
+
+# Statistik cache dibagi oleh semua sesi dalam satu proses
+@st.cache_resource
+def get_cache_stats():
+    return cache.CacheStats()
+
+# Cache hasil bersama lintas proses/replika, di bawah cache objek per proses
+# di bawah ini (DCLISTRIK_CACHE=sqlite:<path>; bawaan off)
+@st.cache_resource
+def get_shared_cache():
+    return cache.from_env()
+
+def shared_result(namespace, args, compute, figure=False):
+    shared = get_shared_cache()
+    if shared is None:
+        return compute()
+    if figure:
+        return shared.get_or_compute(namespace, args, compute, figures.figure_to_json, figures.figure_from_json)
+    return shared.get_or_compute(namespace, args, compute)
+
+# Grafik statis (tidak bergantung input), dibangun sekali per proses
+@st.cache_resource
+def _static_resource(name):
+    get_cache_stats().record_miss(name)
+    return shared_result(name, (), getattr(figures, name), figure=name.endswith('_figure'))
+
+# Grafik yang bergantung input, LRU terbatas berdasarkan parameternya
+@st.cache_resource(max_entries=256)
+def _cached_figure(name, *args):
+    get_cache_stats().record_miss(name)
+    return shared_result(name, args, lambda: getattr(figures, name)(*args), figure=True)
+
+# Pool figure matplotlib dipakai ulang lintas sesi (dijaga dengan lock)
+@st.cache_resource
+def get_figure_pool():
+    from dclistrik import export
+    return export.FigurePool(), threading.Lock()
+
+def export_button(chart, *args):
+    if export_format == "Tidak":
+        return
+    fmt = export_format.lower()
+    pool, lock = get_figure_pool()
+    with lock:
+        data = pool.render(chart, *args, fmt=fmt)
+    mime = "image/png" if fmt == "png" else "image/svg+xml"
+    st.download_button(f"⬇️ Unduh Grafik ({export_format})", data, file_name=f"{chart}.{fmt}", mime=mime)
+
+# Grid sweep (hingga MAX_CELLS float64 ≈ 200 MB) disimpan hanya untuk dua
+# kombinasi terakhir agar memori per replika tetap terbatas
+@st.cache_resource(max_entries=2)
+def compute_sweep(model_name, axes_spec, fixed_items):
+    from dclistrik import sweep
+    axes = {key: np.linspace(lo, hi, n) for key, lo, hi, n in axes_spec}
+    grid = shared_result("sweep", (model_name, axes_spec, fixed_items),
+                         lambda: sweep.evaluate(sweep.MODELS[model_name], axes, dict(fixed_items)))
+    return axes, grid
+
+# Hasil Monte Carlo (hingga 10^7 sampel float32 = 40 MB) untuk beberapa input terakhir
+@st.cache_resource(max_entries=4)
+def compute_tolerance(resistors, arrangement, spec_items, n_samples, seed, V, workers):
+    from dclistrik import tolerance
+    spec = tolerance.ToleranceSpec(**dict(spec_items))
+    return shared_result("tolerance", (resistors, arrangement, spec_items, n_samples, seed, V, workers),
+                         lambda: tolerance.monte_carlo(resistors, spec, arrangement, n_samples, seed, V, workers))
+
+def static_figure(name):
+    get_cache_stats().record_call(name)
+    with profiler.phase("grafik"):
+        return _static_resource(name)
+
+# Hasil turunan per sesi: dihitung ulang hanya bila inputnya berubah
+derived = state.Derived(st.session_state)
+
+def cached_figure(name, *args):
+    # Memo sesi dicek lebih dulu agar argumen besar tidak di-hash ulang
+    get_cache_stats().record_call(name)
+    with profiler.phase("grafik"):
+        return derived.get(f"figure:{name}", lambda *a: _cached_figure(name, *a), *args)
+
+# Serialisasi figure ke JSON dan pengiriman delta ke antrean sesi
+def show_chart(fig, target=st, **kwargs):
+    with profiler.phase("serialisasi"):
+        target.plotly_chart(fig, use_container_width=True, **kwargs)
+
+# Gabungkan suku rumus, dipotong bila hambatan sangat banyak; hanya suku
+# yang ditampilkan yang diformat (template memakai {i} = nomor, {v} = nilai)
+def format_terms(template, values, sep, limit=6):
+    n = len(values)
+    index = range(n) if n <= limit else [*range(limit - 1), None, n - 1]
+    return sep.join("..." if i is None else template.format(i=i + 1, v=values[i]) for i in index)
+
+# Input angka + satuan berawalan SI (mA, kΩ, ...); dikembalikan sebagai
+# units.Quantity sehingga rumus dan tampilan memakai konversi yang sama
+def quantity_input(label, unit, value, step, key=None, **kwargs):
+    number_col, unit_col = st.sidebar.columns([3, 2], vertical_alignment="bottom")
+    number = number_col.number_input(label, value=value, step=step, key=key, **kwargs)
+    choices = units.CHOICES[unit]
+    chosen = unit_col.selectbox(f"Satuan {label}", choices, index=choices.index(unit),
+                                key=f"unit_{key or label}", label_visibility="collapsed")
+    return units.Quantity(number, chosen)
+
+def random_resistors(n, r_min, r_max, seed):
+    return np.round(np.random.default_rng(seed).uniform(r_min, r_max, n), 2)
+
+def series_summary(resistors):
+    shown = units.Quantity.base(resistors, "Ω")
+    return (units.compute(core.series_resistance, shown),
+            format_terms("R{i}", resistors, " + "), format_terms("{v}", shown, " + "))
+
+def parallel_summary(resistors):
+    shown = units.Quantity.base(resistors, "Ω")
+    return (units.compute(core.parallel_conductance, shown), units.compute(core.parallel_resistance, shown),
+            format_terms("1/R{i}", resistors, " + "), format_terms("1/({v})", shown, " + "))
 
 # Main content area
 col1, col2 = st.columns([2, 1])
 
-with col1:
+# Skema rangkaian pengguna untuk kolom kanan (hanya kalkulator seri-paralel)
+schematic_svg = None
+
+with col1, profiler.phase("kalkulator"):
     # Kalkulator Hukum Ohm
     if calc_option == "Hukum Ohm":
         st.markdown('<div class="calc-container">', unsafe_allow_html=True)
@@ -179,58 +184,42 @@ with col1:
         ohm_calc = st.sidebar.selectbox("Hitung:", ["Tegangan (V)", "Arus (I)", "Hambatan (R)"])
         
         if ohm_calc == "Tegangan (V)":
-            I = st.sidebar.number_input("Arus (I) dalam Ampere:", value=1.0, step=0.1)
-            R = st.sidebar.number_input("Hambatan (R) dalam Ohm:", value=10.0, step=0.1)
-            V = I * R
-            
-            st.markdown(f'<div class="formula-box">V = I × R = {I} × {R} = {V:.2f} Volt</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="result-box">🔋 Tegangan = {V:.2f} Volt</div>', unsafe_allow_html=True)
+            I = quantity_input("Arus (I):", "A", value=1.0, step=0.1)
+            R = quantity_input("Hambatan (R):", "Ω", value=10.0, step=0.1)
+            V = units.compute(core.ohm_voltage, I, R)
             
-            # Grafik V vs I
-            I_range = np.linspace(0.1, 5, 100)
-            V_range = I_range * R
+            st.markdown(f'<div class="formula-box">V = I × R = {I} × {R} = {V:.2f}</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="result-box">🔋 Tegangan = {V:.2f}</div>', unsafe_allow_html=True)
             
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(x=I_range, y=V_range, mode='lines', 
-                                   name=f'R = {R}Ω', line=dict(color='#667eea', width=3)))
-            fig.add_trace(go.Scatter(x=[I], y=[V], mode='markers', 
-                                   name='Titik Aktual', marker=dict(color='#ff6b6b', size=10)))
-            
-            fig.update_xaxes(title='Arus (A)')
-            fig.update_yaxes(title='Tegangan (V)')
-            fig = create_plotly_graph(fig, 'Grafik Tegangan vs Arus (Hukum Ohm)')
-            st.plotly_chart(fig, use_container_width=True)
+            # Grafik V vs I (dalam satuan dasar A dan Ω)
+            show_chart(cached_figure('ohm_voltage_figure', float(I), float(R)))
+            export_button('ohm_voltage', float(I), float(R))
             
         elif ohm_calc == "Arus (I)":
-            V = st.sidebar.number_input("Tegangan (V) dalam Volt:", value=12.0, step=0.1)
-            R = st.sidebar.number_input("Hambatan (R) dalam Ohm:", value=10.0, step=0.1)
-            I = V / R if R != 0 else 0
-            
-            st.markdown(f'<div class="formula-box">I = V / R = {V} / {R} = {I:.2f} Ampere</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="result-box">⚡ Arus = {I:.2f} Ampere</div>', unsafe_allow_html=True)
+            V = quantity_input("Tegangan (V):", "V", value=12.0, step=0.1)
+            R = quantity_input("Hambatan (R):", "Ω", value=10.0, step=0.1)
+            I = units.compute(core.ohm_current, V, R)
             
-            # Grafik I vs R
-            R_range = np.linspace(1, 50, 100)
-            I_range = V / R_range
+            st.markdown(f'<div class="formula-box">I = V / R = {V} / {R} = {I:.2f}</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="result-box">⚡ Arus = {I:.2f}</div>', unsafe_allow_html=True)
             
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(x=R_range, y=I_range, mode='lines', 
-                                   name=f'V = {V}V', line=dict(color='#4ecdc4', width=3)))
-            fig.add_trace(go.Scatter(x=[R], y=[I], mode='markers', 
-                                   name='Titik Aktual', marker=dict(color='#ff6b6b', size=10)))
-            
-            fig.update_xaxes(title='Hambatan (Ω)')
-            fig.update_yaxes(title='Arus (A)')
-            fig = create_plotly_graph(fig, 'Grafik Arus vs Hambatan')
-            st.plotly_chart(fig, use_container_width=True)
+            # Grafik I vs R (rentang sweep dapat diatur, mis. skala log yang lebar)
+            with st.sidebar.expander("Rentang Grafik"):
+                r_min = st.number_input("R minimum (Ohm):", min_value=1e-6, value=1.0)
+                r_max = st.number_input("R maksimum (Ohm):", min_value=1e-6, value=50.0)
+                num_points = st.number_input("Jumlah Titik:", min_value=2, max_value=10_000_000, value=100, step=100)
+                log_scale = st.checkbox("Skala Log", value=False)
+            sweep = (r_min, r_max, int(num_points), log_scale)
+            show_chart(cached_figure('ohm_current_figure', float(V), float(R), *sweep))
+            export_button('ohm_current', float(V), float(R), *sweep)
             
         else:  # Hambatan (R)
-            V = st.sidebar.number_input("Tegangan (V) dalam Volt:", value=12.0, step=0.1)
-            I = st.sidebar.number_input("Arus (I) dalam Ampere:", value=1.0, step=0.1)
-            R = V / I if I != 0 else 0
+            V = quantity_input("Tegangan (V):", "V", value=12.0, step=0.1)
+            I = quantity_input("Arus (I):", "A", value=1.0, step=0.1)
+            R = units.compute(core.ohm_resistance, V, I)
             
-            st.markdown(f'<div class="formula-box">R = V / I = {V} / {I} = {R:.2f} Ohm</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="result-box">🔧 Hambatan = {R:.2f} Ohm</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="formula-box">R = V / I = {V} / {I} = {R:.2f}</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="result-box">🔧 Hambatan = {R:.2f}</div>', unsafe_allow_html=True)
             
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -239,49 +228,128 @@ with col1:
         st.markdown('<div class="calc-container">', unsafe_allow_html=True)
         st.markdown("### 🔗 Kalkulator Hambatan Seri-Paralel")
         
-        arrangement = st.sidebar.selectbox("Susunan:", ["Seri", "Paralel"])
-        num_resistors = st.sidebar.slider("Jumlah Hambatan:", 2, 5, 3)
+        arrangement = st.sidebar.selectbox("Susunan:", ["Seri", "Paralel", "Ekspresi"])
+        resistor_source = st.sidebar.selectbox("Sumber Hambatan:", ["Manual", "Unggah File", "Acak"])
+        
+        if resistor_source == "Manual":
+            num_resistors = st.sidebar.slider("Jumlah Hambatan:", 2, 5, 3)
+            resistor_unit = st.sidebar.selectbox("Satuan Hambatan:", units.CHOICES["Ω"], index=1)
+            resistors = []
+            for i in range(num_resistors):
+                r = st.sidebar.number_input(f"R{i+1}:", value=10.0*(i+1), step=0.1, key=f"r{i}")
+                resistors.append(r)
+            # Disimpan dalam Ohm agar cache, grafik dan Monte Carlo tidak berubah
+            resistors = units.Quantity(resistors, resistor_unit).value
+        elif resistor_source == "Unggah File":
+            uploaded = st.sidebar.file_uploader("File hambatan (CSV/TXT, Ohm; boleh 4.7k, 1MΩ):", type=["csv", "txt"])
+            if uploaded is not None:
+                resistors = core.parse_resistor_values(uploaded.getvalue().decode("utf-8"))
+            else:
+                resistors = np.array([10.0, 20.0, 30.0])
+                st.info("Belum ada file, memakai contoh R1=10, R2=20, R3=30 Ohm.")
+        else:  # Acak
+            num_resistors = st.sidebar.number_input("Jumlah Hambatan:", min_value=2, max_value=1_000_000, value=1000, step=100)
+            r_min = st.sidebar.number_input("R minimum (Ohm):", value=1.0, step=1.0)
+            r_max = st.sidebar.number_input("R maksimum (Ohm):", value=100.0, step=1.0)
+            seed = st.sidebar.number_input("Seed:", min_value=0, value=0, step=1)
+            resistors = derived.get("random_resistors", random_resistors, int(num_resistors), r_min, r_max, int(seed))
+        num_resistors = len(resistors)
         
-        resistors = []
-        for i in range(num_resistors):
-            r = st.sidebar.number_input(f"R{i+1} (Ohm):", value=10.0*(i+1), step=0.1, key=f"r{i}")
-            resistors.append(r)
+        from dclistrik import schematic
+        if arrangement in ("Seri", "Paralel"):
+            schematic_svg = schematic.flat_svg(schematic.SERIES if arrangement == "Seri" else schematic.PARALLEL, resistors)
         
         if arrangement == "Seri":
-            R_total = sum(resistors)
-            formula = " + ".join([f"R{i+1}" for i in range(num_resistors)])
-            calculation = " + ".join([f"{r}" for r in resistors])
+            R_total, formula, calculation = derived.get("series_summary", series_summary, resistors)
             
-            st.markdown(f'<div class="formula-box">R_total = {formula} = {calculation} = {R_total:.2f} Ω</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="result-box">🔗 Hambatan Total (Seri) = {R_total:.2f} Ohm</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="formula-box">R_total = {formula} = {calculation} = {R_total:.2f}</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="result-box">🔗 Hambatan Total (Seri) = {R_total:.2f}</div>', unsafe_allow_html=True)
+            
+        elif arrangement == "Ekspresi":
+            from dclistrik import network
+            shape = st.sidebar.selectbox("Bentuk Ekspresi:", ["Tulis Sendiri", "Tangga Otomatis"])
+            if shape == "Tulis Sendiri":
+                expression = st.sidebar.text_input("Ekspresi (+ seri, || paralel):", value="R1 + (R2 || R3)",
+                                                   help="Konstanta boleh berawalan SI: R1 + 4k7, R2 || 2.2k")
+            else:
+                expression = network.ladder_expression(num_resistors)
+            # DAG dan array hambatan terakhir disimpan per sesi; rerun hanya
+            # meneruskan hambatan yang berubah, dan perubahan itu hanya
+            # menghitung ulang leluhurnya
+            net, previous = st.session_state.get("network", (None, None))
+            try:
+                if net is None or net.expression != expression:
+                    net = network.Network(expression, network.resistor_values(resistors))
+                elif len(previous) == len(resistors):
+                    changed = network.changed_values(previous, resistors)
+                    net.update({name: R for name, R in changed.items() if name in net.leaves})
+                else:
+                    values = network.resistor_values(resistors)
+                    net.update({name: values[name] for name in net.names})
+                st.session_state["network"] = (net, resistors)
+            except KeyError as e:
+                st.error(f"Nilai hambatan belum diberikan: {e.args[0]}")
+                st.stop()
+            except ValueError as e:
+                st.error(f"Ekspresi tidak valid: {e}")
+                st.stop()
+            R_total = units.Quantity.base(net.total, "Ω")
+            arrangement = expression
+            shown = expression if len(expression) <= 80 else expression[:77] + "..."
+            
+            st.markdown(f'<div class="formula-box">R_total = {shown} = {R_total:.2f}</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="result-box">🧩 Hambatan Total (Ekspresi) = {R_total:.2f}</div>', unsafe_allow_html=True)
+            st.caption(f"{len(net):,} node unik • {net.shared:,} subekspresi bersama • {net.recomputed:,} node dihitung ulang")
+            # Tata letak di-cache per ekspresi; rerun hanya menambal teks nilai
+            schematic_svg = schematic.network_svg(net)
             
         else:  # Paralel
-            R_inv_total = sum([1/r for r in resistors if r != 0])
-            R_total = 1/R_inv_total if R_inv_total != 0 else 0
-            formula = " + ".join([f"1/R{i+1}" for i in range(num_resistors)])
-            calculation = " + ".join([f"1/{r}" for r in resistors])
+            R_inv_total, R_total, formula, calculation = derived.get("parallel_summary", parallel_summary, resistors)
             
             st.markdown(f'<div class="formula-box">1/R_total = {formula} = {calculation} = {R_inv_total:.4f}</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="formula-box">R_total = 1/{R_inv_total:.4f} = {R_total:.2f} Ω</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="result-box">🔀 Hambatan Total (Paralel) = {R_total:.2f} Ohm</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="formula-box">R_total = 1/({R_inv_total:.4f}) = {R_total:.2f}</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="result-box">🔀 Hambatan Total (Paralel) = {R_total:.2f}</div>', unsafe_allow_html=True)
         
         # Grafik perbandingan
-        fig = go.Figure()
-        
-        # Hitung untuk berbagai konfigurasi
-        test_values = np.linspace(1, 20, 50)
-        seri_values = [sum([r*x/10 for r in resistors]) for x in test_values]
-        paralel_values = [1/sum([1/(r*x/10) for r in resistors]) for x in test_values]
+        num_points = st.sidebar.number_input("Jumlah Titik Kurva:", min_value=2, max_value=1_000_000, value=50, step=50)
+        show_chart(cached_figure('series_parallel_figure', resistors, int(num_points)))
+        export_button('series_parallel', resistors, int(num_points))
         
-        fig.add_trace(go.Scatter(x=test_values, y=seri_values, mode='lines', 
-                               name='Susunan Seri', line=dict(color='#667eea', width=3)))
-        fig.add_trace(go.Scatter(x=test_values, y=paralel_values, mode='lines', 
-                               name='Susunan Paralel', line=dict(color='#4ecdc4', width=3)))
-        
-        fig.update_xaxes(title='Faktor Pengali')
-        fig.update_yaxes(title='Hambatan Total (Ω)')
-        fig = create_plotly_graph(fig, 'Perbandingan Hambatan Seri vs Paralel')
-        st.plotly_chart(fig, use_container_width=True)
+        # Analisis toleransi Monte Carlo
+        if st.sidebar.checkbox("Analisis Toleransi (Monte Carlo)"):
+            from dclistrik import tolerance
+            with st.sidebar.expander("Toleransi & Suhu", expanded=True):
+                tol_pct = st.selectbox("Toleransi:", [1.0, 2.0, 5.0, 10.0, 20.0], index=2, format_func=lambda p: f"±{p:g}%")
+                distribution = st.selectbox("Distribusi:", ["uniform", "normal"])
+                tempco = st.number_input("Koefisien Suhu (±ppm/°C):", min_value=0.0, value=100.0, step=10.0)
+                delta_T = st.number_input("Selisih Suhu ΔT (°C):", value=0.0, step=5.0)
+                V_source = st.number_input("Tegangan Sumber (V):", min_value=0.0, value=12.0, step=0.5)
+                n_samples = st.number_input("Jumlah Sampel:", min_value=1000, max_value=10_000_000, value=100_000, step=10_000)
+                mc_seed = st.number_input("Seed Monte Carlo:", min_value=0, value=0, step=1)
+                workers = st.number_input("Proses Paralel:", min_value=1, max_value=16, value=1, step=1)
+            spec = (("tolerance", tol_pct / 100), ("distribution", distribution),
+                    ("tempco_ppm", tempco), ("delta_T", delta_T))
+            with st.spinner("Menjalankan Monte Carlo..."):
+                result = compute_tolerance(resistors, arrangement, spec, int(n_samples), int(mc_seed), V_source, int(workers))
+            
+            st.markdown(f"#### 🎲 Analisis Toleransi ({int(n_samples):,} sampel)")
+            quantities = {
+                "R_total (Ω)": result.R_total,
+                "Arus (A)": result.current(),
+                "Daya (W)": result.power(),
+            }
+            rows = {}
+            for label, values in quantities.items():
+                pct = result.percentiles(values)
+                rows[label] = {f"P{q}": f"{v:.4g}" for q, v in pct.items()}
+                rows[label]["Rata-rata"] = f"{values.mean():.4g}"
+                rows[label]["σ"] = f"{values.std():.4g}"
+            st.table(rows)
+            for tab, (label, values) in zip(st.tabs(list(quantities)), quantities.items()):
+                with tab:
+                    centers, counts = tolerance.histogram(values)
+                    show_chart(figures.tolerance_figure(centers, counts, label, result.percentiles(values)),
+                               key=f"tolerance_{label}")
         
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -293,40 +361,31 @@ with col1:
         power_method = st.sidebar.selectbox("Metode Perhitungan:", ["P = V × I", "P = I² × R", "P = V² / R"])
         
         if power_method == "P = V × I":
-            V = st.sidebar.number_input("Tegangan (V) dalam Volt:", value=12.0, step=0.1)
-            I = st.sidebar.number_input("Arus (I) dalam Ampere:", value=2.0, step=0.1)
-            P = V * I
+            V = quantity_input("Tegangan (V):", "V", value=12.0, step=0.1)
+            I = quantity_input("Arus (I):", "A", value=2.0, step=0.1)
+            P = units.compute(core.power_vi, V, I)
             
-            st.markdown(f'<div class="formula-box">P = V × I = {V} × {I} = {P:.2f} Watt</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="formula-box">P = V × I = {V} × {I} = {P:.2f}</div>', unsafe_allow_html=True)
             
         elif power_method == "P = I² × R":
-            I = st.sidebar.number_input("Arus (I) dalam Ampere:", value=2.0, step=0.1)
-            R = st.sidebar.number_input("Hambatan (R) dalam Ohm:", value=10.0, step=0.1)
-            P = I**2 * R
+            I = quantity_input("Arus (I):", "A", value=2.0, step=0.1)
+            R = quantity_input("Hambatan (R):", "Ω", value=10.0, step=0.1)
+            P = units.compute(core.power_i2r, I, R)
             
-            st.markdown(f'<div class="formula-box">P = I² × R = {I}² × {R} = {P:.2f} Watt</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="formula-box">P = I² × R = ({I})² × {R} = {P:.2f}</div>', unsafe_allow_html=True)
             
         else:  # P = V² / R
-            V = st.sidebar.number_input("Tegangan (V) dalam Volt:", value=12.0, step=0.1)
-            R = st.sidebar.number_input("Hambatan (R) dalam Ohm:", value=10.0, step=0.1)
-            P = V**2 / R if R != 0 else 0
+            V = quantity_input("Tegangan (V):", "V", value=12.0, step=0.1)
+            R = quantity_input("Hambatan (R):", "Ω", value=10.0, step=0.1)
+            P = units.compute(core.power_v2r, V, R)
             
-            st.markdown(f'<div class="formula-box">P = V² / R = {V}² / {R} = {P:.2f} Watt</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="formula-box">P = V² / R = ({V})² / {R} = {P:.2f}</div>', unsafe_allow_html=True)
         
-        st.markdown(f'<div class="result-box">💡 Daya Listrik = {P:.2f} Watt</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="result-box">💡 Daya Listrik = {P:.2f}</div>', unsafe_allow_html=True)
         
         # Grafik daya vs waktu
-        time_range = np.linspace(0, 10, 100)
-        power_constant = np.full_like(time_range, P)
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=time_range, y=power_constant, mode='lines', 
-                               name=f'Daya Konstan', line=dict(color='#ff6b6b', width=3)))
-        
-        fig.update_xaxes(title='Waktu (s)')
-        fig.update_yaxes(title='Daya (W)')
-        fig = create_plotly_graph(fig, 'Grafik Daya vs Waktu')
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(cached_figure('power_figure', float(P)))
+        export_button('power', float(P))
         
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -335,30 +394,17 @@ with col1:
         st.markdown('<div class="calc-container">', unsafe_allow_html=True)
         st.markdown("### 🔋 Kalkulator Energi Listrik")
         
-        P = st.sidebar.number_input("Daya (P) dalam Watt:", value=100.0, step=1.0)
-        t = st.sidebar.number_input("Waktu (t) dalam jam:", value=2.0, step=0.1)
-        
-        W_joule = P * t * 3600  # dalam Joule
-        W_kwh = P * t / 1000    # dalam kWh
-        
-        st.markdown(f'<div class="formula-box">W = P × t = {P} W × {t} jam = {W_joule:.0f} Joule</div>', unsafe_allow_html=True)
-        st.markdown(f'<div class="formula-box">W = {P} W × {t} jam = {W_kwh:.3f} kWh</div>', unsafe_allow_html=True)
-        st.markdown(f'<div class="result-box">⚡ Energi = {W_joule:.0f} Joule = {W_kwh:.3f} kWh</div>', unsafe_allow_html=True)
-        
-        # Grafik energi vs waktu
-        time_range = np.linspace(0, 10, 100)
-        energy_range = P * time_range * 3600
+        P = quantity_input("Daya (P):", "W", value=100.0, step=1.0)
+        t = quantity_input("Waktu (t):", "jam", value=2.0, step=0.1)
+        W = units.compute(core.energy_joule, P, t)
         
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=time_range, y=energy_range, mode='lines', 
-                               name=f'P = {P} W', line=dict(color='#45b7d1', width=3)))
-        fig.add_trace(go.Scatter(x=[t], y=[W_joule], mode='markers', 
-                               name='Titik Aktual', marker=dict(color='#ff6b6b', size=10)))
+        st.markdown(f'<div class="formula-box">W = P × t = {P} × {t} = {W:.2f}</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="formula-box">W = {P} × {t} = {W:.3f kWh}</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="result-box">⚡ Energi = {W:.2f} = {W:.3f kWh}</div>', unsafe_allow_html=True)
         
-        fig.update_xaxes(title='Waktu (jam)')
-        fig.update_yaxes(title='Energi (Joule)')
-        fig = create_plotly_graph(fig, 'Grafik Energi vs Waktu')
-        st.plotly_chart(fig, use_container_width=True)
+        # Grafik energi vs waktu (W dan jam)
+        show_chart(cached_figure('energy_figure', float(P), t.to("jam")))
+        export_button('energy', float(P), t.to("jam"))
         
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -370,70 +416,343 @@ with col1:
         calc_type = st.sidebar.selectbox("Hitung:", ["GGL (ε)", "Tegangan Jepit (V)", "Hambatan Dalam (r)"])
         
         if calc_type == "GGL (ε)":
-            V = st.sidebar.number_input("Tegangan Jepit (V) dalam Volt:", value=9.0, step=0.1)
-            I = st.sidebar.number_input("Arus (I) dalam Ampere:", value=1.0, step=0.1)
-            r = st.sidebar.number_input("Hambatan Dalam (r) dalam Ohm:", value=1.0, step=0.1)
+            V = quantity_input("Tegangan Jepit (V):", "V", value=9.0, step=0.1)
+            I = quantity_input("Arus (I):", "A", value=1.0, step=0.1)
+            r = quantity_input("Hambatan Dalam (r):", "Ω", value=1.0, step=0.1)
             
-            epsilon = V + (I * r)
-            st.markdown(f'<div class="formula-box">ε = V + I×r = {V} + {I}×{r} = {epsilon:.2f} Volt</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="result-box">🔋 GGL (ε) = {epsilon:.2f} Volt</div>', unsafe_allow_html=True)
+            epsilon = units.compute(core.emf, V, I, r)
+            st.markdown(f'<div class="formula-box">ε = V + I×r = {V} + {I} × {r} = {epsilon:.2f}</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="result-box">🔋 GGL (ε) = {epsilon:.2f}</div>', unsafe_allow_html=True)
             
         elif calc_type == "Tegangan Jepit (V)":
-            epsilon = st.sidebar.number_input("GGL (ε) dalam Volt:", value=12.0, step=0.1)
-            I = st.sidebar.number_input("Arus (I) dalam Ampere:", value=1.0, step=0.1)
-            r = st.sidebar.number_input("Hambatan Dalam (r) dalam Ohm:", value=1.0, step=0.1)
+            epsilon = quantity_input("GGL (ε):", "V", value=12.0, step=0.1)
+            I = quantity_input("Arus (I):", "A", value=1.0, step=0.1)
+            r = quantity_input("Hambatan Dalam (r):", "Ω", value=1.0, step=0.1)
             
-            V = epsilon - (I * r)
-            st.markdown(f'<div class="formula-box">V = ε - I×r = {epsilon} - {I}×{r} = {V:.2f} Volt</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="result-box">⚡ Tegangan Jepit (V) = {V:.2f} Volt</div>', unsafe_allow_html=True)
+            V = units.compute(core.terminal_voltage, epsilon, I, r)
+            st.markdown(f'<div class="formula-box">V = ε - I×r = {epsilon} - {I} × {r} = {V:.2f}</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="result-box">⚡ Tegangan Jepit (V) = {V:.2f}</div>', unsafe_allow_html=True)
             
         else:  # Hambatan Dalam (r)
-            epsilon = st.sidebar.number_input("GGL (ε) dalam Volt:", value=12.0, step=0.1)
-            V = st.sidebar.number_input("Tegangan Jepit (V) dalam Volt:", value=9.0, step=0.1)
-            I = st.sidebar.number_input("Arus (I) dalam Ampere:", value=1.0, step=0.1)
+            epsilon = quantity_input("GGL (ε):", "V", value=12.0, step=0.1)
+            V = quantity_input("Tegangan Jepit (V):", "V", value=9.0, step=0.1)
+            I = quantity_input("Arus (I):", "A", value=1.0, step=0.1)
             
-            r = (epsilon - V) / I if I != 0 else 0
-            st.markdown(f'<div class="formula-box">r = (ε - V) / I = ({epsilon} - {V}) / {I} = {r:.2f} Ohm</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="result-box">🔧 Hambatan Dalam (r) = {r:.2f} Ohm</div>', unsafe_allow_html=True)
+            r = units.compute(core.internal_resistance, epsilon, V, I)
+            st.markdown(f'<div class="formula-box">r = (ε - V) / I = ({epsilon} - {V}) / {I} = {r:.2f}</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="result-box">🔧 Hambatan Dalam (r) = {r:.2f}</div>', unsafe_allow_html=True)
         
         # Grafik tegangan jepit vs arus
-        I_range = np.linspace(0.1, 5, 100)
-        if calc_type != "Hambatan Dalam (r)":
-            if calc_type == "GGL (ε)":
-                V_jepit_range = epsilon - I_range * r
-                epsilon_line = np.full_like(I_range, epsilon)
-            else:
-                V_jepit_range = epsilon - I_range * r
-                epsilon_line = np.full_like(I_range, epsilon)
+        show_chart(cached_figure('emf_figure', float(epsilon), float(r)))
+        export_button('emf', float(epsilon), float(r))
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Kalkulator Rangkaian Umum (analisis nodal)
+    elif calc_option == "Rangkaian Umum (Netlist)":
+        st.markdown('<div class="calc-container">', unsafe_allow_html=True)
+        st.markdown("### 🕸️ Kalkulator Rangkaian Umum (Netlist)")
+        from dclistrik import solver
+        
+        example_netlists = {
+            "Jembatan Wheatstone": "V1 a 0 12 r=0.5\nR1 a b 10\nR2 a c 20\nR3 b 0 30\nR4 c 0 40\nR5 b c 50",
+            "Dua Baterai": "V1 a 0 12 r=1\nV2 b 0 9 r=0.5\nR1 a c 4\nR2 b c 2\nR3 c 0 6",
+            "Tangga (Ladder)": "V1 n1 0 10\nR1 n1 n2 1\nR2 n2 0 2\nR3 n2 n3 1\nR4 n3 0 2\nR5 n3 n4 1\nR6 n4 0 2",
+            "Grid Besar": None,
+        }
+        example = st.sidebar.selectbox("Contoh Rangkaian:", list(example_netlists))
+        
+        if example == "Grid Besar":
+            grid_size = st.sidebar.number_input("Ukuran Grid (n × n):", min_value=2, max_value=1000, value=100, step=10)
+            grid_R = st.sidebar.number_input("Hambatan per cabang (Ohm):", value=1.0, step=0.1)
+            grid_emf = st.sidebar.number_input("GGL (ε) dalam Volt:", value=12.0, step=0.1)
+            grid_r = st.sidebar.number_input("Hambatan Dalam (r) dalam Ohm:", value=0.5, step=0.1)
+            netlist = solver.grid_netlist(int(grid_size), int(grid_size), grid_R, grid_emf, grid_r)
         else:
-            V_jepit_range = epsilon - I_range * r
-            epsilon_line = np.full_like(I_range, epsilon)
+            netlist_text = st.sidebar.text_area("Netlist:", value=example_netlists[example], height=200,
+                                                help="R<nama> n+ n- ohm | V<nama> n+ n- ggl r=<ohm> | I<nama> n+ n- ampere. Node 0 = ground. "
+                                                     "Nilai boleh berawalan SI: 4.7k, 2.2MΩ, 500mA, r=50m.")
+            try:
+                netlist = solver.parse_netlist(netlist_text)
+            except ValueError as exc:
+                st.error(str(exc))
+                st.stop()
         
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=I_range, y=V_jepit_range, mode='lines', 
-                               name='Tegangan Jepit', line=dict(color='#4ecdc4', width=3)))
-        fig.add_trace(go.Scatter(x=I_range, y=epsilon_line, mode='lines', 
-                               name='GGL', line=dict(color='#ff6b6b', width=2, dash='dash')))
+        try:
+            solution = solver.solve(netlist)
+        except ValueError as exc:
+            st.error(str(exc))
+            st.stop()
         
-        fig.update_xaxes(title='Arus (A)')
-        fig.update_yaxes(title='Tegangan (V)')
-        fig = create_plotly_graph(fig, 'Grafik GGL vs Tegangan Jepit')
-        st.plotly_chart(fig, use_container_width=True)
+        st.markdown('<div class="formula-box">G · v = i  (P = I² × R)</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="result-box">🕸️ {len(solution.node_names)} node, {len(solution.branch_names)} cabang, '
+                    f'Daya Total = {units.Quantity.base(solution.total_power, "W"):.2f}</div>', unsafe_allow_html=True)
+        
+        st.markdown("**Tegangan Node**")
+        st.dataframe({'Node': solution.node_names, 'Tegangan (V)': solution.node_voltages},
+                     use_container_width=True, height=200)
+        st.markdown("**Arus & Daya Cabang**")
+        st.dataframe({'Elemen': solution.branch_names, 'Tegangan (V)': solution.branch_voltages,
+                      'Arus (A)': solution.branch_currents, 'Daya (W)': solution.branch_powers},
+                     use_container_width=True, height=300)
+        
+        # Grafik arus cabang (hanya untuk rangkaian kecil)
+        if len(solution.branch_names) <= 200:
+            show_chart(figures.branch_current_figure(solution.branch_names, solution.branch_currents))
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Sweep parameter multi-dimensi
+    elif calc_option == "Sweep Parameter":
+        st.markdown('<div class="calc-container">', unsafe_allow_html=True)
+        st.markdown("### 🗺️ Sweep Parameter")
+        from dclistrik import sweep
+        
+        model_name = st.sidebar.selectbox("Model:", list(sweep.MODELS))
+        model = sweep.MODELS[model_name]
+        labels = [p.label for p in model.params]
+        swept = st.sidebar.multiselect("Masukan yang di-sweep (2–3):", labels, default=labels[:2])
+        if not 2 <= len(swept) <= 3:
+            st.warning("Pilih dua atau tiga masukan untuk di-sweep.")
+            st.stop()
+        
+        axes_spec, fixed_items = [], []
+        max_n = sweep.max_resolution(len(swept))
+        for p in model.params:
+            if p.label in swept:
+                with st.sidebar.expander(f"Rentang {p.label}"):
+                    lo = st.number_input("Minimum:", value=p.minimum, key=f"sweep_lo_{p.key}")
+                    hi = st.number_input("Maksimum:", value=p.maximum, key=f"sweep_hi_{p.key}")
+                    n = st.number_input(f"Resolusi (maks {max_n:,}):", min_value=2, max_value=max_n,
+                                        value=200 if len(swept) == 2 else 50, step=10,
+                                        key=f"sweep_n_{p.key}_{len(swept)}")
+                axes_spec.append((p.key, lo, hi, int(n)))
+            else:
+                fixed_items.append((p.key, st.sidebar.number_input(p.label, value=p.default, key=f"sweep_fix_{p.key}")))
+        plot_kind = st.sidebar.selectbox("Tampilan:", ["Heatmap", "Kontur"])
+        
+        start = time.perf_counter()
+        try:
+            axes, grid = compute_sweep(model_name, tuple(axes_spec), tuple(fixed_items))
+        except ValueError as e:
+            st.warning(str(e))
+            st.stop()
+        elapsed = (time.perf_counter() - start) * 1000
+        
+        keys = [key for key, *_ in axes_spec]
+        label_of = {p.key: p.label for p in model.params}
+        st.markdown(f'<div class="formula-box">{model_name}: grid {" × ".join(str(n) for *_, n in axes_spec)} '
+                    f'= {grid.size:,} titik</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="result-box">📈 {model.output}: min {np.nanmin(grid):.3f}, '
+                    f'maks {np.nanmax(grid):.3f} ({elapsed:.0f} ms)</div>', unsafe_allow_html=True)
+        
+        # Sweep 3-D ditampilkan per irisan sumbu ketiga
+        plane = grid
+        if len(keys) == 3:
+            k = st.slider(f"Irisan {label_of[keys[2]]}:", 0, len(axes[keys[2]]) - 1, 0)
+            st.caption(f"{label_of[keys[2]]} = {axes[keys[2]][k]:.4g}")
+            plane = grid[:, :, k]
+        (y_values, x_values), plane = sweep.thin([axes[keys[0]], axes[keys[1]]], plane)
+        fig = figures.sweep_figure(x_values, y_values, plane, label_of[keys[1]], label_of[keys[0]],
+                                   model.output, "contour" if plot_kind == "Kontur" else "heatmap")
+        show_chart(fig)
+        
+        # Tabel dibuat saat tombol diklik; grid besar dijarangkan agar unduhan
+        # langsung tidak melebihi MAX_TABLE_ROWS baris
+        table_axes, table_step = sweep.table_axes(axes)
+        if table_step > 1:
+            st.caption(f"Tabel unduhan memakai setiap {table_step} titik per sumbu "
+                       f"(maks {sweep.MAX_TABLE_ROWS:,} baris).")
+        st.download_button("⬇️ Unduh Tabel (CSV)",
+                           lambda: "".join(sweep.iter_table(model, table_axes, dict(fixed_items))),
+                           file_name="sweep.csv", mime="text/csv")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Optimasi transfer daya baterai ke beban
+    elif calc_option == "Optimasi Daya Baterai":
+        st.markdown('<div class="calc-container">', unsafe_allow_html=True)
+        st.markdown("### 🎯 Optimasi Daya Baterai")
+        from dclistrik import optimize
+        
+        opt_mode = st.sidebar.selectbox("Mode:", ["Transfer Daya Maksimum", "Susunan Sel", "Peringkat Baterai-Beban"])
+        
+        if opt_mode == "Transfer Daya Maksimum":
+            epsilon = quantity_input("GGL (ε):", "V", value=12.0, step=0.1)
+            r = quantity_input("Hambatan Dalam (r):", "Ω", value=1.0, min_value=0.01, step=0.1)
+            R_opt, P_max = optimize.max_power_transfer(float(epsilon), float(r))
+            R_opt, P_max = units.Quantity.base(R_opt, "Ω"), units.Quantity.base(P_max, "W")
+            
+            st.markdown(f'<div class="formula-box">P_maks = ε² / (4r) = ({epsilon})² / (4 × {r}) = {P_max:.2f} (saat R = r = {R_opt})</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="result-box">🎯 Beban Optimal R = {R_opt:.2f}, Daya Maksimum = {P_max:.2f}, Efisiensi = 50%</div>', unsafe_allow_html=True)
+            show_chart(cached_figure('power_transfer_figure', float(epsilon), float(r)))
+            
+        elif opt_mode == "Susunan Sel":
+            epsilon = float(quantity_input("GGL per sel (ε):", "V", value=1.5, step=0.1))
+            r = float(quantity_input("Hambatan dalam per sel (r):", "Ω", value=0.5, min_value=0.0, step=0.1))
+            n_cells = st.sidebar.number_input("Jumlah Sel:", min_value=1, max_value=100_000, value=12, step=1)
+            R = float(quantity_input("Hambatan Beban (R):", "Ω", value=2.0, min_value=0.0, step=0.1))
+            s_values, p_values, powers = optimize.arrangement_power(epsilon, r, int(n_cells), R)
+            s_best, p_best, P_best, s_ideal = optimize.best_arrangement(epsilon, r, int(n_cells), R)
+            
+            st.markdown(f'<div class="formula-box">ε_total = s × ε, r_total = s × r / p, optimum saat r_total = R → s ≈ √(nR/r) = {s_ideal:.2f}</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="result-box">🔋 Susunan Terbaik: {s_best} seri × {p_best} paralel, Daya = {units.Quantity.base(P_best, "W"):.2f}</div>', unsafe_allow_html=True)
+            st.dataframe({'Seri (s)': s_values, 'Paralel (p)': p_values, 'Daya (W)': powers},
+                         use_container_width=True, height=250)
+            
+        else:  # Peringkat Baterai-Beban
+            num_batteries = st.sidebar.number_input("Jumlah Baterai (acak):", min_value=1, max_value=100_000, value=1000, step=100)
+            seed = st.sidebar.number_input("Seed:", min_value=0, value=0, step=1)
+            loads_text = st.sidebar.text_input("Beban Kandidat (Ohm; boleh 1k, 2.2M):", value="1 2 5 10 20 50 100")
+            objective = st.sidebar.selectbox("Tujuan:", ["Daya Maksimum", "Efisiensi Maksimum"])
+            min_power = st.sidebar.number_input("Daya Minimum (W):", value=0.0, min_value=0.0, step=1.0)
+            
+            rng = np.random.default_rng(int(seed))
+            battery_emf = np.round(rng.uniform(1.5, 24.0, int(num_batteries)), 2)
+            battery_r = np.round(rng.uniform(0.05, 5.0, int(num_batteries)), 2)
+            try:
+                loads = core.parse_resistor_values(loads_text)
+            except ValueError:
+                st.error("Daftar beban tidak valid.")
+                st.stop()
+            
+            start = time.perf_counter()
+            battery, load, score, power = optimize.rank_combinations(
+                battery_emf, battery_r, loads, "power" if objective == "Daya Maksimum" else "efficiency",
+                min_power if min_power > 0 else None, top=10)
+            elapsed = (time.perf_counter() - start) * 1000
+            
+            st.markdown('<div class="formula-box">P = ε² R / (R + r)²,  η = R / (R + r)</div>', unsafe_allow_html=True)
+            st.markdown(f'<div class="result-box">🏆 {int(num_batteries) * len(loads):,} kombinasi diperingkat dalam {elapsed:.1f} ms</div>', unsafe_allow_html=True)
+            valid = np.isfinite(score)
+            st.dataframe({'Baterai': battery[valid] + 1, 'ε (V)': battery_emf[battery[valid]], 'r (Ω)': battery_r[battery[valid]],
+                          'Beban R (Ω)': loads[load[valid]], 'Daya (W)': power[valid],
+                          'Efisiensi (%)': optimize.efficiency(battery_r[battery[valid]], loads[load[valid]]) * 100},
+                         use_container_width=True)
         
         st.markdown('</div>', unsafe_allow_html=True)
 
-# Kolom kanan untuk ilustrasi dan perbandingan
-with col2:
+    # Simulasi domain waktu dengan keluaran bertahap
+    elif calc_option == "Simulasi Baterai & Beban":
+        st.markdown('<div class="calc-container">', unsafe_allow_html=True)
+        st.markdown("### ⏱️ Simulasi Baterai & Beban")
+        from dclistrik import simulate
+        from dclistrik.downsample import minmax
+        
+        sim_mode = st.sidebar.selectbox("Simulasi:", ["Energi Beban", "Pengosongan Baterai"])
+        profile_type = st.sidebar.selectbox("Profil Beban:", ["Konstan", "Siklus Kerja", "Unggah CSV"])
+        if profile_type == "Konstan":
+            P = st.sidebar.number_input("Daya (P) dalam Watt:", value=20.0, step=1.0)
+            profile = simulate.constant(P)
+        elif profile_type == "Siklus Kerja":
+            P_on = st.sidebar.number_input("Daya Aktif (W):", value=40.0, step=1.0)
+            P_off = st.sidebar.number_input("Daya Diam (W):", value=2.0, step=1.0)
+            period = st.sidebar.number_input("Periode (s):", min_value=0.001, value=1.0, step=0.1)
+            duty = st.sidebar.slider("Duty Cycle (%):", 0, 100, 30) / 100
+            profile = simulate.duty_cycle(P_on, period, duty, P_off)
+        else:  # Unggah CSV
+            uploaded = st.sidebar.file_uploader("Profil (CSV: t_detik, P_watt):", type=["csv", "txt"])
+            interpolate = st.sidebar.checkbox("Interpolasi Linear", value=False)
+            if uploaded is None:
+                st.info("Unggah file profil beban untuk memulai simulasi.")
+                st.stop()
+            try:
+                profile = simulate.profile_from_csv(uploaded.getvalue().decode("utf-8"), interpolate)
+            except ValueError as exc:
+                st.error(str(exc))
+                st.stop()
+        
+        duration_h = st.sidebar.number_input("Durasi (jam):", min_value=0.001, value=1.0, step=0.5)
+        dt_ms = st.sidebar.number_input("Langkah Waktu (ms):", min_value=0.1, value=1.0, step=1.0)
+        if sim_mode == "Pengosongan Baterai":
+            with st.sidebar.expander("Parameter Baterai"):
+                battery = simulate.Battery(
+                    capacity_ah=st.number_input("Kapasitas (Ah):", min_value=0.01, value=2.0, step=0.1),
+                    emf_full=st.number_input("GGL Penuh (V):", value=12.6, step=0.1),
+                    emf_empty=st.number_input("GGL Kosong (V):", value=10.5, step=0.1),
+                    r0=st.number_input("Hambatan Dalam Awal (Ω):", min_value=0.0, value=0.05, step=0.01),
+                    r_drift=st.number_input("Kenaikan r saat Kosong (×):", min_value=0.0, value=1.0, step=0.1),
+                    cutoff_voltage=st.number_input("Tegangan Batas (V):", value=10.0, step=0.1),
+                )
+                adaptive = st.checkbox("Langkah Adaptif", value=True)
+                max_dt = st.number_input("Langkah Maksimum (s):", min_value=0.001, value=1.0, step=0.1,
+                                         disabled=not adaptive,
+                                         help="Sebaiknya lebih kecil dari pulsa beban tersingkat")
+        
+        duration, dt = duration_h * 3600, dt_ms / 1000
+        st.markdown(f'<div class="formula-box">W = ∫ P(t) dt, {int(round(duration / dt)):,} langkah × {dt_ms} ms</div>', unsafe_allow_html=True)
+        
+        if st.button("▶️ Jalankan Simulasi"):
+            if sim_mode == "Energi Beban":
+                chunks = simulate.simulate_energy(profile, duration, dt)
+            else:
+                chunks = simulate.simulate_battery(battery, profile, duration, dt,
+                                                   adaptive=adaptive, max_dt=max_dt)
+            
+            progress = st.progress(0.0)
+            chart = st.empty()
+            labels = (("Daya (W)", "Energi (Wh)") if sim_mode == "Energi Beban"
+                      else ("Tegangan Jepit (V)", "SoC (%)"))
+            # Hanya versi yang dirampingkan (≤ 400 titik per chunk) yang disimpan
+            t_trace, left_trace, right_trace = [], [], []
+            
+            def draw_simulation():
+                # Kunci unik per pembaruan karena isi grafik bisa sama persis
+                show_chart(figures.simulation_figure(
+                    np.concatenate(t_trace), (np.concatenate(left_trace), labels[0], '#667eea'),
+                    (np.concatenate(right_trace), labels[1], '#ff6b6b')),
+                    target=chart, key=f"simulation_{len(t_trace)}")
+            
+            energy_total, t_end, stopped = 0.0, 0.0, None
+            for number, chunk in enumerate(chunks):
+                stopped = chunk.stopped
+                if len(chunk.t) == 0:
+                    break
+                if sim_mode == "Energi Beban":
+                    left, right = chunk.power, chunk.energy / 3600
+                else:
+                    left, right = chunk.voltage, chunk.soc * 100
+                t_small, left_small = minmax(chunk.t / 3600, left, 400)
+                t_trace.append(t_small)
+                left_trace.append(left_small)
+                right_trace.append(np.interp(t_small, chunk.t / 3600, right))
+                energy_total, t_end = float(chunk.energy[-1]), float(chunk.t[-1])
+                progress.progress(min(t_end / duration, 1.0))
+                if number % 5 == 0:
+                    draw_simulation()
+            
+            if t_trace and (len(t_trace) - 1) % 5 != 0:
+                draw_simulation()
+            progress.progress(1.0)
+            st.markdown(f'<div class="result-box">⚡ Energi = {energy_total:.0f} Joule = {energy_total / 3.6e6:.3f} kWh '
+                        f'dalam {t_end / 3600:.3f} jam</div>', unsafe_allow_html=True)
+            if stopped:
+                st.warning(f"Simulasi berhenti: {stopped}.")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+def schematic_box(svg):
+    # SVG besar (mis. tangga ratusan tingkat) digulir, bukan diperkecil
+    st.markdown(f'<div style="overflow:auto;max-height:420px">{svg}</div>', unsafe_allow_html=True)
+
+# Kolom kanan untuk ilustrasi dan perbandingan. Tanpa widget, jadi tidak
+# dijadikan fragment; grafik/tabel/skema contoh diambil dari cache sehingga
+# murah saat rerun skrip penuh
+def illustration_column(schematic_svg=None):
+    from dclistrik import schematic
     st.markdown("### 📚 Ilustrasi & Konsep")
     
+    if schematic_svg is not None:
+        st.markdown('<div class="illustration-box">', unsafe_allow_html=True)
+        st.markdown("#### 🧩 Rangkaian Anda")
+        schematic_box(schematic_svg)
+        st.markdown('</div>', unsafe_allow_html=True)
+    
     # Ilustrasi rangkaian
     st.markdown('<div class="illustration-box">', unsafe_allow_html=True)
     st.markdown("#### 🔗 Rangkaian Seri")
+    schematic_box(schematic.render(schematic.flat_layout(schematic.SERIES, 3)))
     st.markdown("""
-    ```
-    ——[R1]——[R2]——[R3]——
-    +                    -
-    ```
     **Karakteristik:**
     - Arus sama di semua titik
     - Tegangan terbagi
@@ -443,14 +762,8 @@ with col2:
     
     st.markdown('<div class="illustration-box">', unsafe_allow_html=True)
     st.markdown("#### 🔀 Rangkaian Paralel")
+    schematic_box(schematic.render(schematic.flat_layout(schematic.PARALLEL, 3)))
     st.markdown("""
-    ```
-    +——[R1]——+
-    |        |
-    +——[R2]——+
-    |        |
-    +——[R3]——+
-    ```
     **Karakteristik:**
     - Tegangan sama di semua cabang
     - Arus terbagi
@@ -462,34 +775,30 @@ with col2:
     st.markdown("#### ⚡ Perbandingan DC vs AC")
     
     # Grafik gelombang DC vs AC
-    t = np.linspace(0, 4*np.pi, 400)
-    dc_wave = np.ones_like(t) * 5
-    ac_wave = 5 * np.sin(t)
-    
-    fig = make_subplots(rows=2, cols=1, 
-                       subplot_titles=('Arus Searah (DC)', 'Arus Bolak-balik (AC)'),
-                       vertical_spacing=0.1)
-    
-    fig.add_trace(go.Scatter(x=t, y=dc_wave, mode='lines', name='DC', 
-                           line=dict(color='#667eea', width=3)), row=1, col=1)
-    fig.add_trace(go.Scatter(x=t, y=ac_wave, mode='lines', name='AC', 
-                           line=dict(color='#4ecdc4', width=3)), row=2, col=1)
-    
-    fig.update_xaxes(title_text="Waktu", row=2, col=1)
-    fig.update_yaxes(title_text="Tegangan (V)")
+    show_chart(static_figure('dc_ac_figure'))
     
-    fig = create_plotly_graph(fig, 'Kurva Gelombang DC vs AC')
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Tabel perbandingan
-    st.markdown('<div class="comparison-table">', unsafe_allow_html=True)
-    comparison_data = {
-        'Aspek': ['Arah Arus', 'Bentuk Gelombang', 'Frekuensi', 'Sumber', 'Kegunaan'],
-        'DC': ['Satu arah', 'Konstan', '0 Hz', 'Baterai, Aki', 'Elektronik'],
-        'AC': ['Bolak-balik', 'Sinusoidal', '50/60 Hz', 'PLN, Generator', 'Rumah tangga']
-    }
-    st.table(comparison_data)
-    st.markdown('</div>', unsafe_allow_html=True)
+    # Tabel perbandingan (HTML statis, dibangun sekali per proses)
+    st.markdown(static_figure('comparison_table_html'), unsafe_allow_html=True)
+
+with col2, profiler.phase("kolom_kanan"):
+    illustration_column(schematic_svg)
+
+# Statistik cache grafik (untuk memverifikasi rasio hit)
+with st.sidebar.expander("📊 Statistik Cache"):
+    cache_rows = get_cache_stats().snapshot()
+    st.caption(f"Rasio hit keseluruhan: {get_cache_stats().hit_rate():.1%}")
+    st.table({
+        'Grafik': list(cache_rows),
+        'Panggilan': [row[0] for row in cache_rows.values()],
+        'Hit': [row[1] for row in cache_rows.values()],
+        'Miss': [row[2] for row in cache_rows.values()],
+    })
+    shared_cache = get_shared_cache()
+    if shared_cache is not None:
+        shared_stats = shared_cache.backend.stats()
+        st.caption(f"Cache bersama ({shared_cache.backend.name}): rasio hit {shared_stats['rasio_hit']:.1%}, "
+                   f"{shared_stats['entri']:,} entri, {shared_stats['byte'] / 2**20:.1f} MB")
+        st.table({name: [shared_stats[name]] for name in ('hit', 'miss', 'simpan', 'dilewati', 'digusur', 'kedaluwarsa')})
 
 # Footer watermark
 st.markdown("""
@@ -498,32 +807,56 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Informasi tambahan
-st.markdown("---")
-st.markdown("### 📖 Rumus-rumus Penting")
+# Informasi tambahan (statis)
+def formula_footer():
+    st.markdown("---")
+    st.markdown("### 📖 Rumus-rumus Penting")
 
-col_formula1, col_formula2, col_formula3 = st.columns(3)
+    col_formula1, col_formula2, col_formula3 = st.columns(3)
 
-with col_formula1:
-    st.markdown("""
-    **Hukum Ohm:**
-    - V = I × R
-    - I = V / R  
-    - R = V / I
-    """)
+    with col_formula1:
+        st.markdown("""
+        **Hukum Ohm:**
+        - V = I × R
+        - I = V / R  
+        - R = V / I
+        """)
 
-with col_formula2:
-    st.markdown("""
-    **Daya Listrik:**
-    - P = V × I
-    - P = I² × R
-    - P = V² / R
-    """)
+    with col_formula2:
+        st.markdown("""
+        **Daya Listrik:**
+        - P = V × I
+        - P = I² × R
+        - P = V² / R
+        """)
 
-with col_formula3:
-    st.markdown("""
-    **Energi & GGL:**
-    - W = P × t
-    - ε = V + I×r
-    - V = ε - I×r
-    """)
+    with col_formula3:
+        st.markdown("""
+        **Energi & GGL:**
+        - W = P × t
+        - ε = V + I×r
+        - V = ε - I×r
+        """)
+
+formula_footer()
+
+profiler.end_rerun()
+
+# Panel admin tersembunyi: buka dengan ?admin=1 saat DCLISTRIK_PROFILE=1
+if profiler.enabled and st.query_params.get("admin") == "1":
+    with st.sidebar.expander("🛠️ Admin: Profil Jalur Panas", expanded=True):
+        st.caption("Waktu eksklusif per fase (ms) dari rerun terakhir di proses ini. "
+                   "JSON: app/static/profiling.json")
+        rows = [{'Kalkulator': calc, 'Fase': name, **stats}
+                for calc, phases in profiler.summary().items() for name, stats in phases.items()]
+        st.dataframe(rows, hide_index=True)
+        if st.button("Tulis JSON sekarang"):
+            profiler.maybe_export(force=True)
+
+# Latensi rerun skrip (lihat benchmarks/bench_rerun.py)
+latency = state.record_latency(st.session_state, (time.perf_counter() - rerun_start) * 1000)
+with st.sidebar.expander("⏱️ Latensi Rerun"):
+    st.caption(f"Terakhir {latency['terakhir']:.1f} ms • median {latency['median']:.1f} ms "
+               f"• maks {latency['maks']:.1f} ms ({latency['jumlah']} rerun)")
+    st.caption(f"Dihitung ulang: {', '.join(derived.recomputed) or '-'}")
+    st.caption(f"Dipakai ulang: {', '.join(derived.reused) or '-'}")
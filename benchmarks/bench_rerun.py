@@ -0,0 +1,80 @@
+"""Benchmark latensi per-rerun aplikasi dengan Streamlit AppTest.
+
+Setiap skenario memilih kalkulator, lalu berulang kali mengubah satu
+input dan mengukur waktu ``AppTest.run()`` (eksekusi skrip penuh tanpa
+browser). Median dan p95 dicetak per skenario.
+
+    python benchmarks/bench_rerun.py
+    python benchmarks/bench_rerun.py --app /tmp/app_lama.py --repeat 30
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _sidebar(at, kind, label):
+    return next(w for w in getattr(at.sidebar, kind) if w.label == label)
+
+
+def _choose(at, calculator, *settings):
+    _sidebar(at, "selectbox", "Pilih Kalkulator:").select(calculator).run()
+    for kind, label, value in settings:
+        widget = _sidebar(at, kind, label)
+        (widget.select if kind == "selectbox" else widget.set_value)(value).run()
+
+
+# (nama, kalkulator, pengaturan awal, (jenis, label input yang diubah), dua nilai bergantian)
+SCENARIOS = [
+    ("Hukum Ohm: ubah I", "Hukum Ohm", (), ("number_input", "Arus (I):"), (2.0, 3.0)),
+    ("Seri-Paralel: ubah R1", "Hambatan Seri-Paralel", (), ("number_input", "R1:"), (10.0, 12.0)),
+    ("Seri-Paralel acak 200k: ubah titik kurva", "Hambatan Seri-Paralel",
+     (("selectbox", "Sumber Hambatan:", "Acak"), ("number_input", "Jumlah Hambatan:", 200_000)),
+     ("number_input", "Jumlah Titik Kurva:"), (50, 60)),
+    ("GGL: ubah I", "GGL & Tegangan Jepit", (), ("number_input", "Arus (I):"), (1.0, 1.5)),
+]
+
+
+def measure(app, repeat):
+    from streamlit.testing.v1 import AppTest
+
+    results = {}
+    for name, calculator, settings, (kind, label), values in SCENARIOS:
+        at = AppTest.from_file(app, default_timeout=300).run()
+        _choose(at, calculator, *settings)
+        timings = []
+        for i in range(repeat):
+            widget = _sidebar(at, kind, label)
+            widget.set_value(values[i % 2])
+            start = time.perf_counter()
+            at.run()
+            wall = (time.perf_counter() - start) * 1000
+            if at.exception:
+                raise RuntimeError(f"{name}: {at.exception[0].message}")
+            # Waktu eksekusi skrip yang dicatat aplikasi sendiri, tanpa
+            # overhead polling AppTest; jatuh ke waktu dinding bila tidak ada
+            recorded = at.session_state["rerun_ms"] if "rerun_ms" in at.session_state else None
+            timings.append(recorded[-1] if recorded else wall)
+        results[name] = timings[1:]  # rerun pertama memanaskan cache
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default=os.path.join(ROOT, "app.py"), help="skrip Streamlit yang diukur")
+    parser.add_argument("--repeat", type=int, default=20, help="jumlah rerun per skenario")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, ROOT)
+    for name, timings in measure(os.path.abspath(args.app), args.repeat).items():
+        p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+        print(f"{name:45s} median {statistics.median(timings):8.1f} ms   p95 {p95:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""Benchmark kurva perbandingan seri vs paralel.
+
+Membandingkan list comprehension lama di app.py dengan
+``core.series_parallel_curve`` yang tervektorisasi.
+
+    python benchmarks/bench_seri_paralel.py
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dclistrik import core
+
+
+def comprehension_curve(resistors, test_values):
+    # Implementasi lama dari app.py
+    seri_values = [sum([r*x/10 for r in resistors]) for x in test_values]
+    paralel_values = [1/sum([1/(r*x/10) for r in resistors]) for x in test_values]
+    return seri_values, paralel_values
+
+
+def bench(num_resistors, num_points, number):
+    resistors = np.random.default_rng(0).uniform(1, 100, num_resistors)
+    test_values = np.linspace(1, 20, num_points)
+    resistor_list = resistors.tolist()
+
+    seri_old, paralel_old = comprehension_curve(resistor_list, test_values)
+    seri_new, paralel_new = core.series_parallel_curve(resistors, test_values)
+    assert np.allclose(seri_old, seri_new) and np.allclose(paralel_old, paralel_new)
+
+    old = min(timeit.repeat(lambda: comprehension_curve(resistor_list, test_values), number=number, repeat=3)) / number
+    new = min(timeit.repeat(lambda: core.series_parallel_curve(resistors, test_values), number=number, repeat=3)) / number
+    print(f"N={num_resistors:>6} titik={num_points:>7}  "
+          f"comprehension={old * 1e3:10.3f} ms  vektor={new * 1e3:8.3f} ms  "
+          f"speedup={old / new:8.0f}x")
+
+
+if __name__ == "__main__":
+    bench(3, 50, 200)
+    bench(100, 1_000, 5)
+    bench(1_000, 10_000, 1)
+
+    # Ukuran besar hanya untuk jalur vektor (comprehension butuh berjam-jam)
+    resistors = np.random.default_rng(0).uniform(1, 100, 100_000)
+    test_values = np.linspace(1, 20, 1_000_000)
+    new = min(timeit.repeat(lambda: core.series_parallel_curve(resistors, test_values), number=1, repeat=3))
+    print(f"N={len(resistors):>6} titik={len(test_values):>7}  vektor={new * 1e3:8.3f} ms")
@@ -0,0 +1,66 @@
+"""Benchmark waktu impor saat cold start aplikasi.
+
+Menjalankan ``app.py`` sekali dalam mode bare Streamlit di bawah
+``python -X importtime`` lalu menjumlahkan waktu impor seluruh modul.
+Gagal (exit 1) jika total melewati anggaran atau jika modul berat yang
+seharusnya ditunda ikut terimpor saat start.
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --budget-ms 2500
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modul yang hanya boleh dimuat oleh cabang kalkulator yang membutuhkannya
+DEFERRED_MODULES = ("matplotlib", "scipy", "plotly.express", "dclistrik.export", "dclistrik.solver")
+
+
+def measure():
+    """Kembalikan ``{modul: (self_us, cumulative_us)}`` untuk satu cold start."""
+    code = "import runpy; runpy.run_path('app.py', run_name='__main__')"
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                          env=env, capture_output=True, text=True, check=True)
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=float(os.environ.get("STARTUP_BUDGET_MS", 1800)),
+                        help="anggaran total waktu impor (default 1800 ms atau $STARTUP_BUDGET_MS)")
+    parser.add_argument("--repeat", type=int, default=3, help="ambil nilai terbaik dari N percobaan")
+    args = parser.parse_args(argv)
+
+    runs = [measure() for _ in range(args.repeat)]
+    totals = [sum(self_us for self_us, _ in run.values()) / 1000 for run in runs]
+    best = runs[totals.index(min(totals))]
+
+    print(f"Total waktu impor: {min(totals):.1f} ms ({len(best)} modul, anggaran {args.budget_ms:.0f} ms)")
+    top_level = [(name, cum) for name, (_, cum) in best.items() if "." not in name]
+    for name, cum in sorted(top_level, key=lambda item: -item[1])[:10]:
+        print(f"  {cum / 1000:8.1f} ms  {name}")
+
+    failed = False
+    eager = [name for name in DEFERRED_MODULES if name in best]
+    if eager:
+        print(f"GAGAL: modul berikut seharusnya ditunda: {', '.join(eager)}")
+        failed = True
+    if min(totals) > args.budget_ms:
+        print(f"GAGAL: waktu impor {min(totals):.1f} ms melewati anggaran {args.budget_ms:.0f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
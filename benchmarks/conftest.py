@@ -0,0 +1,13 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def pytest_collection_modifyitems(items):
+    # Ukuran besar dijalankan paling akhir: setelah membebaskan array
+    # ratusan MB, allocator menaikkan ambang mmap sehingga array ukuran
+    # sedang menjadi lebih cepat. Tanpa ini hasil run penuh dan run
+    # "-m 'not huge'" tidak bisa dibandingkan dengan baseline yang sama.
+    items.sort(key=lambda item: item.get_closest_marker("huge") is not None)
@@ -0,0 +1,48 @@
+"""Benchmark rerun ujung-ke-ujung lewat Streamlit AppTest.
+
+Setiap kasus memilih kalkulator, lalu mengukur ``AppTest.run()`` setelah
+satu input diubah bergantian di antara dua nilai (skrip penuh, termasuk
+kolom kanan dan footer).
+"""
+
+import os
+
+import pytest
+
+from bench_rerun import ROOT, _choose, _sidebar
+
+pytestmark = pytest.mark.app
+
+# (kalkulator, pengaturan awal, (jenis, label input yang diubah), dua nilai bergantian)
+CASES = {
+    "ohm": ("Hukum Ohm", (), ("number_input", "Arus (I):"), (2.0, 3.0)),
+    "seri_paralel_kecil": ("Hambatan Seri-Paralel", (), ("number_input", "R1:"), (10.0, 12.0)),
+    "seri_paralel_sedang": ("Hambatan Seri-Paralel",
+                            (("selectbox", "Sumber Hambatan:", "Acak"),),
+                            ("number_input", "Jumlah Titik Kurva:"), (5_000, 10_000)),
+    "daya": ("Daya Listrik", (), ("number_input", "Arus (I):"), (2.0, 3.0)),
+    "energi": ("Energi Listrik", (), ("number_input", "Daya (P):"), (100.0, 150.0)),
+    "ggl": ("GGL & Tegangan Jepit", (), ("number_input", "Arus (I):"), (1.0, 1.5)),
+}
+HUGE_CASES = {
+    "seri_paralel_besar": ("Hambatan Seri-Paralel",
+                           (("selectbox", "Sumber Hambatan:", "Acak"), ("number_input", "Jumlah Hambatan:", 200_000)),
+                           ("number_input", "Jumlah Titik Kurva:"), (500_000, 1_000_000)),
+}
+
+
+@pytest.mark.parametrize("case", list(CASES) + [pytest.param(name, marks=pytest.mark.huge) for name in HUGE_CASES])
+def test_rerun(benchmark, case):
+    from streamlit.testing.v1 import AppTest
+
+    calculator, settings, (kind, label), values = {**CASES, **HUGE_CASES}[case]
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=300).run()
+    _choose(at, calculator, *settings)
+    state = {"round": 0}
+
+    def change_input():
+        _sidebar(at, kind, label).set_value(values[state["round"] % 2])
+        state["round"] += 1
+
+    benchmark.pedantic(at.run, setup=change_input, rounds=30, warmup_rounds=1)
+    assert not at.exception
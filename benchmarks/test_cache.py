@@ -0,0 +1,37 @@
+"""Benchmark cache hasil bersama (:mod:`dclistrik.cache`).
+
+Membandingkan hit di setiap backend dengan membangun figure dari awal,
+termasuk encode/decode JSON Plotly yang dipakai aplikasi.
+"""
+
+import pytest
+
+from dclistrik import cache, figures
+
+ARGS = (2.0, 10.0)
+
+
+def _backend(kind, tmp_path):
+    if kind == "memori":
+        return cache.MemoryBackend()
+    if kind == "sqlite":
+        return cache.SQLiteBackend(str(tmp_path / "cache.db"))
+    return cache.TieredBackend(cache.MemoryBackend(), cache.SQLiteBackend(str(tmp_path / "cache.db")))
+
+
+def test_figure_build(benchmark):
+    fig = benchmark(figures.ohm_voltage_figure, *ARGS)
+    assert fig.data
+
+
+@pytest.mark.parametrize("kind", ["memori", "sqlite", "berlapis"])
+def test_figure_hit(benchmark, kind, tmp_path):
+    shared = cache.SharedCache(_backend(kind, tmp_path), version="bench")
+
+    def lookup():
+        return shared.get_or_compute("ohm_voltage_figure", ARGS, lambda: figures.ohm_voltage_figure(*ARGS),
+                                     figures.figure_to_json, figures.figure_from_json)
+
+    lookup()
+    fig = benchmark(lookup)
+    assert fig.data and shared.backend.stats()["miss"] == 1
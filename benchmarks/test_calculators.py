@@ -0,0 +1,91 @@
+"""Benchmark jalur hitung dan jalur grafik setiap kalkulator (tanpa Streamlit).
+
+Jalur hitung memakai fungsi :mod:`dclistrik.core` pada array masukan
+berukuran kecil, sedang dan sangat besar (seperti mode batch). Jalur
+grafik memanggil pembangun figure :mod:`dclistrik.figures` langsung,
+tanpa cache aplikasi.
+"""
+
+import numpy as np
+import pytest
+
+from dclistrik import core, figures
+
+SIZES = [
+    pytest.param(10, id="kecil"),
+    pytest.param(100_000, id="sedang"),
+    pytest.param(10_000_000, id="besar", marks=pytest.mark.huge),
+]
+
+
+def _inputs(n, count):
+    rng = np.random.default_rng(0)
+    return [rng.uniform(0.5, 50.0, n) for _ in range(count)]
+
+
+# Jalur hitung: (kalkulator, fungsi, jumlah array masukan)
+COMPUTE = {
+    "ohm_voltage": (core.ohm_voltage, 2),
+    "ohm_current": (core.ohm_current, 2),
+    "ohm_resistance": (core.ohm_resistance, 2),
+    "power_vi": (core.power_vi, 2),
+    "power_i2r": (core.power_i2r, 2),
+    "power_v2r": (core.power_v2r, 2),
+    "energy_joule": (core.energy_joule, 2),
+    "energy_kwh": (core.energy_kwh, 2),
+    "emf": (core.emf, 3),
+    "terminal_voltage": (core.terminal_voltage, 3),
+    "internal_resistance": (core.internal_resistance, 3),
+}
+
+
+@pytest.mark.parametrize("n", SIZES)
+@pytest.mark.parametrize("name", list(COMPUTE))
+def test_compute(benchmark, name, n):
+    func, count = COMPUTE[name]
+    args = _inputs(n, count)
+    result = benchmark(func, *args)
+    assert np.shape(result) == (n,)
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_compute_series_parallel(benchmark, n):
+    resistors = _inputs(n, 1)[0]
+    series, parallel = benchmark(lambda: (core.series_resistance(resistors), core.parallel_resistance(resistors)))
+    assert series > parallel > 0
+
+
+# Jalur grafik: figure berukuran tetap
+FIXED_FIGURES = {
+    "ohm_voltage_figure": (2.0, 10.0),
+    "power_figure": (100.0,),
+    "energy_figure": (100.0, 2.0),
+    "emf_figure": (12.0, 1.0),
+    "dc_ac_figure": (),
+}
+
+
+@pytest.mark.parametrize("name", list(FIXED_FIGURES))
+def test_figure(benchmark, name):
+    fig = benchmark(getattr(figures, name), *FIXED_FIGURES[name])
+    assert fig.data
+
+
+FIGURE_SIZES = [
+    pytest.param(3, 50, id="kecil"),
+    pytest.param(1_000, 10_000, id="sedang"),
+    pytest.param(100_000, 1_000_000, id="besar", marks=pytest.mark.huge),
+]
+
+
+@pytest.mark.parametrize("num_resistors, num_points", FIGURE_SIZES)
+def test_figure_series_parallel(benchmark, num_resistors, num_points):
+    resistors = np.round(np.random.default_rng(0).uniform(1, 100, num_resistors), 2)
+    fig = benchmark(figures.series_parallel_figure, resistors, num_points)
+    assert len(fig.data[0].x) <= max(num_points, 2 * figures.PLOT_WIDTH_PX)
+
+
+@pytest.mark.parametrize("_, num_points", FIGURE_SIZES)
+def test_figure_ohm_current(benchmark, _, num_points):
+    fig = benchmark(figures.ohm_current_figure, 12.0, 10.0, 1, 50, num_points, False)
+    assert len(fig.data[0].x) <= max(num_points, 2 * figures.PLOT_WIDTH_PX)
@@ -0,0 +1,44 @@
+"""Benchmark skema SVG (:mod:`dclistrik.schematic`).
+
+Tata letak dihitung sekali per topologi; yang diukur di sini adalah
+render ulang saat nilai berubah (hanya teks nilai yang ditambal) dan,
+untuk pembanding, tata letak dari awal.
+"""
+
+import numpy as np
+import pytest
+
+from dclistrik import network, schematic
+
+TOPOLOGIES = [
+    pytest.param(8, id="kecil"),
+    pytest.param(400, id="sedang"),
+    pytest.param(5_000, id="besar", marks=pytest.mark.huge),
+]
+
+
+def _network(n):
+    expression = network.ladder_expression(n)
+    values = {f"R{i + 1}": v for i, v in enumerate(np.random.default_rng(0).uniform(1, 1e4, n))}
+    return network.Network(expression, values)
+
+
+@pytest.mark.parametrize("n", TOPOLOGIES)
+def test_layout(benchmark, n):
+    net = _network(n)
+    layout = benchmark(schematic.network_layout.__wrapped__, net.expression)
+    assert layout.elements <= schematic.MAX_ELEMENTS + 1
+
+
+@pytest.mark.parametrize("n", TOPOLOGIES)
+def test_render(benchmark, n):
+    net = _network(n)
+    svg = benchmark(schematic.network_svg, net)
+    assert svg.startswith("<svg") and len(svg) < 64_000
+
+
+@pytest.mark.parametrize("count", [3, 1_000_000], ids=["kecil", "besar"])
+def test_render_flat(benchmark, count):
+    resistors = np.random.default_rng(0).uniform(1, 1e4, count)
+    svg = benchmark(schematic.flat_svg, schematic.PARALLEL, resistors)
+    assert svg.count("<use") <= schematic.MAX_CHILDREN
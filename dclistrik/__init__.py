@@ -0,0 +1 @@
+"""Mesin fisika rangkaian listrik arus searah (tanpa Streamlit)."""
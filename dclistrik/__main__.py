@@ -0,0 +1,5 @@
+import sys
+
+from dclistrik.batch import main
+
+sys.exit(main())
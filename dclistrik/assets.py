@@ -0,0 +1,200 @@
+"""Bundel stylesheet aplikasi untuk static file serving Streamlit.
+
+``physics_listrik.css`` dan gaya utama aplikasi (:data:`APP_CSS`)
+digabung, diminifikasi lalu ditulis ke ``static/`` dengan hash isi pada
+nama file. Browser dapat meng-cache file tersebut selama isinya tidak
+berubah, dan setiap rerun cukup mengirim satu tag kecil.
+
+Direktori ``static/`` bisa dipakai bersama beberapa replika: file ditulis
+atomik (file sementara + ``os.replace``) dan bundel lama baru dihapus
+setelah digantikan lebih dari :data:`STALE_AFTER` detik, karena replika
+yang belum diperbarui mungkin masih merujuknya.
+"""
+
+import glob
+import hashlib
+import os
+import re
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_CSS = os.path.join(ROOT, "physics_listrik.css")
+STATIC_DIR = os.path.join(ROOT, "static")
+# URL relatif agar tetap benar bila aplikasi berjalan di bawah base URL
+STATIC_URL = "app/static"
+BUNDLE_GLOB = "physics_listrik.*.min.css"
+STALE_AFTER = 24 * 3600
+
+# Style utama aplikasi (ditempatkan setelah physics_listrik.css sehingga
+# menimpanya, sama seperti urutan @import sebelumnya)
+APP_CSS = """\
+/* Style utama aplikasi */
+.main-header {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    padding: 2rem;
+    border-radius: 15px;
+    text-align: center;
+    color: white;
+    margin-bottom: 2rem;
+    box-shadow: 0 8px 32px rgba(102, 126, 234, 0.3);
+}
+
+.calc-container {
+    background: linear-gradient(145deg, #f8f9ff 0%, #e8f0fe 100%);
+    padding: 1.5rem;
+    border-radius: 12px;
+    border: 1px solid #e1e8ed;
+    margin-bottom: 1.5rem;
+    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.05);
+}
+
+.result-box {
+    background: linear-gradient(135deg, #a8edea 0%, #fed6e3 100%);
+    padding: 1rem;
+    border-radius: 10px;
+    border-left: 4px solid #667eea;
+    margin: 1rem 0;
+    font-weight: 600;
+    color: #2d3748;
+}
+
+.formula-box {
+    background: linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%);
+    padding: 1rem;
+    border-radius: 8px;
+    margin: 0.5rem 0;
+    font-family: 'Courier New', monospace;
+    font-weight: bold;
+    color: #2d3748;
+    text-align: center;
+}
+
+.illustration-box {
+    background: linear-gradient(145deg, #f0f8ff 0%, #e6f3ff 100%);
+    padding: 1.5rem;
+    border-radius: 12px;
+    border: 2px dashed #87ceeb;
+    text-align: center;
+    margin: 1rem 0;
+}
+
+.comparison-table {
+    background: white;
+    border-radius: 10px;
+    overflow: hidden;
+    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
+    margin: 1rem 0;
+}
+
+.footer-watermark {
+    position: fixed;
+    bottom: 10px;
+    right: 20px;
+    font-size: 12px;
+    color: #8a9ba8;
+    font-weight: 500;
+    z-index: 999;
+}
+
+/* Styling untuk sidebar */
+.css-1d391kg {
+    background: linear-gradient(180deg, #f7fafc 0%, #edf2f7 100%);
+}
+
+/* Styling untuk input widgets */
+.stNumberInput > div > div > input {
+    border-radius: 8px;
+    border: 2px solid #e2e8f0;
+    padding: 0.5rem;
+}
+
+.stSelectbox > div > div > select {
+    border-radius: 8px;
+    border: 2px solid #e2e8f0;
+}
+
+/* Hover effects */
+.calc-container:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 8px 25px rgba(0, 0, 0, 0.1);
+    transition: all 0.3s ease;
+}
+"""
+
+
+def minify_css(text):
+    """Minifikasi CSS sederhana: buang komentar dan spasi yang tidak perlu."""
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"\s*([{};,>])\s*", r"\1", text)
+    # Spasi sebelum ":" bisa bermakna (".a :hover" = turunan .a yang di-hover),
+    # jadi hanya spasi sesudahnya yang dibuang
+    text = re.sub(r":\s+", ":", text)
+    text = text.replace(";}", "}")
+    return text.strip()
+
+
+def remove_stale(static_dir, current, stale_after=STALE_AFTER, now=None):
+    """Hapus bundel yang sudah digantikan bundel lebih baru lebih dari ``stale_after`` detik.
+
+    Waktu penggantian = mtime bundel berikutnya (urut mtime), bukan mtime
+    bundel itu sendiri; ``current`` dan file selain bundel tidak disentuh.
+    """
+    now = time.time() if now is None else now
+    bundles = []
+    for path in glob.glob(os.path.join(static_dir, BUNDLE_GLOB)):
+        try:
+            bundles.append((os.path.getmtime(path), path))
+        except FileNotFoundError:
+            pass  # baru dihapus replika lain
+    bundles.sort()
+    for (_, path), (replaced, _) in zip(bundles, bundles[1:]):
+        if os.path.basename(path) != current and now - replaced > stale_after:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def build_stylesheet(static_dir=STATIC_DIR, stale_after=STALE_AFTER):
+    """Tulis bundel terminifikasi ke ``static_dir``; kembalikan nama file-nya.
+
+    Jika isi tidak berubah, file yang ada dipakai kembali tanpa ditulis
+    ulang. Saat bundel baru ditulis, bundel lama dibersihkan lewat
+    :func:`remove_stale`.
+    """
+    with open(SOURCE_CSS, encoding="utf-8") as f:
+        bundle = minify_css(f.read() + "\n" + APP_CSS)
+    digest = hashlib.sha256(bundle.encode("utf-8")).hexdigest()[:12]
+    filename = f"physics_listrik.{digest}.min.css"
+    path = os.path.join(static_dir, filename)
+    if not os.path.exists(path):
+        os.makedirs(static_dir, exist_ok=True)
+        # Nama sementara unik: sesi lain di proses yang sama (thread) atau
+        # replika lain bisa menulis bundel yang sama bersamaan
+        fd, tmp = tempfile.mkstemp(prefix=f".{filename}.", suffix=".tmp", dir=static_dir)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(bundle)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        remove_stale(static_dir, filename, stale_after)
+    return filename
+
+
+def stylesheet_tag(static_dir=STATIC_DIR):
+    """Markup per rerun: satu ``@import`` ke file statis ber-hash.
+
+    Bila direktori statis tidak dapat ditulis (deployment read-only),
+    bundel terminifikasi disisipkan langsung sebagai cadangan.
+    """
+    try:
+        filename = build_stylesheet(static_dir)
+    except OSError:
+        with open(SOURCE_CSS, encoding="utf-8") as f:
+            return f"<style>{minify_css(f.read() + APP_CSS)}</style>"
+    return f'<style>@import url("{STATIC_URL}/{filename}");</style>'
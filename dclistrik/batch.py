@@ -0,0 +1,200 @@
+"""Mode batch tanpa Streamlit untuk membuat lembar kerja dalam jumlah besar.
+
+Membaca baris masukan dari CSV/JSONL secara streaming, menghitung hasil
+dengan rumus yang sama seperti aplikasi (:mod:`dclistrik.core`) dan
+menulis keluaran bertahap. Memori tetap konstan karena hanya beberapa
+potongan (chunk) yang diproses pada satu waktu::
+
+    python -m dclistrik soal.csv hasil.csv --workers 8
+    python -m dclistrik soal.jsonl - --rumus ohm_current
+
+Setiap baris memilih rumus lewat kolom ``rumus`` (atau opsi ``--rumus``)
+dan menyediakan kolom masukan sesuai tabel :data:`FORMULAS`. Untuk
+``series``/``parallel`` kolom ``R`` berisi daftar hambatan (dipisah
+titik koma/spasi, atau list JSON). Nilai boleh berakhiran satuan SI
+(``20mA``, ``4.7k``, ``1.5kW``) dan dikonversi ke satuan rumus. Keluaran adalah baris masukan
+ditambah kolom ``hasil`` dan ``satuan``.
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from dclistrik import core, units
+
+# rumus: (kolom masukan, fungsi, satuan hasil)
+FORMULAS = {
+    # Hukum Ohm
+    "ohm_voltage": (("I", "R"), core.ohm_voltage, "V"),
+    "ohm_current": (("V", "R"), core.ohm_current, "A"),
+    "ohm_resistance": (("V", "I"), core.ohm_resistance, "Ohm"),
+    # Hambatan Seri-Paralel
+    "series": (("R",), core.series_resistance, "Ohm"),
+    "parallel": (("R",), core.parallel_resistance, "Ohm"),
+    # Daya Listrik
+    "power_vi": (("V", "I"), core.power_vi, "W"),
+    "power_i2r": (("I", "R"), core.power_i2r, "W"),
+    "power_v2r": (("V", "R"), core.power_v2r, "W"),
+    # Energi Listrik (t dalam jam)
+    "energy_joule": (("P", "t"), core.energy_joule, "J"),
+    "energy_kwh": (("P", "t"), core.energy_kwh, "kWh"),
+    # GGL & Tegangan Jepit
+    "emf": (("V", "I", "r"), core.emf, "V"),
+    "terminal_voltage": (("epsilon", "I", "r"), core.terminal_voltage, "V"),
+    "internal_resistance": (("epsilon", "V", "I"), core.internal_resistance, "Ohm"),
+}
+NETWORK_FORMULAS = ("series", "parallel")
+OUTPUT_COLUMNS = ("hasil", "satuan")
+
+
+def _resistor_list(value):
+    # Daftar JSON menerima nilai yang sama dengan teks, mis. ["4.7k", 100]
+    if isinstance(value, (list, tuple)):
+        return units.parse_values(list(value), "Ω")
+    return core.parse_resistor_values(str(value))
+
+
+def _network_matrix(values):
+    # Daftar hambatan dengan panjang berbeda dipadatkan dengan 0. Nol
+    # tidak mengubah jumlah seri dan dilewati pada susunan paralel.
+    lists = [_resistor_list(value) for value in values]
+    width = max(len(item) for item in lists)
+    matrix = np.zeros((len(lists), width))
+    for i, item in enumerate(lists):
+        matrix[i, :len(item)] = item
+    return matrix
+
+
+def compute_chunk(rows, default_formula=None):
+    """Hitung satu potongan baris; kembalikan list ``(hasil, satuan)``.
+
+    Baris dikelompokkan per rumus lalu dihitung sekaligus secara vektor.
+    """
+    groups = {}
+    for index, row in enumerate(rows):
+        formula = row.get("rumus") or default_formula
+        if formula not in FORMULAS:
+            raise ValueError(f"Rumus tidak dikenal: {formula!r}")
+        groups.setdefault(formula, []).append(index)
+
+    results = [None] * len(rows)
+    for formula, indices in groups.items():
+        columns, func, unit = FORMULAS[formula]
+        try:
+            if formula in NETWORK_FORMULAS:
+                args = (_network_matrix([rows[i]["R"] for i in indices]),)
+            else:
+                inputs = units.SIGNATURES[func.__name__][0]
+                args = [units.parse_values([rows[i][col] for i in indices], unit)
+                        for col, unit in zip(columns, inputs)]
+        except KeyError as exc:
+            raise ValueError(f"Kolom {exc} wajib untuk rumus {formula!r}") from None
+        values = np.atleast_1d(func(*args)).tolist()
+        for i, value in zip(indices, values):
+            results[i] = (value, unit)
+    return results
+
+
+def _chunks(rows, chunk_size):
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def process(rows, default_formula=None, chunk_size=10_000, workers=1):
+    """Hasilkan ``(baris, (hasil, satuan))`` secara streaming dan berurutan.
+
+    Dengan ``workers > 1`` potongan dihitung di process pool; paling banyak
+    ``2 × workers`` potongan berada di antrean agar memori tetap terbatas.
+    """
+    if workers <= 1:
+        for chunk in _chunks(rows, chunk_size):
+            yield from zip(chunk, compute_chunk(chunk, default_formula))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunks(rows, chunk_size):
+            pending.append((chunk, pool.submit(compute_chunk, chunk, default_formula)))
+            if len(pending) >= 2 * workers:
+                done_chunk, future = pending.popleft()
+                yield from zip(done_chunk, future.result())
+        while pending:
+            done_chunk, future = pending.popleft()
+            yield from zip(done_chunk, future.result())
+
+
+def _detect_format(path, fmt):
+    if fmt:
+        return fmt
+    return "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def _read_rows(stream, fmt):
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        return reader, list(reader.fieldnames or [])
+    rows = (json.loads(line) for line in stream if line.strip())
+    return rows, None
+
+
+def run(input_stream, output_stream, input_format="csv", output_format="csv",
+        default_formula=None, chunk_size=10_000, workers=1):
+    """Proses seluruh aliran masukan dan tulis hasil; kembalikan jumlah baris."""
+    rows, fieldnames = _read_rows(input_stream, input_format)
+    writer = None
+    count = 0
+    for row, (value, unit) in process(rows, default_formula, chunk_size, workers):
+        if output_format == "csv":
+            if writer is None:
+                columns = fieldnames or [key for key in row if key not in OUTPUT_COLUMNS]
+                writer = csv.DictWriter(output_stream, fieldnames=list(columns) + list(OUTPUT_COLUMNS),
+                                        extrasaction="ignore")
+                writer.writeheader()
+            writer.writerow({**row, "hasil": value, "satuan": unit})
+        else:
+            output_stream.write(json.dumps({**row, "hasil": value, "satuan": unit}) + "\n")
+        count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m dclistrik",
+        description="Hitung soal rangkaian listrik DC secara batch dari CSV/JSONL.",
+    )
+    parser.add_argument("input", help="file masukan (.csv/.jsonl) atau '-' untuk stdin")
+    parser.add_argument("output", help="file keluaran (.csv/.jsonl) atau '-' untuk stdout")
+    parser.add_argument("--rumus", choices=sorted(FORMULAS),
+                        help="rumus bawaan untuk baris tanpa kolom 'rumus'")
+    parser.add_argument("--input-format", choices=("csv", "jsonl"))
+    parser.add_argument("--output-format", choices=("csv", "jsonl"))
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=1, help="jumlah proses (default 1)")
+    args = parser.parse_args(argv)
+
+    input_format = _detect_format(args.input, args.input_format)
+    output_format = _detect_format(args.output, args.output_format)
+    input_stream = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    output_stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        count = run(input_stream, output_stream, input_format, output_format,
+                    args.rumus, args.chunk_size, args.workers)
+    except ValueError as exc:
+        parser.exit(1, f"galat: {exc}\n")
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+    print(f"{count} baris diproses", file=sys.stderr)
+    return 0
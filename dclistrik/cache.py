@@ -0,0 +1,445 @@
+"""Cache hasil lintas sesi dan lintas proses, beserta penghitung hit/miss.
+
+:class:`CacheStats` mencatat hit/miss per nama fungsi (aman lintas thread
+sesi). :class:`SharedCache` menyimpan hasil (figure sebagai JSON Plotly,
+hasil hitungan sebagai pickle) di sebuah backend dengan kunci hash
+kanonik dari versi kode, nama kalkulator dan inputnya, sehingga input
+buku teks yang sama cukup dihitung sekali untuk semua sesi dan replika:
+
+* :class:`MemoryBackend` — LRU dalam proses, dibatasi jumlah entri dan byte.
+* :class:`SQLiteBackend` — file SQLite (mode WAL) yang dibagi antar proses
+  di satu mesin/volume; LRU perkiraan berdasarkan waktu akses.
+* :class:`TieredBackend` — LRU memori di depan SQLite; salinan memori
+  mewarisi sisa TTL entri SQLite.
+
+Backend dipilih lewat variabel lingkungan (lihat :func:`from_env`)::
+
+    DCLISTRIK_CACHE=off                         # bawaan
+    DCLISTRIK_CACHE=sqlite:/var/cache/dclistrik.db
+    DCLISTRIK_CACHE_TTL=86400 DCLISTRIK_CACHE_MAX_MB=256
+
+Tanpa backend lintas proses cache ini mati: dalam satu proses
+``st.cache_resource`` sudah menyimpan objeknya, dan LRU memori kedua hanya
+menambah encode dan salinan di setiap miss.
+
+Nilai disimpan sebagai bytes; data cache dianggap tepercaya (pickle).
+"""
+
+import dataclasses
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+DEFAULT_TTL = 86400.0  # detik
+DEFAULT_MAX_BYTES = 256 * 2**20
+MAX_ITEM_BYTES = 16 * 2**20  # hasil lebih besar tidak dibagi (mis. grid sweep raksasa)
+TOUCH_INTERVAL = 60.0  # detik; waktu akses SQLite diperbarui paling sering sekali per interval
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStats:
+    """Catat jumlah panggilan dan miss per nama fungsi yang di-cache."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._misses = {}
+
+    def record_call(self, name):
+        with self._lock:
+            self._calls[name] = self._calls.get(name, 0) + 1
+
+    def record_miss(self, name):
+        with self._lock:
+            self._misses[name] = self._misses.get(name, 0) + 1
+
+    def hit_rate(self, name=None):
+        """Rasio hit untuk satu nama, atau keseluruhan bila ``name`` None."""
+        with self._lock:
+            if name is None:
+                calls = sum(self._calls.values())
+                misses = sum(self._misses.values())
+            else:
+                calls = self._calls.get(name, 0)
+                misses = self._misses.get(name, 0)
+        return (calls - misses) / calls if calls else 0.0
+
+    def snapshot(self):
+        """Tabel ``{nama: (panggilan, hit, miss, rasio hit)}``."""
+        with self._lock:
+            names = sorted(self._calls)
+            rows = {name: (self._calls[name], self._misses.get(name, 0)) for name in names}
+        return {
+            name: (calls, calls - misses, misses, (calls - misses) / calls if calls else 0.0)
+            for name, (calls, misses) in rows.items()
+        }
+
+
+# Kunci kanonik: stabil lintas proses dan mesin (berbeda dengan hash() Python)
+def _feed(h, value):
+    if value is None:
+        h.update(b"N;")
+    elif isinstance(value, (bool, np.bool_)):
+        h.update(b"T;" if value else b"F;")
+    elif isinstance(value, (int, np.integer)):
+        h.update(b"i%d;" % int(value))
+    elif isinstance(value, (float, np.floating)):
+        h.update(b"f" + float(value).hex().encode() + b";")
+    elif isinstance(value, str):
+        data = value.encode()
+        h.update(b"s%d:" % len(data) + data)
+    elif isinstance(value, bytes):
+        h.update(b"b%d:" % len(value) + value)
+    elif isinstance(value, np.ndarray):
+        h.update(f"a{value.dtype.str}{value.shape}:".encode())
+        h.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, (tuple, list)):
+        h.update(b"(%d:" % len(value))
+        for item in value:
+            _feed(h, item)
+    elif isinstance(value, dict):
+        h.update(b"{%d:" % len(value))
+        for key in sorted(value):
+            _feed(h, key)
+            _feed(h, value[key])
+    else:
+        raise TypeError(f"Tipe argumen tidak dapat dijadikan kunci cache: {type(value).__name__}")
+
+
+def canonical_key(*parts):
+    """Hash heksadesimal (BLAKE2b 128-bit) dari ``parts`` yang di-encode kanonik.
+
+    Angka dibedakan menurut tipe (``10`` ≠ ``10.0``) karena keluaran bisa
+    berbeda (mis. label ``R = 10.0Ω``); array di-hash beserta dtype dan bentuknya.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    _feed(h, parts)
+    return h.hexdigest()
+
+
+def source_version(package_dir=os.path.dirname(os.path.abspath(__file__))):
+    """Hash isi semua modul paket: entri dari versi kode lain tidak terpakai."""
+    h = hashlib.blake2b(digest_size=8)
+    for name in sorted(os.listdir(package_dir)):
+        if name.endswith(".py"):
+            with open(os.path.join(package_dir, name), "rb") as f:
+                h.update(name.encode() + b"\0" + f.read())
+    return h.hexdigest()
+
+
+class _Backend:
+    # Penghitung metrik bersama untuk semua backend
+    name = "backend"
+
+    def __init__(self):
+        self._metric_lock = threading.Lock()
+        self.metrics = dict.fromkeys(("hit", "miss", "simpan", "dilewati", "digusur", "kedaluwarsa"), 0)
+
+    def _count(self, metric, n=1):
+        with self._metric_lock:
+            self.metrics[metric] += n
+
+    def accepts(self, size):
+        """Apakah nilai berukuran ``size`` byte bisa disimpan (tidak langsung dibuang)."""
+        return size <= min(self.max_item_bytes, self.max_bytes)
+
+    def skip(self):
+        """Catat nilai yang tidak disimpan karena terlalu besar."""
+        self._count("dilewati")
+
+    def stats(self):
+        with self._metric_lock:
+            out = dict(self.metrics)
+        lookups = out["hit"] + out["miss"]
+        out["rasio_hit"] = out["hit"] / lookups if lookups else 0.0
+        return out
+
+
+class MemoryBackend(_Backend):
+    """LRU bytes dalam proses dengan batas entri, batas byte dan TTL."""
+
+    name = "memori"
+
+    def __init__(self, max_entries=1024, max_bytes=64 * 2**20, max_item_bytes=MAX_ITEM_BYTES):
+        super().__init__()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # kunci → (bytes, kedaluwarsa)
+        self._bytes = 0
+
+    def get(self, key):
+        entry = self.get_entry(key)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, key):
+        """``(bytes, kedaluwarsa)`` atau None; kedaluwarsa None berarti tanpa TTL."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= time.time():
+                self._drop(key)
+                self._count("kedaluwarsa")
+                entry = None
+            if entry is None:
+                self._count("miss")
+                return None
+            self._entries.move_to_end(key)
+        self._count("hit")
+        return entry
+
+    def set(self, key, value, ttl=None):
+        if not self.accepts(len(value)):
+            self.skip()
+            return False
+        expires = time.time() + ttl if ttl else None
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, expires)
+            self._bytes += len(value)
+            evicted = 0
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._drop(next(iter(self._entries)))
+                evicted += 1
+        self._count("simpan")
+        if evicted:
+            self._count("digusur", evicted)
+        return True
+
+    def _drop(self, key):
+        value, _ = self._entries.pop(key)
+        self._bytes -= len(value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        out = super().stats()
+        with self._lock:
+            out.update(entri=len(self._entries), byte=self._bytes)
+        return out
+
+
+class SQLiteBackend(_Backend):
+    """Cache bytes dalam file SQLite yang dapat dibagi oleh banyak proses.
+
+    Setiap thread memakai koneksinya sendiri (mode WAL, autocommit).
+    Setelah setiap penyimpanan, entri kedaluwarsa dihapus dan entri yang
+    paling lama tidak diakses digusur sampai total ukuran ≤ ``max_bytes``.
+    Total ukuran dijaga trigger di tabel ``meta`` sehingga tidak perlu
+    ``SUM(size)`` di setiap penyimpanan, juga bila ditulis proses lain.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, max_item_bytes=MAX_ITEM_BYTES):
+        super().__init__()
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        db = self._db()
+        db.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                   "size INTEGER NOT NULL, expires REAL, used REAL NOT NULL)")
+        db.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries (used)")
+        db.execute("CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires)")
+        db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        db.execute("INSERT OR IGNORE INTO meta VALUES ('byte', (SELECT COALESCE(SUM(size), 0) FROM entries))")
+        db.execute("CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN "
+                   "UPDATE meta SET value = value + NEW.size WHERE name = 'byte'; END")
+        db.execute("CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN "
+                   "UPDATE meta SET value = value - OLD.size WHERE name = 'byte'; END")
+
+    def _db(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def get(self, key):
+        entry = self.get_entry(key)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, key):
+        """``(bytes, kedaluwarsa)`` atau None; kedaluwarsa None berarti tanpa TTL."""
+        db = self._db()
+        row = db.execute("SELECT value, expires, used FROM entries WHERE key = ?", (key,)).fetchone()
+        now = time.time()
+        if row is not None and row[1] is not None and row[1] <= now:
+            db.execute("DELETE FROM entries WHERE key = ? AND expires <= ?", (key, now))
+            self._count("kedaluwarsa")
+            row = None
+        if row is None:
+            self._count("miss")
+            return None
+        if now - row[2] > TOUCH_INTERVAL:
+            db.execute("UPDATE entries SET used = ? WHERE key = ?", (now, key))
+        self._count("hit")
+        return bytes(row[0]), row[1]
+
+    def set(self, key, value, ttl=None):
+        if not self.accepts(len(value)):
+            self.skip()
+            return False
+        now = time.time()
+        db = self._db()
+        # DELETE + INSERT (bukan INSERT OR REPLACE) agar trigger total ukuran
+        # ikut berjalan; transaksi menjaga total tetap konsisten antar proses
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            db.execute("INSERT INTO entries (key, value, size, expires, used) VALUES (?, ?, ?, ?, ?)",
+                       (key, sqlite3.Binary(value), len(value), now + ttl if ttl else None, now))
+            evicted = self._evict(db, now)
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        self._count("simpan")
+        if evicted:
+            self._count("digusur", evicted)
+        return True
+
+    def _size(self, db):
+        return db.execute("SELECT value FROM meta WHERE name = 'byte'").fetchone()[0]
+
+    def _evict(self, db, now):
+        expired = db.execute("DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?", (now,)).rowcount
+        if expired > 0:
+            self._count("kedaluwarsa", expired)
+        excess = self._size(db) - self.max_bytes
+        if excess <= 0:
+            return 0
+        victims = []
+        for key, size in db.execute("SELECT key, size FROM entries ORDER BY used"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        db.executemany("DELETE FROM entries WHERE key = ?", victims)
+        return len(victims)
+
+    def clear(self):
+        self._db().execute("DELETE FROM entries")
+
+    def stats(self):
+        out = super().stats()
+        db = self._db()
+        out.update(entri=db.execute("SELECT COUNT(*) FROM entries").fetchone()[0], byte=self._size(db))
+        return out
+
+
+class TieredBackend(_Backend):
+    """LRU memori (``front``) di depan backend bersama (``back``)."""
+
+    def __init__(self, front, back):
+        super().__init__()
+        self.front = front
+        self.back = back
+        self.name = f"{front.name}+{back.name}"
+
+    def get(self, key):
+        value = self.front.get(key)
+        if value is None:
+            entry = self.back.get_entry(key)
+            if entry is not None:
+                value, expires = entry
+                # Salinan memori kedaluwarsa bersamaan dengan entri SQLite-nya
+                remaining = None if expires is None else expires - time.time()
+                if remaining is None or remaining > 0:
+                    self.front.set(key, value, remaining)
+        self._count("miss" if value is None else "hit")
+        return value
+
+    def accepts(self, size):
+        return self.front.accepts(size) or self.back.accepts(size)
+
+    def set(self, key, value, ttl=None):
+        self.front.set(key, value, ttl)
+        stored = self.back.set(key, value, ttl)
+        self._count("simpan" if stored else "dilewati")
+        return stored
+
+    def clear(self):
+        self.front.clear()
+        self.back.clear()
+
+    def stats(self):
+        out = super().stats()
+        back = self.back.stats()
+        out.update(entri=back["entri"], byte=back["byte"])
+        return out
+
+
+def _array_bytes(value):
+    # Batas bawah ukuran terserialisasi: total byte array NumPy di dalam
+    # ``value`` (tuple/list/dict/dataclass); objek lain dihitung 0
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(_array_bytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(_array_bytes(item) for item in value.values())
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return sum(_array_bytes(getattr(value, field.name)) for field in dataclasses.fields(value))
+    return 0
+
+
+class SharedCache:
+    """Memo ``compute()`` di sebuah backend dengan kunci kanonik ``(versi, namespace, args)``."""
+
+    def __init__(self, backend, ttl=DEFAULT_TTL, version=""):
+        self.backend = backend
+        self.ttl = ttl
+        self.version = version
+        self.stats = CacheStats()
+
+    def get_or_compute(self, namespace, args, compute, encode=pickle.dumps, decode=pickle.loads):
+        """Ambil hasil dari backend, atau hitung dengan ``compute()`` lalu simpan."""
+        key = canonical_key(self.version, namespace, args)
+        self.stats.record_call(namespace)
+        data = self.backend.get(key)
+        if data is not None:
+            try:
+                return decode(data)
+            except (ValueError, EOFError, pickle.UnpicklingError) as exc:
+                logger.warning("Entri cache %s rusak, dihitung ulang: %s", namespace, exc)
+        self.stats.record_miss(namespace)
+        value = compute()
+        # Hasil yang pasti ditolak backend (mis. grid sweep raksasa) tidak di-encode
+        if self.backend.accepts(_array_bytes(value)):
+            self.backend.set(key, encode(value), self.ttl)
+        else:
+            self.backend.skip()
+        return value
+
+
+def from_env(environ=os.environ):
+    """:class:`SharedCache` sesuai ``DCLISTRIK_CACHE`` (``None`` bila ``off``, bawaan)."""
+    spec = environ.get("DCLISTRIK_CACHE", "off")
+    ttl = float(environ.get("DCLISTRIK_CACHE_TTL", DEFAULT_TTL))
+    max_bytes = int(float(environ.get("DCLISTRIK_CACHE_MAX_MB", DEFAULT_MAX_BYTES / 2**20)) * 2**20)
+    if spec in ("off", "0", ""):
+        return None
+    if spec.startswith("sqlite:"):
+        backend = TieredBackend(MemoryBackend(max_bytes=min(max_bytes, 64 * 2**20)),
+                                SQLiteBackend(spec[len("sqlite:"):], max_bytes=max_bytes))
+    else:
+        raise ValueError(f"DCLISTRIK_CACHE tidak dikenal: {spec!r} (sqlite:<path> atau off)")
+    return SharedCache(backend, ttl=ttl, version=source_version())
@@ -0,0 +1,129 @@
+"""Rumus-rumus listrik DC dalam bentuk tervektorisasi.
+
+Semua fungsi menerima skalar atau array NumPy (di-broadcast) dan
+mengembalikan array. Masukan skalar menghasilkan skalar ``np.float64``
+sehingga jalur UI dan jalur batch memakai kode yang sama persis.
+"""
+
+import re
+
+import numpy as np
+
+from dclistrik import units
+
+
+def _result(x):
+    # Array 0-dimensi dikembalikan sebagai skalar
+    return x[()] if isinstance(x, np.ndarray) and x.ndim == 0 else x
+
+
+def safe_divide(num, den):
+    """Hitung ``num / den`` dengan hasil 0 di mana ``den == 0``."""
+    num = np.asarray(num, dtype=float)
+    den = np.asarray(den, dtype=float)
+    out = np.zeros(np.broadcast_shapes(num.shape, den.shape))
+    np.divide(num, den, out=out, where=den != 0)
+    return _result(out)
+
+
+# Hukum Ohm
+def ohm_voltage(I, R):
+    """V = I × R"""
+    return _result(np.multiply(I, R, dtype=float))
+
+
+def ohm_current(V, R):
+    """I = V / R (0 jika R = 0)"""
+    return safe_divide(V, R)
+
+
+def ohm_resistance(V, I):
+    """R = V / I (0 jika I = 0)"""
+    return safe_divide(V, I)
+
+
+# Hambatan Seri-Paralel
+def series_resistance(resistors, axis=-1):
+    """R_total = R1 + R2 + ... sepanjang ``axis``."""
+    return _result(np.sum(np.asarray(resistors, dtype=float), axis=axis))
+
+
+def parallel_conductance(resistors, axis=-1):
+    """1/R_total = 1/R1 + 1/R2 + ... (hambatan bernilai 0 dilewati)."""
+    return _result(np.sum(safe_divide(1.0, resistors), axis=axis))
+
+
+def parallel_resistance(resistors, axis=-1):
+    """R_total susunan paralel (0 jika tidak ada hambatan bukan nol)."""
+    return safe_divide(1.0, parallel_conductance(resistors, axis=axis))
+
+
+# Daya Listrik
+def power_vi(V, I):
+    """P = V × I"""
+    return _result(np.multiply(V, I, dtype=float))
+
+
+def power_i2r(I, R):
+    """P = I² × R"""
+    I = np.asarray(I, dtype=float)
+    return _result(I**2 * R)
+
+
+def power_v2r(V, R):
+    """P = V² / R (0 jika R = 0)"""
+    V = np.asarray(V, dtype=float)
+    return safe_divide(V**2, R)
+
+
+# Energi Listrik (t dalam jam)
+def energy_joule(P, t_hours):
+    """W = P × t dalam Joule."""
+    return _result(np.multiply(P, t_hours, dtype=float) * 3600)
+
+
+def energy_kwh(P, t_hours):
+    """W = P × t dalam kWh."""
+    return _result(np.multiply(P, t_hours, dtype=float) / 1000)
+
+
+# GGL & Tegangan Jepit
+def emf(V, I, r):
+    """ε = V + I×r"""
+    return _result(np.add(V, np.multiply(I, r, dtype=float)))
+
+
+def terminal_voltage(epsilon, I, r):
+    """V = ε - I×r"""
+    return _result(np.subtract(epsilon, np.multiply(I, r, dtype=float)))
+
+
+def internal_resistance(epsilon, V, I):
+    """r = (ε - V) / I (0 jika I = 0)"""
+    return safe_divide(np.subtract(epsilon, V, dtype=float), I)
+
+
+def series_parallel_curve(resistors, factors):
+    """Kurva perbandingan seri vs paralel untuk setiap faktor pengali.
+
+    Setiap hambatan diskalakan dengan ``factor / 10``. Karena penskalaan
+    linear, R_total seri dan paralel cukup dihitung sekali lalu
+    di-broadcast ke seluruh ``factors`` (O(N + M), bukan O(N × M)).
+    Hambatan bernilai 0 dilewati pada susunan paralel, sama seperti
+    :func:`parallel_resistance`.
+    """
+    resistors = np.asarray(resistors, dtype=float)
+    scale = np.asarray(factors, dtype=float) / 10
+    seri = scale * series_resistance(resistors)
+    paralel = scale * parallel_resistance(resistors)
+    return seri, paralel
+
+
+def parse_resistor_values(text):
+    """Baca daftar hambatan dari teks (dipisah koma, titik koma atau spasi).
+
+    Nilai boleh berakhiran awalan atau satuan SI (``4.7k``, ``1MΩ``);
+    hasilnya dalam Ohm.
+    """
+    tokens = [tok for tok in re.split(r"[,;\s]+", text.strip()) if tok]
+    return units.parse_values(tokens, "Ω")
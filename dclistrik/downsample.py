@@ -0,0 +1,70 @@
+"""Perampingan (downsampling) kurva besar sebelum dikirim ke browser.
+
+Kedua metode mengasumsikan ``x`` terurut naik, seperti hasil sweep
+``np.linspace``/``np.geomspace``.
+"""
+
+import numpy as np
+
+
+def minmax(x, y, n_out):
+    """Ambil titik minimum dan maksimum ``y`` di setiap ember.
+
+    Menghasilkan paling banyak ``n_out`` titik dan mempertahankan puncak
+    serta lembah kurva. Seluruhnya tervektorisasi (tanpa loop Python).
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    n_bins = max(n_out // 2, 1)
+    if n <= n_out:
+        return x, y
+
+    size = -(-n // n_bins)  # pembagian ke atas
+    padded = np.full(n_bins * size, np.nan)
+    padded[:n] = y
+    buckets = padded.reshape(n_bins, size)
+    # Ember kosong di ujung (hanya NaN) dibuang
+    valid = ~np.all(np.isnan(buckets), axis=1)
+    buckets = buckets[valid]
+    offsets = np.flatnonzero(valid) * size
+
+    filled = np.where(np.isnan(buckets), np.inf, buckets)
+    lo = offsets + np.argmin(filled, axis=1)
+    filled = np.where(np.isnan(buckets), -np.inf, buckets)
+    hi = offsets + np.argmax(filled, axis=1)
+
+    index = np.unique(np.concatenate([lo, hi, [0, n - 1]]))
+    return x[index], y[index]
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: ``n_out`` titik yang paling mewakili bentuk kurva."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    index = np.empty(n_out, dtype=np.int64)
+    index[0], index[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        # Rata-rata ember berikutnya sebagai titik ketiga segitiga
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[stop:next_stop].mean()
+        avg_y = y[stop:next_stop].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:stop] - y[a])
+                      - (x[a] - x[start:stop]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        index[i + 1] = a
+    return x[index], y[index]
+
+
+METHODS = {"minmax": minmax, "lttb": lttb}
+
+
+def downsample(x, y, n_out, method="minmax"):
+    return METHODS[method](x, y, n_out)
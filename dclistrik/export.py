@@ -0,0 +1,167 @@
+"""Ekspor grafik kalkulator ke PNG/SVG dengan matplotlib (backend Agg).
+
+Untuk handout cetak, serialisasi JSON Plotly terlalu berat. Modul ini
+menyimpan satu figure matplotlib per jenis grafik (per thread) dan hanya
+mengganti data garis setiap kali dipanggil, tanpa membuat figure baru.
+
+    from dclistrik import export
+    png = export.render("ohm_voltage", 1.0, 10.0)
+    export.save("emf", "ggl.svg", 12.0, 1.0)
+"""
+
+import io
+import os
+import threading
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from dclistrik import figures
+from dclistrik.downsample import downsample
+
+LINE = dict(linewidth=3)
+MARKER = dict(linestyle='none', marker='o', markersize=8, color='#ff6b6b')
+
+
+def _ohm_voltage(I, R):
+    I_range, V_range, V = figures.ohm_voltage_data(I, R)
+    return [(I_range, V_range, f'R = {R}Ω'), ([I], [V], 'Titik Aktual')]
+
+
+def _ohm_current(V, R, *sweep):
+    R_range, I_range, I = figures.ohm_current_data(V, R, *sweep)
+    return [(R_range, I_range, f'V = {V}V'), ([R], [I], 'Titik Aktual')]
+
+
+def _series_parallel(resistors, num_points=50):
+    test_values, seri_values, paralel_values = figures.series_parallel_data(resistors, num_points)
+    return [(test_values, seri_values, 'Susunan Seri'), (test_values, paralel_values, 'Susunan Paralel')]
+
+
+def _power(P):
+    time_range, power_constant = figures.power_data(P)
+    return [(time_range, power_constant, 'Daya Konstan')]
+
+
+def _energy(P, t):
+    time_range, energy_range, W_joule = figures.energy_data(P, t)
+    return [(time_range, energy_range, f'P = {P} W'), ([t], [W_joule], 'Titik Aktual')]
+
+
+def _emf(epsilon, r):
+    I_range, V_jepit_range, epsilon_line = figures.emf_data(epsilon, r)
+    return [(I_range, V_jepit_range, 'Tegangan Jepit'), (I_range, epsilon_line, 'GGL')]
+
+
+# grafik: (judul, label x, label y, gaya tiap garis, fungsi data)
+CHARTS = {
+    "ohm_voltage": ('Grafik Tegangan vs Arus (Hukum Ohm)', 'Arus (A)', 'Tegangan (V)',
+                    [dict(LINE, color='#667eea'), MARKER], _ohm_voltage),
+    "ohm_current": ('Grafik Arus vs Hambatan', 'Hambatan (Ω)', 'Arus (A)',
+                    [dict(LINE, color='#4ecdc4'), MARKER], _ohm_current),
+    "series_parallel": ('Perbandingan Hambatan Seri vs Paralel', 'Faktor Pengali', 'Hambatan Total (Ω)',
+                        [dict(LINE, color='#667eea'), dict(LINE, color='#4ecdc4')], _series_parallel),
+    "power": ('Grafik Daya vs Waktu', 'Waktu (s)', 'Daya (W)',
+              [dict(LINE, color='#ff6b6b')], _power),
+    "energy": ('Grafik Energi vs Waktu', 'Waktu (jam)', 'Energi (Joule)',
+               [dict(LINE, color='#45b7d1'), MARKER], _energy),
+    "emf": ('Grafik GGL vs Tegangan Jepit', 'Arus (A)', 'Tegangan (V)',
+            [dict(LINE, color='#4ecdc4'), dict(color='#ff6b6b', linewidth=2, linestyle='--')], _emf),
+}
+
+# Skala sumbu x per grafik dari argumennya (bawaan linear), mis. sweep log
+XSCALES = {
+    "ohm_current": lambda V, R, r_min=1, r_max=50, num_points=100, log=False: "log" if log else "linear",
+}
+
+
+class FigurePool:
+    """Kumpulan figure siap pakai, satu per jenis grafik.
+
+    Tidak thread-safe; gunakan satu pool per thread (lihat :func:`render`).
+    """
+
+    def __init__(self, figsize=(6.4, 4.0), dpi=100):
+        self.figsize = figsize
+        self.dpi = dpi
+        self._entries = {}
+
+    def _entry(self, chart):
+        if chart not in self._entries:
+            title, xlabel, ylabel, styles, _ = CHARTS[chart]
+            fig = Figure(figsize=self.figsize, dpi=self.dpi)
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot()
+            ax.set_title(title, color='#2d3748')
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+            ax.set_facecolor((248 / 255, 249 / 255, 1.0, 0.8))
+            ax.grid(True, color=(135 / 255, 206 / 255, 235 / 255, 0.3))
+            lines = [ax.plot([], [], label=' ', **style)[0] for style in styles]
+            legend = ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.15), ncol=len(lines), frameon=False)
+            # Tata letak dihitung sekali; tanpa layout engine savefig
+            # tidak perlu menggambar ulang dua kali
+            fig.tight_layout()
+            fig.set_layout_engine('none')
+            self._entries[chart] = (fig, ax, lines, legend)
+        return self._entries[chart]
+
+    def draw(self, chart, *args):
+        """Perbarui data garis grafik ``chart`` dan kembalikan figure-nya."""
+        fig, ax, lines, legend = self._entry(chart)
+        series = CHARTS[chart][4](*args)
+        width_px = int(self.figsize[0] * self.dpi)
+        for line, text, (x, y, label) in zip(lines, legend.get_texts(), series):
+            if len(x) > figures.WEBGL_THRESHOLD:
+                x, y = downsample(x, y, 2 * width_px)
+            line.set_data(x, y)
+            line.set_label(label)
+            text.set_text(label)
+        # Sumbu milik pool dipakai ulang: skala ditetapkan setiap kali agar
+        # ekspor linear setelah ekspor log kembali linear
+        scale = XSCALES[chart](*args) if chart in XSCALES else "linear"
+        if ax.get_xscale() != scale:
+            ax.set_xscale(scale)
+        ax.relim()
+        ax.autoscale_view()
+        return fig
+
+    def render(self, chart, *args, fmt="png"):
+        """Render grafik ke bytes (``fmt`` = ``"png"`` atau ``"svg"``)."""
+        buffer = io.BytesIO()
+        self.draw(chart, *args).savefig(buffer, format=fmt)
+        return buffer.getvalue()
+
+    def save(self, chart, path, *args, fmt=None):
+        """Simpan grafik ke ``path``; format diambil dari ekstensi file."""
+        fmt = fmt or os.path.splitext(path)[1].lstrip(".").lower() or "png"
+        self.draw(chart, *args).savefig(path, format=fmt)
+
+
+_local = threading.local()
+
+
+def get_pool():
+    """Pool milik thread saat ini (dibuat saat pertama dipakai)."""
+    if not hasattr(_local, "pool"):
+        _local.pool = FigurePool()
+    return _local.pool
+
+
+def render(chart, *args, fmt="png"):
+    return get_pool().render(chart, *args, fmt=fmt)
+
+
+def save(chart, path, *args, fmt=None):
+    get_pool().save(chart, path, *args, fmt=fmt)
+
+
+def export_many(jobs, out_dir, fmt="png"):
+    """Ekspor banyak grafik: ``jobs`` berisi ``(nama_file, grafik, args)``."""
+    os.makedirs(out_dir, exist_ok=True)
+    pool = get_pool()
+    count = 0
+    for name, chart, args in jobs:
+        pool.save(chart, os.path.join(out_dir, f"{name}.{fmt}"), *args, fmt=fmt)
+        count += 1
+    return count
@@ -0,0 +1,424 @@
+"""Pembangun grafik Plotly untuk setiap kalkulator (tanpa Streamlit).
+
+Setiap fungsi hanya bergantung pada argumennya sehingga aman di-memoize
+oleh lapisan UI (lihat ``app.py``).
+"""
+
+import html
+import json
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from dclistrik import core
+from dclistrik.downsample import downsample
+from dclistrik.profiling import PROFILER
+
+# Template gaya dibuat sekali per proses
+GRAPH_LAYOUT = dict(
+    plot_bgcolor='rgba(248, 249, 255, 0.8)',
+    paper_bgcolor='rgba(255, 255, 255, 0.9)',
+    font=dict(color='#2d3748'),
+    showlegend=True,
+    legend=dict(
+        bgcolor='rgba(255, 255, 255, 0.8)',
+        bordercolor='#e2e8f0',
+        borderwidth=1
+    ),
+    margin=dict(t=60, l=60, r=30, b=60)
+)
+GRAPH_AXIS = dict(
+    showgrid=True,
+    gridwidth=1,
+    gridcolor='rgba(135, 206, 235, 0.3)',
+    showline=True,
+    linewidth=2,
+    linecolor='#cbd5e0'
+)
+
+# Template terdaftar berisi gaya di atas, di atas template bawaan "plotly"
+TEMPLATE = "dclistrik"
+_template = go.layout.Template(pio.templates["plotly"])
+_template.layout.update(GRAPH_LAYOUT, xaxis=GRAPH_AXIS, yaxis=GRAPH_AXIS)
+pio.templates[TEMPLATE] = _template
+
+
+# Di atas ambang ini trace diganti WebGL dan dirampingkan ke lebar piksel
+WEBGL_THRESHOLD = 5000
+PLOT_WIDTH_PX = 1000
+
+
+def _adapt_spec(spec, width_px, method):
+    # Trace scatter besar (dict) menjadi scattergl dengan data yang dirampingkan
+    # (2 titik per piksel) agar payload JSON tetap di bawah ~100 KB
+    if spec.get('type', 'scatter') != 'scatter' or spec.get('x') is None or len(spec['x']) <= WEBGL_THRESHOLD:
+        return spec
+    x, y = downsample(np.asarray(spec['x']), np.asarray(spec['y']), 2 * width_px, method)
+    # float32 cukup untuk resolusi layar dan memperkecil payload separuhnya
+    return dict(spec, type='scattergl', x=x.astype(np.float32), y=y.astype(np.float32))
+
+
+def _adapt_traces(fig, width_px, method):
+    if not any(tr.type == 'scatter' and tr.x is not None and len(tr.x) > WEBGL_THRESHOLD
+               for tr in fig.data):
+        return fig
+    traces = []
+    for tr in fig.data:
+        spec = _adapt_spec(tr.to_plotly_json(), width_px, method)
+        if spec['type'] == 'scattergl':
+            spec.pop('type')
+            tr = go.Scattergl(spec)
+        traces.append(tr)
+    return go.Figure(data=traces, layout=fig.layout)
+
+
+# Fungsi untuk membuat grafik dengan style konsisten
+def create_plotly_graph(fig, title, adaptive=True, width_px=PLOT_WIDTH_PX, method="minmax"):
+    with PROFILER.phase("tata_letak"):
+        fig.update_layout(template=TEMPLATE, title=dict(text=title, x=0.5, font=dict(size=16, color='#2d3748')),
+                          **GRAPH_LAYOUT)
+        fig.update_xaxes(**GRAPH_AXIS)
+        fig.update_yaxes(**GRAPH_AXIS)
+        if adaptive:
+            fig = _adapt_traces(fig, width_px, method)
+    return fig
+
+
+# Kerangka figure per kalkulator: dibangun dan divalidasi sekali per proses
+# lewat jalur go.Figure biasa, lalu disimpan sebagai dict. Setiap panggilan
+# hanya menukar data trace dan membuat Figure tanpa validasi ulang.
+_SKELETONS = {}
+
+
+def _merge(base, patch):
+    # Salinan ``base`` dengan ``patch`` ditimpakan (dict bersarang ikut digabung)
+    out = dict(base)
+    for key, value in patch.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            value = _merge(base[key], value)
+        out[key] = value
+    return out
+
+
+def from_skeleton(name, traces, layout=None, adaptive=True, width_px=PLOT_WIDTH_PX, method="minmax"):
+    """Figure dari kerangka ``name`` dengan ``traces[i]`` ditimpakan ke trace ke-i.
+
+    ``traces`` berisi dict seperti ``{'x': ..., 'y': ..., 'name': ...}``
+    dan ``layout`` dict opsional (mis. judul sumbu). Nilai yang ditukar
+    dianggap sudah valid, sehingga validator Plotly dilewati.
+    """
+    with PROFILER.phase("tata_letak"):
+        skeleton = _SKELETONS.get(name)
+        if skeleton is None:
+            skeleton = _SKELETONS[name] = _SKELETON_BUILDERS[name]().to_dict()
+        data = [_merge(base, patch) for base, patch in zip(skeleton['data'], traces)]
+        if adaptive:
+            data = [_adapt_spec(spec, width_px, method) for spec in data]
+        return go.Figure(data=data, layout=_merge(skeleton['layout'], layout or {}), _validate=False)
+
+
+# JSON Plotly untuk cache lintas proses (lihat dclistrik/cache.py)
+def figure_to_json(fig):
+    return pio.to_json(fig, validate=False).encode()
+
+
+def figure_from_json(data):
+    # JSON berasal dari figure yang sudah tervalidasi, jadi validator dilewati
+    spec = json.loads(data)
+    return go.Figure(data=spec.get('data', []), layout=spec.get('layout', {}), _validate=False)
+
+
+# Data kurva tiap grafik, dipakai bersama oleh Plotly dan ekspor gambar
+def ohm_voltage_data(I, R):
+    I_range = np.linspace(0.1, 5, 100)
+    return I_range, core.ohm_voltage(I_range, R), core.ohm_voltage(I, R)
+
+
+def ohm_current_data(V, R, r_min=1, r_max=50, num_points=100, log=False):
+    sweep = np.geomspace if log else np.linspace
+    R_range = sweep(r_min, r_max, int(num_points))
+    return R_range, core.ohm_current(V, R_range), core.ohm_current(V, R)
+
+
+def power_data(P):
+    time_range = np.linspace(0, 10, 100)
+    return time_range, np.full_like(time_range, P)
+
+
+def energy_data(P, t):
+    time_range = np.linspace(0, 10, 100)
+    return time_range, core.energy_joule(P, time_range), core.energy_joule(P, t)
+
+
+def emf_data(epsilon, r):
+    I_range = np.linspace(0.1, 5, 100)
+    return I_range, core.terminal_voltage(epsilon, I_range, r), np.full_like(I_range, epsilon)
+
+
+def series_parallel_data(resistors, num_points=50):
+    test_values = np.linspace(1, 20, int(num_points))
+    return (test_values, *core.series_parallel_curve(resistors, test_values))
+
+
+def _build_ohm_voltage(I, R):
+    I_range, V_range, V = ohm_voltage_data(I, R)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=I_range, y=V_range, mode='lines',
+                             name=f'R = {R}Ω', line=dict(color='#667eea', width=3)))
+    fig.add_trace(go.Scatter(x=[I], y=[V], mode='markers',
+                             name='Titik Aktual', marker=dict(color='#ff6b6b', size=10)))
+
+    fig.update_xaxes(title='Arus (A)')
+    fig.update_yaxes(title='Tegangan (V)')
+    return create_plotly_graph(fig, 'Grafik Tegangan vs Arus (Hukum Ohm)')
+
+
+def _build_ohm_current(V, R, r_min=1, r_max=50, num_points=100, log=False):
+    R_range, I_range, I = ohm_current_data(V, R, r_min, r_max, num_points, log)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=R_range, y=I_range, mode='lines',
+                             name=f'V = {V}V', line=dict(color='#4ecdc4', width=3)))
+    fig.add_trace(go.Scatter(x=[R], y=[I], mode='markers',
+                             name='Titik Aktual', marker=dict(color='#ff6b6b', size=10)))
+
+    fig.update_xaxes(title='Hambatan (Ω)', type='log' if log else 'linear')
+    fig.update_yaxes(title='Arus (A)')
+    return create_plotly_graph(fig, 'Grafik Arus vs Hambatan')
+
+
+def _build_series_parallel(resistors, num_points=50):
+    test_values, seri_values, paralel_values = series_parallel_data(resistors, num_points)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=test_values, y=seri_values, mode='lines',
+                             name='Susunan Seri', line=dict(color='#667eea', width=3)))
+    fig.add_trace(go.Scatter(x=test_values, y=paralel_values, mode='lines',
+                             name='Susunan Paralel', line=dict(color='#4ecdc4', width=3)))
+
+    fig.update_xaxes(title='Faktor Pengali')
+    fig.update_yaxes(title='Hambatan Total (Ω)')
+    return create_plotly_graph(fig, 'Perbandingan Hambatan Seri vs Paralel')
+
+
+def _build_power(P):
+    time_range, power_constant = power_data(P)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=time_range, y=power_constant, mode='lines',
+                             name='Daya Konstan', line=dict(color='#ff6b6b', width=3)))
+
+    fig.update_xaxes(title='Waktu (s)')
+    fig.update_yaxes(title='Daya (W)')
+    return create_plotly_graph(fig, 'Grafik Daya vs Waktu')
+
+
+def _build_energy(P, t):
+    time_range, energy_range, W_joule = energy_data(P, t)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=time_range, y=energy_range, mode='lines',
+                             name=f'P = {P} W', line=dict(color='#45b7d1', width=3)))
+    fig.add_trace(go.Scatter(x=[t], y=[W_joule], mode='markers',
+                             name='Titik Aktual', marker=dict(color='#ff6b6b', size=10)))
+
+    fig.update_xaxes(title='Waktu (jam)')
+    fig.update_yaxes(title='Energi (Joule)')
+    return create_plotly_graph(fig, 'Grafik Energi vs Waktu')
+
+
+def _build_emf(epsilon, r):
+    I_range, V_jepit_range, epsilon_line = emf_data(epsilon, r)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=I_range, y=V_jepit_range, mode='lines',
+                             name='Tegangan Jepit', line=dict(color='#4ecdc4', width=3)))
+    fig.add_trace(go.Scatter(x=I_range, y=epsilon_line, mode='lines',
+                             name='GGL', line=dict(color='#ff6b6b', width=2, dash='dash')))
+
+    fig.update_xaxes(title='Arus (A)')
+    fig.update_yaxes(title='Tegangan (V)')
+    return create_plotly_graph(fig, 'Grafik GGL vs Tegangan Jepit')
+
+
+def branch_current_figure(branch_names, branch_currents):
+    """Diagram batang arus tiap cabang hasil penyelesai netlist."""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=list(branch_names), y=branch_currents, name='Arus',
+                         marker=dict(color='#667eea')))
+    fig.update_xaxes(title='Elemen')
+    fig.update_yaxes(title='Arus (A)')
+    return create_plotly_graph(fig, 'Arus Tiap Cabang')
+
+
+def _build_power_transfer(epsilon, r, num_points=200):
+    from dclistrik import optimize
+
+    R_range = np.linspace(0, 10 * max(r, 0.1), int(num_points))
+    power = optimize.load_power(epsilon, r, R_range)
+    eta = optimize.efficiency(r, R_range) * 100
+    R_opt, P_max = optimize.max_power_transfer(epsilon, r)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=R_range, y=power, mode='lines',
+                             name='Daya Beban', line=dict(color='#667eea', width=3)))
+    fig.add_trace(go.Scatter(x=R_range, y=eta, mode='lines', yaxis='y2',
+                             name='Efisiensi (%)', line=dict(color='#4ecdc4', width=2, dash='dash')))
+    fig.add_trace(go.Scatter(x=[R_opt], y=[P_max], mode='markers',
+                             name='Daya Maksimum (R = r)', marker=dict(color='#ff6b6b', size=10)))
+
+    fig.update_xaxes(title='Hambatan Beban R (Ω)')
+    fig.update_yaxes(title='Daya (W)')
+    fig.update_layout(yaxis2=dict(title='Efisiensi (%)', overlaying='y', side='right', range=[0, 100]))
+    return create_plotly_graph(fig, 'Transfer Daya Maksimum')
+
+
+def _build_simulation(t_hours, left, right):
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(x=t_hours, y=left[0], mode='lines',
+                               name=left[1], line=dict(color=left[2], width=2)))
+    fig.add_trace(go.Scattergl(x=t_hours, y=right[0], mode='lines', yaxis='y2',
+                               name=right[1], line=dict(color=right[2], width=2, dash='dash')))
+    fig.update_xaxes(title='Waktu (jam)')
+    fig.update_yaxes(title=left[1])
+    fig.update_layout(yaxis2=dict(title=right[1], overlaying='y', side='right'))
+    return create_plotly_graph(fig, 'Simulasi Domain Waktu', adaptive=False)
+
+
+# Figure per kalkulator dari kerangka (hanya data yang ditukar)
+def ohm_voltage_figure(I, R):
+    """Grafik V vs I untuk R tetap, dengan titik aktual (I, V)."""
+    I_range, V_range, V = ohm_voltage_data(I, R)
+    return from_skeleton('ohm_voltage', [dict(x=I_range, y=V_range, name=f'R = {R}Ω'), dict(x=[I], y=[V])])
+
+
+def ohm_current_figure(V, R, r_min=1, r_max=50, num_points=100, log=False):
+    """Grafik I vs R untuk V tetap, dengan titik aktual (R, I)."""
+    R_range, I_range, I = ohm_current_data(V, R, r_min, r_max, num_points, log)
+    return from_skeleton('ohm_current', [dict(x=R_range, y=I_range, name=f'V = {V}V'), dict(x=[R], y=[I])],
+                         layout={'xaxis': {'type': 'log' if log else 'linear'}})
+
+
+def series_parallel_figure(resistors, num_points=50):
+    """Grafik perbandingan R_total seri vs paralel terhadap faktor pengali."""
+    test_values, seri_values, paralel_values = series_parallel_data(resistors, num_points)
+    return from_skeleton('series_parallel', [dict(x=test_values, y=seri_values), dict(x=test_values, y=paralel_values)])
+
+
+def power_figure(P):
+    """Grafik daya konstan terhadap waktu."""
+    time_range, power_constant = power_data(P)
+    return from_skeleton('power', [dict(x=time_range, y=power_constant)])
+
+
+def energy_figure(P, t):
+    """Grafik energi vs waktu (jam) dengan titik aktual (t, W)."""
+    time_range, energy_range, W_joule = energy_data(P, t)
+    return from_skeleton('energy', [dict(x=time_range, y=energy_range, name=f'P = {P} W'), dict(x=[t], y=[W_joule])])
+
+
+def emf_figure(epsilon, r):
+    """Grafik tegangan jepit dan GGL terhadap arus."""
+    I_range, V_jepit_range, epsilon_line = emf_data(epsilon, r)
+    return from_skeleton('emf', [dict(x=I_range, y=V_jepit_range), dict(x=I_range, y=epsilon_line)])
+
+
+def power_transfer_figure(epsilon, r, num_points=200):
+    """Daya beban dan efisiensi terhadap R, dengan titik daya maksimum R = r."""
+    from dclistrik import optimize
+
+    R_range = np.linspace(0, 10 * max(r, 0.1), int(num_points))
+    R_opt, P_max = optimize.max_power_transfer(epsilon, r)
+    return from_skeleton('power_transfer', [
+        dict(x=R_range, y=optimize.load_power(epsilon, r, R_range)),
+        dict(x=R_range, y=optimize.efficiency(r, R_range) * 100),
+        dict(x=[R_opt], y=[P_max]),
+    ])
+
+
+def simulation_figure(t_hours, left, right):
+    """Jejak simulasi terhadap waktu; ``left``/``right`` = ``(y, nama, warna)`` sumbu kiri/kanan."""
+    return from_skeleton('simulation', [
+        dict(x=t_hours, y=left[0], name=left[1], line={'color': left[2]}),
+        dict(x=t_hours, y=right[0], name=right[1], line={'color': right[2]}),
+    ], layout={'yaxis': {'title': {'text': left[1]}}, 'yaxis2': {'title': {'text': right[1]}}}, adaptive=False)
+
+
+# Pembangun kerangka: figure lengkap tervalidasi dengan data contoh
+_SKELETON_BUILDERS = {
+    'ohm_voltage': lambda: _build_ohm_voltage(1.0, 1.0),
+    'ohm_current': lambda: _build_ohm_current(1.0, 1.0),
+    'series_parallel': lambda: _build_series_parallel(np.ones(2)),
+    'power': lambda: _build_power(1.0),
+    'energy': lambda: _build_energy(1.0, 1.0),
+    'emf': lambda: _build_emf(1.0, 1.0),
+    'power_transfer': lambda: _build_power_transfer(1.0, 1.0),
+    'simulation': lambda: _build_simulation(np.zeros(1), (np.zeros(1), 'y', '#667eea'), (np.zeros(1), 'y2', '#ff6b6b')),
+}
+
+
+def sweep_figure(x, y, z, xlabel, ylabel, zlabel, kind="heatmap"):
+    """Heatmap atau kontur hasil sweep dua dimensi (``z[i, j]`` di ``(x[j], y[i])``)."""
+    trace = go.Contour if kind == "contour" else go.Heatmap
+    fig = go.Figure()
+    fig.add_trace(trace(x=x, y=y, z=z, colorscale='Viridis',
+                        colorbar=dict(title=dict(text=zlabel))))
+    fig.update_xaxes(title=xlabel)
+    fig.update_yaxes(title=ylabel)
+    return create_plotly_graph(fig, f'Sweep {zlabel}')
+
+
+def tolerance_figure(centers, counts, label, percentiles):
+    """Histogram Monte Carlo dengan garis persentil ``{q: nilai}``."""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=centers, y=counts, name='Sampel',
+                         marker=dict(color='#667eea'), showlegend=False))
+    for q, value in percentiles.items():
+        fig.add_vline(x=value, line=dict(color='#ff6b6b' if q == 50 else '#4ecdc4', dash='dash'),
+                      annotation_text=f'P{q}')
+    fig.update_xaxes(title=label)
+    fig.update_yaxes(title='Jumlah Sampel')
+    fig.update_layout(bargap=0)
+    return create_plotly_graph(fig, f'Distribusi {label}', adaptive=False)
+
+
+def dc_ac_figure():
+    """Kurva gelombang DC vs AC (statis, tidak bergantung input)."""
+    from plotly.subplots import make_subplots
+
+    t = np.linspace(0, 4*np.pi, 400)
+    dc_wave = np.ones_like(t) * 5
+    ac_wave = 5 * np.sin(t)
+
+    fig = make_subplots(rows=2, cols=1,
+                        subplot_titles=('Arus Searah (DC)', 'Arus Bolak-balik (AC)'),
+                        vertical_spacing=0.1)
+
+    fig.add_trace(go.Scatter(x=t, y=dc_wave, mode='lines', name='DC',
+                             line=dict(color='#667eea', width=3)), row=1, col=1)
+    fig.add_trace(go.Scatter(x=t, y=ac_wave, mode='lines', name='AC',
+                             line=dict(color='#4ecdc4', width=3)), row=2, col=1)
+
+    fig.update_xaxes(title_text="Waktu", row=2, col=1)
+    fig.update_yaxes(title_text="Tegangan (V)")
+
+    return create_plotly_graph(fig, 'Kurva Gelombang DC vs AC')
+
+
+# Tabel perbandingan DC vs AC
+COMPARISON_DATA = {
+    'Aspek': ['Arah Arus', 'Bentuk Gelombang', 'Frekuensi', 'Sumber', 'Kegunaan'],
+    'DC': ['Satu arah', 'Konstan', '0 Hz', 'Baterai, Aki', 'Elektronik'],
+    'AC': ['Bolak-balik', 'Sinusoidal', '50/60 Hz', 'PLN, Generator', 'Rumah tangga']
+}
+
+
+def comparison_table_html(data=COMPARISON_DATA):
+    """Tabel perbandingan sebagai HTML statis di dalam ``.comparison-table``."""
+    columns = list(data)
+    head = "".join(f"<th>{html.escape(c)}</th>" for c in columns)
+    body = "".join("<tr>" + "".join(f"<td>{html.escape(v)}</td>" for v in row) + "</tr>"
+                   for row in zip(*data.values()))
+    return f'<div class="comparison-table"><table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table></div>'
@@ -0,0 +1,293 @@
+"""Ekspresi jaringan hambatan seri/paralel bersarang, misalnya ``R1 + (R2 || (R3 + R4))``.
+
+``+`` berarti seri dan ``||`` paralel; ``||`` mengikat lebih kuat daripada
+``+`` (seperti perkalian terhadap penjumlahan). Operand berupa nama
+hambatan atau angka Ohm yang boleh berawalan SI, dibaca dengan
+:func:`dclistrik.units.parse_quantity` (``4.7k``, ``4k7``, ``2.2MΩ``).
+
+Ekspresi diurai tanpa rekursi menjadi DAG: operator sejenis yang
+berderet digabung menjadi satu node n-ary, dan subekspresi identik
+(tanpa memandang urutan operand) hanya disimpan sekali. Nilai setiap
+node disimpan; :meth:`Network.set` hanya menghitung ulang leluhur dari
+hambatan yang berubah, dalam urutan topologis. Semantik hambatan 0 pada
+paralel sama dengan :func:`dclistrik.core.parallel_resistance`
+(dilewati).
+"""
+
+import heapq
+import re
+
+import numpy as np
+
+from dclistrik import core, units
+
+# Angka diikuti akhiran apa pun sampai pemisah berikutnya (``4.7k``, ``4k7``,
+# ``1kΩ``); akhirannya divalidasi oleh units.parse_quantity
+_TOKEN = re.compile(r"\s*(?:(\|\|)|([+()])|([A-Za-z_]\w*)|(\d+(?:\.\d*)?(?:[eE][+-]?\d+)?[^\s+()|]*))")
+_PRECEDENCE = {"+": 1, "||": 2}
+SERIES, PARALLEL, LEAF, CONST = "+", "||", "leaf", "const"
+
+# Node dengan anak lebih banyak dari ini diperbarui secara delta (O(1))
+# alih-alih dijumlah ulang dari semua anaknya
+DELTA_FANIN = 16
+
+# Bila akumulator delta jatuh di bawah toleransi relatif ini terhadap suku
+# yang baru ditambah/dikurangi, sisa pembulatan bisa mendominasi (mis. 2.8e-17
+# alih-alih 0, yang di paralel menjadi konduktansi raksasa); akumulatornya
+# lalu dijumlah ulang secara eksak
+DELTA_RTOL = 1e-9
+
+
+def _conductance(R):
+    return 1.0 / R if R != 0 else 0.0
+
+
+def _tokens(expression):
+    pos = 0
+    expression = expression.rstrip()
+    while pos < len(expression):
+        match = _TOKEN.match(expression, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"Karakter tidak dikenal di posisi {pos + 1}: {expression[pos:pos + 10]!r}")
+        pos = match.end()
+        parallel, symbol, name, number = match.groups()
+        if number is not None:
+            yield CONST, units.parse_quantity(number, "Ω")
+        elif name is not None:
+            yield LEAF, name
+        else:
+            yield "op", parallel or symbol
+
+
+def _postfix(expression):
+    # Shunting-yard: aman untuk sarang ribuan tingkat (tanpa rekursi)
+    output, stack = [], []
+    expect_operand = True
+    for kind, token in _tokens(expression):
+        if kind != "op":
+            if not expect_operand:
+                raise ValueError(f"Operator hilang sebelum {token!r}")
+            output.append((kind, token))
+            expect_operand = False
+        elif token == "(":
+            if not expect_operand:
+                raise ValueError("Operator hilang sebelum '('")
+            stack.append(token)
+        elif token == ")":
+            if expect_operand:
+                raise ValueError("Operand hilang sebelum ')'")
+            while stack and stack[-1] != "(":
+                output.append(("op", stack.pop()))
+            if not stack:
+                raise ValueError("Kurung tutup tanpa pasangan")
+            stack.pop()
+        else:
+            if expect_operand:
+                raise ValueError(f"Operand hilang sebelum {token!r}")
+            while stack and stack[-1] != "(" and _PRECEDENCE[stack[-1]] >= _PRECEDENCE[token]:
+                output.append(("op", stack.pop()))
+            stack.append(token)
+            expect_operand = True
+    if expect_operand:
+        raise ValueError("Ekspresi kosong atau berakhir dengan operator")
+    while stack:
+        if stack[-1] == "(":
+            raise ValueError("Kurung buka tanpa pasangan")
+        output.append(("op", stack.pop()))
+    return output
+
+
+class Network:
+    """DAG ekspresi jaringan dengan nilai ter-memo dan pembaruan inkremental."""
+
+    def __init__(self, expression, values=None):
+        self.expression = expression
+        self.kind = []       # SERIES / PARALLEL / LEAF / CONST per node
+        self.key = []        # nama hambatan, nilai konstanta, atau id anak terurut
+        self.children = []   # id anak (boleh berulang, mis. R1 + R1)
+        self.parents = []    # id induk, satu entri per kemunculan
+        self.acc = []        # jumlah R (seri) atau jumlah 1/R (paralel)
+        self.value = []      # hambatan ekuivalen node
+        self.leaves = {}     # nama → id node
+        self._interned = {}
+        self.recomputed = 0  # jumlah node yang dihitung pada operasi terakhir
+        self.root = self._build(_postfix(expression))
+        if values is not None:
+            self._evaluate_all(values)
+
+    def _node(self, kind, key, children=()):
+        node = self._interned.get((kind, key))
+        if node is None:
+            node = len(self.kind)
+            self._interned[(kind, key)] = node
+            self.kind.append(kind)
+            self.key.append(key)
+            self.children.append(children)
+            self.parents.append([])
+            self.acc.append(0.0)
+            self.value.append(0.0)
+            for child in children:
+                self.parents[child].append(node)
+        return node
+
+    def _build(self, postfix):
+        # Elemen tumpukan: id node, atau (op, [id...]) yang belum difinalisasi
+        # agar rantai operator sejenis tergabung menjadi satu node n-ary
+        def finalize(item):
+            if isinstance(item, tuple):
+                op, ids = item
+                ids = tuple(sorted(ids))
+                return self._node(op, ids, ids)
+            return item
+
+        def operands(item, op):
+            if isinstance(item, tuple) and item[0] == op:
+                return item[1]
+            return [finalize(item)]
+
+        stack = []
+        for kind, token in postfix:
+            if kind == LEAF:
+                node = self._node(LEAF, token)
+                self.leaves[token] = node
+                stack.append(node)
+            elif kind == CONST:
+                stack.append(self._node(CONST, token))
+            else:
+                right, left = stack.pop(), stack.pop()
+                stack.append((token, operands(left, token) + operands(right, token)))
+        return finalize(stack.pop())
+
+    def _combine(self, node):
+        # Hitung ulang akumulator node dari semua anak
+        values = [self.value[c] for c in self.children[node]]
+        if self.kind[node] == SERIES:
+            return sum(values)
+        return sum(_conductance(v) for v in values)
+
+    def _finish(self, node):
+        acc = self.acc[node]
+        return acc if self.kind[node] == SERIES else _conductance(acc)
+
+    def _evaluate_all(self, values):
+        missing = sorted(set(self.leaves) - set(values))
+        if missing:
+            raise ValueError(f"Nilai hambatan belum diberikan: {', '.join(missing[:5])}")
+        # Anak selalu dibuat sebelum induknya, jadi urutan id = urutan topologis
+        for node, kind in enumerate(self.kind):
+            if kind == LEAF:
+                self.value[node] = float(values[self.key[node]])
+            elif kind == CONST:
+                self.value[node] = self.key[node]
+            else:
+                self.acc[node] = self._combine(node)
+                self.value[node] = self._finish(node)
+        self.recomputed = len(self.kind)
+
+    def evaluate_arrays(self, values):
+        """Evaluasi tervektorisasi tanpa memo; ``values`` nama → array sampel."""
+        out = [None] * len(self.kind)
+        for node, kind in enumerate(self.kind):
+            if kind == LEAF:
+                out[node] = np.asarray(values[self.key[node]], dtype=float)
+            elif kind == CONST:
+                out[node] = self.key[node]
+            elif kind == SERIES:
+                out[node] = sum(out[c] for c in self.children[node])
+            else:
+                out[node] = core.safe_divide(1.0, sum(core.safe_divide(1.0, out[c]) for c in self.children[node]))
+        return out[self.root]
+
+    @property
+    def total(self):
+        """Hambatan ekuivalen seluruh jaringan (Ohm)."""
+        return self.value[self.root]
+
+    @property
+    def names(self):
+        return list(self.leaves)
+
+    @property
+    def shared(self):
+        """Jumlah subekspresi yang dipakai lebih dari sekali."""
+        return sum(len(p) > 1 for p in self.parents)
+
+    def __len__(self):
+        return len(self.kind)
+
+    def __getitem__(self, name):
+        return self.value[self.leaves[name]]
+
+    def update(self, values):
+        """Ubah beberapa hambatan sekaligus; hanya leluhurnya yang dihitung ulang."""
+        heap, old = [], {}
+        for name, R in values.items():
+            node = self.leaves[name]
+            R = float(R)
+            if R != self.value[node]:
+                old.setdefault(node, self.value[node])
+                self.value[node] = R
+        self.recomputed = 0
+        pending, exact = set(), set()
+        for node in old:
+            self._propagate(node, old[node], heap, pending, exact)
+        while heap:
+            node = heapq.heappop(heap)
+            if node not in pending:
+                continue
+            pending.discard(node)
+            self.recomputed += 1
+            if len(self.children[node]) <= DELTA_FANIN or node in exact:
+                self.acc[node] = self._combine(node)
+            new = self._finish(node)
+            if new != self.value[node]:
+                before, self.value[node] = self.value[node], new
+                self._propagate(node, before, heap, pending, exact)
+        return self.total
+
+    def _propagate(self, node, before, heap, pending, exact):
+        after = self.value[node]
+        for parent in self.parents[node]:
+            if len(self.children[parent]) > DELTA_FANIN:
+                if self.kind[parent] == SERIES:
+                    removed, added = before, after
+                else:
+                    removed, added = _conductance(before), _conductance(after)
+                self.acc[parent] += added - removed
+                if abs(self.acc[parent]) <= DELTA_RTOL * max(abs(removed), abs(added)):
+                    exact.add(parent)
+            if parent not in pending:
+                pending.add(parent)
+                heapq.heappush(heap, parent)
+
+    def set(self, name, R):
+        """Ubah satu hambatan dan kembalikan hambatan total yang baru."""
+        return self.update({name: R})
+
+
+def resistor_values(resistors):
+    """Peta ``R1..Rn`` → nilai dari array hambatan."""
+    return {f"R{i + 1}": float(R) for i, R in enumerate(np.asarray(resistors, dtype=float))}
+
+
+def changed_values(previous, resistors):
+    """Peta ``R{i}`` → nilai baru, hanya untuk hambatan yang berbeda dari ``previous``.
+
+    Kedua array harus sama panjang; hanya indeks yang berubah yang dibuat
+    menjadi entri, sehingga rerun tanpa perubahan berbiaya satu perbandingan
+    array.
+    """
+    if previous is resistors:
+        return {}
+    resistors = np.asarray(resistors, dtype=float)
+    changed = np.flatnonzero(np.asarray(previous, dtype=float) != resistors)
+    return {f"R{i + 1}": float(resistors[i]) for i in changed}
+
+
+def ladder_expression(n):
+    """Rangkaian tangga ``R1 + (R2 || (R3 + (R4 || ...)))`` dengan ``n`` hambatan."""
+    n = int(n)
+    parts = []
+    for i in range(1, n):
+        parts.append(f"R{i} {'+' if i % 2 else '||'} (")
+    return "".join(parts) + f"R{n}" + ")" * (n - 1)
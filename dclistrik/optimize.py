@@ -0,0 +1,106 @@
+"""Optimasi transfer daya baterai ke beban berdasarkan model ε dan r.
+
+Untuk baterai (ε, r) dengan beban R berlaku I = ε / (R + r), daya beban
+P = I² × R dan efisiensi η = R / (R + r). Solusi bentuk tertutup dipakai
+bila ada (daya maksimum saat R = r); selain itu pencarian dilakukan
+secara vektor atas semua kombinasi baterai × beban atau susunan sel.
+"""
+
+import numpy as np
+
+from dclistrik import core
+
+
+def load_current(epsilon, r, R):
+    """I = ε / (R + r)"""
+    return core.ohm_current(epsilon, np.add(R, r))
+
+
+def load_power(epsilon, r, R):
+    """Daya yang diterima beban, P = I² × R."""
+    return core.power_i2r(load_current(epsilon, r, R), R)
+
+
+def efficiency(r, R):
+    """η = R / (R + r), bagian daya baterai yang sampai ke beban."""
+    return core.safe_divide(R, np.add(R, r))
+
+
+def max_power_transfer(epsilon, r):
+    """Beban optimal dan daya maksimumnya: R = r, P_maks = ε² / (4r)."""
+    epsilon = np.asarray(epsilon, dtype=float)
+    return np.asarray(r, dtype=float)[()], core.safe_divide(epsilon**2, np.multiply(4, r))
+
+
+def _objective(epsilon, r, loads, objective, min_power):
+    # Matriks skor (baterai × beban); kombinasi yang gagal syarat daya = -inf
+    epsilon = np.asarray(epsilon, dtype=float)[..., None]
+    r = np.asarray(r, dtype=float)[..., None]
+    loads = np.asarray(loads, dtype=float)
+    power = load_power(epsilon, r, loads)
+    if objective == "power":
+        score = power
+    elif objective == "efficiency":
+        score = np.broadcast_to(efficiency(r, loads), np.shape(power)).copy()
+    else:
+        raise ValueError(f"Tujuan optimasi tidak dikenal: {objective!r}")
+    if min_power is not None:
+        score = np.where(power >= min_power, score, -np.inf)
+    return score, power
+
+
+def best_loads(epsilon, r, loads, objective="power", min_power=None):
+    """Beban terbaik dari ``loads`` untuk setiap baterai.
+
+    Kembalikan ``(indeks beban, skor, daya)`` per baterai. Dengan
+    ``objective="efficiency"`` sebaiknya beri ``min_power`` karena
+    efisiensi selalu naik seiring R.
+    """
+    score, power = _objective(epsilon, r, loads, objective, min_power)
+    index = np.argmax(score, axis=-1)
+    take = lambda a: np.take_along_axis(a, index[..., None], axis=-1)[..., 0]
+    return index, take(score), take(power)
+
+
+def rank_combinations(epsilon, r, loads, objective="power", min_power=None, top=10):
+    """Peringkat ``top`` kombinasi baterai × beban terbaik.
+
+    Kembalikan ``(indeks baterai, indeks beban, skor, daya)`` terurut
+    menurun. Menggunakan ``argpartition`` sehingga biayanya O(B × L).
+    """
+    score, power = _objective(np.atleast_1d(epsilon), np.atleast_1d(r), loads, objective, min_power)
+    flat = score.ravel()
+    top = min(top, flat.size)
+    candidates = np.argpartition(-flat, top - 1)[:top]
+    order = candidates[np.argsort(-flat[candidates], kind="stable")]
+    battery, load = np.unravel_index(order, score.shape)
+    return battery, load, flat[order], power.ravel()[order]
+
+
+def cell_arrangements(n_cells):
+    """Semua susunan ``s`` seri × ``p`` paralel dengan ``s × p = n_cells``."""
+    s = np.arange(1, int(n_cells) + 1)
+    s = s[int(n_cells) % s == 0]
+    return s, int(n_cells) // s
+
+
+def arrangement_power(epsilon, r, n_cells, R):
+    """Daya beban untuk setiap susunan sel identik (ε, r).
+
+    ε_total = s × ε dan r_total = s × r / p. Kembalikan ``(s, p, daya)``.
+    """
+    s, p = cell_arrangements(n_cells)
+    return s, p, load_power(s * epsilon, s * r / p, R)
+
+
+def best_arrangement(epsilon, r, n_cells, R):
+    """Susunan sel terbaik untuk beban R.
+
+    Optimum kontinu berada di r_total = R, yaitu s = √(n × R / r); hasil
+    diskret dipilih dari pembagi ``n_cells`` terdekat secara vektor.
+    Kembalikan ``(s, p, daya, s_kontinu)``.
+    """
+    s, p, power = arrangement_power(epsilon, r, n_cells, R)
+    best = int(np.argmax(power))
+    s_ideal = np.sqrt(n_cells * R / r) if r > 0 else float(n_cells)
+    return int(s[best]), int(p[best]), float(power[best]), float(s_ideal)
@@ -0,0 +1,139 @@
+"""Instrumentasi jalur panas (opt-in) dengan histogram bergulir per proses.
+
+Aktif bila variabel lingkungan ``DCLISTRIK_PROFILE=1``. Setiap rerun
+dibuka dengan :meth:`Profiler.begin_rerun` dan ditutup dengan
+:meth:`Profiler.end_rerun`; di antaranya blok ``with PROFILER.phase(...)``
+mencatat waktu *eksklusif* (waktu fase bersarang dikurangkan dari
+induknya), sehingga jumlah semua fase sama dengan total rerun. Sisa waktu
+di luar fase mana pun dicatat sebagai ``lainnya``.
+
+Untuk setiap (kalkulator, fase) disimpan :data:`WINDOW` sampel terakhir,
+dibagi oleh semua sesi dalam satu proses. Ringkasan p50/p95/p99 ditulis
+berkala sebagai satu baris log JSON dan, bila ``export_path`` diberikan,
+sebagai file JSON (di aplikasi: ``static/profiling.json``).
+"""
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+WINDOW = 1000
+EXPORT_INTERVAL = 30.0  # detik
+
+logger = logging.getLogger(__name__)
+
+
+class Profiler:
+    """Pencatat waktu fase per kalkulator yang aman lintas thread sesi."""
+
+    def __init__(self, enabled=False, window=WINDOW, export_path=None, interval=EXPORT_INTERVAL):
+        self.enabled = enabled
+        self.window = window
+        self.export_path = export_path
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._samples = {}  # (kalkulator, fase) → deque ms
+        self._local = threading.local()
+        self._last_export = time.monotonic()
+
+    def begin_rerun(self, calculator, start=None):
+        """Mulai rerun untuk ``calculator``; ``start`` = ``time.perf_counter()`` awal skrip."""
+        if not self.enabled:
+            return
+        local = self._local
+        local.calculator = calculator
+        local.totals = {}
+        local.stack = []
+        local.start = time.perf_counter() if start is None else start
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        local = self._local
+        if not self.enabled or getattr(local, "totals", None) is None:
+            yield
+            return
+        frame = [0.0]  # waktu fase anak
+        local.stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            local.stack.pop()
+            if local.stack:
+                local.stack[-1][0] += elapsed
+            local.totals[name] = local.totals.get(name, 0.0) + elapsed - frame[0]
+
+    def end_rerun(self):
+        """Catat total dan fase rerun ini ke histogram; kembalikan total (ms)."""
+        local = self._local
+        if not self.enabled or getattr(local, "totals", None) is None:
+            return None
+        total = time.perf_counter() - local.start
+        phases = dict(local.totals)
+        phases["lainnya"] = max(total - sum(phases.values()), 0.0)
+        phases["total"] = total
+        local.totals = None
+        with self._lock:
+            for name, seconds in phases.items():
+                key = (local.calculator, name)
+                if key not in self._samples:
+                    self._samples[key] = deque(maxlen=self.window)
+                self._samples[key].append(seconds * 1000)
+        self.maybe_export()
+        return total * 1000
+
+    def summary(self):
+        """``{kalkulator: {fase: {n, p50, p95, p99, mean}}}`` dalam milidetik."""
+        with self._lock:
+            samples = {key: np.fromiter(values, float) for key, values in self._samples.items()}
+        out = {}
+        for (calculator, name), values in sorted(samples.items()):
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            out.setdefault(calculator, {})[name] = {
+                "n": int(values.size), "p50": round(float(p50), 3), "p95": round(float(p95), 3),
+                "p99": round(float(p99), 3), "mean": round(float(values.mean()), 3),
+            }
+        return out
+
+    def to_json(self):
+        return json.dumps({"time": time.time(), "window": self.window, "calculators": self.summary()},
+                          ensure_ascii=False, separators=(",", ":"))
+
+    def maybe_export(self, force=False):
+        """Tulis baris log dan file JSON bila sudah lewat ``interval`` detik."""
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_export < self.interval:
+                return
+            self._last_export = now
+        line = self.to_json()
+        logger.info("profiling %s", line)
+        if self.export_path:
+            try:
+                os.makedirs(os.path.dirname(self.export_path), exist_ok=True)
+                tmp = f"{self.export_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write(line)
+                os.replace(tmp, self.export_path)
+            except OSError as exc:
+                logger.warning("Gagal menulis %s: %s", self.export_path, exc)
+
+
+PROFILER = Profiler(
+    enabled=os.environ.get("DCLISTRIK_PROFILE", "") not in ("", "0"),
+    interval=float(os.environ.get("DCLISTRIK_PROFILE_INTERVAL", EXPORT_INTERVAL)),
+)
+
+# Baris log harus terlihat walau logging root belum dikonfigurasi
+if PROFILER.enabled and not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
@@ -0,0 +1,190 @@
+"""Skema rangkaian hambatan seri/paralel dalam SVG, dengan tata letak ter-cache.
+
+Tata letak (posisi simbol, kabel, nama hambatan) hanya bergantung pada
+topologi, sehingga dihitung sekali per topologi dan disimpan sebagai
+potongan SVG jadi (:class:`Layout`). Saat nilai berubah, hanya teks nilai
+yang diformat ulang dan disambung di belakang potongan tersebut.
+
+Jaringan besar tetap ringkas: simbol hambatan didefinisikan sekali
+(``<use href="#dcl-r">``), semua kabel berada dalam satu ``<path>``, node
+n-ary dengan anak lebih dari :data:`MAX_CHILDREN` diringkas dengan blok
+"⋯", dan setelah :data:`MAX_ELEMENTS` elemen subjaringan sisanya
+digambar sebagai satu kotak berlabel hambatan ekuivalennya. Semua
+langkah berjalan iteratif sehingga sarang ribuan tingkat (mis.
+:func:`dclistrik.network.ladder_expression`) aman.
+"""
+
+import functools
+import html
+from collections import deque
+from dataclasses import dataclass
+
+from dclistrik import network, units
+from dclistrik.network import PARALLEL, SERIES
+
+MAX_ELEMENTS = 400
+MAX_CHILDREN = 16
+
+# Geometri (piksel): satu elemen = sel CELL_W × CELL_H, rel di tengah baris atas
+CELL_W, CELL_H, BUS, MARGIN = 80, 56, 16, 12
+RAIL = CELL_H // 2
+
+# Gaya lewat atribut yang diwariskan (bukan ``<style>``) agar tidak bocor ke
+# halaman saat SVG disisipkan langsung ke HTML
+_ROOT = 'font-family="sans-serif" font-size="11" text-anchor="middle" fill="#2d3748"'
+_STROKE = 'fill="none" stroke="#2d3748" stroke-width="1.5"'
+_DEFS = (f'<defs><path id="dcl-r" {_STROKE} d="M0 0h16l4-7 8 14 8-14 8 14 8-14 8 14 4-7h16"/>'
+         f'<g id="dcl-b" {_STROKE}><path d="M0 0h16m48 0h16"/><rect x="16" y="-10" width="48" height="20" '
+         'stroke-dasharray="4 3"/></g></defs>')
+
+_TAIL = "</svg>"
+
+# Jenis elemen yang digambar
+LEAF, BOX, MORE = "leaf", "box", "more"
+
+
+@dataclass
+class Layout:
+    """Potongan SVG statis per topologi dan posisi teks nilai yang ditambal."""
+
+    head: str           # SVG tanpa teks nilai dan tanpa ``</svg>``
+    value_slots: list   # (awalan ``<text ...>``, indeks nilai)
+    width: int
+    height: int
+    elements: int       # jumlah simbol yang digambar
+
+
+def _flat_tree(op, count):
+    # Pohon gambar untuk R1..Rn seri/paralel: (jenis, slot, nama, anak)
+    shown = range(count) if count <= MAX_CHILDREN else [*range(MAX_CHILDREN - 2), None, count - 1]
+    nodes = [(op, None, "", [])]
+    for i in shown:
+        nodes[0][3].append(len(nodes))
+        if i is None:
+            nodes.append((MORE, None, f"{count - MAX_CHILDREN + 1:,} lainnya", []))
+        else:
+            nodes.append((LEAF, i, f"R{i + 1}", []))
+    return nodes
+
+
+def _network_tree(net):
+    # Pohon gambar dari DAG Network, dibentangkan melebar (BFS) agar anggaran
+    # elemen habis di kedalaman, bukan di cabang pertama; slot = id node DAG
+    nodes = []
+    budget = MAX_ELEMENTS
+    queue = deque([(net.root, None)])
+    while queue:
+        node, parent = queue.popleft()
+        kind = net.kind[node]
+        index = len(nodes)
+        if parent is not None:
+            nodes[parent][3].append(index)
+        if kind == network.LEAF:
+            nodes.append((LEAF, node, net.key[node], []))
+            continue
+        if kind == network.CONST:
+            nodes.append((LEAF, node, "", []))
+            continue
+        children = net.children[node]
+        if len(children) > MAX_CHILDREN:
+            children = [*children[:MAX_CHILDREN - 2], None, children[-1]]
+        if budget < len(children):
+            nodes.append((BOX, node, "R_ek", []))
+            continue
+        budget -= len(children)
+        nodes.append((kind, None, "", []))
+        for child in children:
+            if child is None:
+                nodes[index][3].append(len(nodes))
+                nodes.append((MORE, None, f"{len(net.children[node]) - MAX_CHILDREN + 1:,} lainnya", []))
+            else:
+                queue.append((child, index))
+    return nodes
+
+
+def _layout(nodes):
+    # Ukuran dari daun ke akar (anak selalu berindeks lebih besar dari induknya)
+    width, height = [CELL_W] * len(nodes), [CELL_H] * len(nodes)
+    for i in range(len(nodes) - 1, -1, -1):
+        kind, _, _, children = nodes[i]
+        if kind == SERIES:
+            width[i] = sum(width[c] for c in children)
+            height[i] = max(height[c] for c in children)
+        elif kind == PARALLEL:
+            width[i] = max(width[c] for c in children) + 2 * BUS
+            height[i] = sum(height[c] for c in children)
+
+    # Posisi dari akar ke daun; rel setiap blok berada di baris teratasnya
+    x, y = [0] * len(nodes), [0] * len(nodes)
+    x[0], y[0] = MARGIN, MARGIN
+    wires, parts, value_slots = [], [], []
+    for i, (kind, slot, label, children) in enumerate(nodes):
+        left, top = x[i], y[i]
+        rail = top + RAIL
+        center = left + CELL_W // 2
+        if kind == SERIES:
+            for c in children:
+                x[c], y[c] = left, top
+                left += width[c]
+        elif kind == PARALLEL:
+            right = left + width[i]
+            row = top
+            for c in children:
+                x[c], y[c] = left + BUS, row
+                wires.append(f"M{left} {row + RAIL}h{BUS}M{left + BUS + width[c]} {row + RAIL}H{right}")
+                row += height[c]
+            last = row - height[children[-1]] + RAIL
+            wires.append(f"M{left} {rail}V{last}M{right} {rail}V{last}")
+        elif kind == LEAF:
+            parts.append(f'<use href="#dcl-r" x="{left}" y="{rail}"/>')
+            if label:
+                parts.append(f'<text x="{center}" y="{rail - 11}">{html.escape(label)}</text>')
+            value_slots.append((f'<text fill="#667eea" x="{center}" y="{rail + 20}">', slot))
+        else:  # BOX / MORE
+            parts.append(f'<use href="#dcl-b" x="{left}" y="{rail}"/>')
+            parts.append(f'<text x="{center}" y="{rail + 4}">{"⋯" if kind == MORE else html.escape(label)}</text>')
+            if kind == MORE:
+                parts.append(f'<text x="{center}" y="{rail + 24}">{label}</text>')
+            else:
+                value_slots.append((f'<text fill="#667eea" x="{center}" y="{rail + 24}">', slot))
+
+    total_w, total_h = width[0] + 2 * MARGIN, height[0] + 2 * MARGIN
+    rail = MARGIN + RAIL
+    terminals = (f'<circle cx="{MARGIN}" cy="{rail}" r="3"/>'
+                 f'<circle cx="{MARGIN + width[0]}" cy="{rail}" r="3"/>')
+    head = (f'<svg xmlns="http://www.w3.org/2000/svg" width="{total_w}" height="{total_h}" '
+            f'viewBox="0 0 {total_w} {total_h}" {_ROOT}>{_DEFS}'
+            f'<path {_STROKE} d="{"".join(wires)}"/>{"".join(parts)}{terminals}')
+    elements = sum(kind in (LEAF, BOX, MORE) for kind, *_ in nodes)
+    return Layout(head, value_slots, total_w, total_h, elements)
+
+
+@functools.lru_cache(maxsize=64)
+def flat_layout(op, count):
+    """Tata letak R1..R``count`` dengan ``op`` :data:`SERIES` atau :data:`PARALLEL`."""
+    return _layout(_flat_tree(op, int(count)))
+
+
+@functools.lru_cache(maxsize=64)
+def network_layout(expression):
+    """Tata letak ekspresi jaringan (struktur saja; nilai ditambal saat render)."""
+    return _layout(_network_tree(network.Network(expression)))
+
+
+def render(layout, values=None, symbol="Ω"):
+    """SVG lengkap: ``layout`` ditambah teks nilai ``values[slot]`` (tanpa nilai bila None)."""
+    if values is None:
+        return layout.head + _TAIL
+    labels = "".join(f"{prefix}{units.format_si(float(values[slot]), symbol)}</text>"
+                     for prefix, slot in layout.value_slots)
+    return layout.head + labels + _TAIL
+
+
+def flat_svg(op, resistors):
+    """Skema hambatan ``resistors`` (array Ohm) dalam susunan seri atau paralel."""
+    return render(flat_layout(op, len(resistors)), resistors)
+
+
+def network_svg(net):
+    """Skema :class:`dclistrik.network.Network` dengan nilai node terkininya."""
+    return render(network_layout(net.expression), net.value)
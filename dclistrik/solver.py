@@ -0,0 +1,221 @@
+"""Penyelesai rangkaian DC umum dengan analisis nodal termodifikasi (MNA).
+
+Format netlist (satu elemen per baris, ``#`` untuk komentar)::
+
+    R<nama> <node+> <node-> <ohm>
+    V<nama> <node+> <node-> <ggl> [r=<hambatan dalam>]
+    I<nama> <node+> <node-> <ampere>
+
+Node ``0`` (atau ``gnd``) adalah ground. Arus sumber arus mengalir dari
+``node+`` melalui sumber ke ``node-`` (konvensi SPICE). Hambatan 0 Ohm
+diperlakukan sebagai sumber tegangan 0 V (hubung singkat). Nilai boleh
+memakai awalan SI, mis. ``4.7k``, ``2.2MΩ``, ``500mA`` atau ``r=50m``.
+
+Matriks konduktansi dirakit sekaligus dari array (format COO) lalu
+difaktorkan dengan SuperLU dari ``scipy.sparse``, sehingga grid dengan
+ratusan ribu node selesai dalam hitungan detik.
+"""
+
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import MatrixRankWarning, spsolve
+
+from dclistrik import units
+
+GROUND_NAMES = ("0", "gnd", "GND")
+ELEMENT_UNITS = {"R": "Ω", "V": "V", "I": "A"}
+
+
+@dataclass
+class Netlist:
+    node_names: list
+    # Hambatan
+    r_names: list
+    r_a: np.ndarray
+    r_b: np.ndarray
+    r_value: np.ndarray
+    # Sumber tegangan (baterai) dengan hambatan dalam
+    v_names: list
+    v_a: np.ndarray
+    v_b: np.ndarray
+    v_emf: np.ndarray
+    v_r: np.ndarray
+    # Sumber arus
+    i_names: list
+    i_a: np.ndarray
+    i_b: np.ndarray
+    i_value: np.ndarray
+
+
+@dataclass
+class Solution:
+    node_names: list
+    node_voltages: np.ndarray
+    branch_names: list
+    branch_voltages: np.ndarray
+    branch_currents: np.ndarray
+    branch_powers: np.ndarray
+
+    @property
+    def total_power(self):
+        """Total daya terdisipasi di semua hambatan (termasuk hambatan dalam)."""
+        return float(self.branch_powers.sum())
+
+
+def parse_netlist(text):
+    """Ubah teks netlist menjadi :class:`Netlist`."""
+    node_index = {name: -1 for name in GROUND_NAMES}
+    node_names = []
+
+    def node(name):
+        if name not in node_index:
+            node_index[name] = len(node_names)
+            node_names.append(name)
+        return node_index[name]
+
+    elements = {"R": ([], [], [], []), "V": ([], [], [], [], []), "I": ([], [], [], [])}
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        fields = line.split()
+        kind = fields[0][0].upper()
+        if kind not in elements or len(fields) < 4:
+            raise ValueError(f"Baris {lineno}: elemen tidak dikenal '{line}'")
+        columns = elements[kind]
+        try:
+            columns[0].append(fields[0])
+            columns[1].append(node(fields[1]))
+            columns[2].append(node(fields[2]))
+            columns[3].append(units.parse_quantity(fields[3], ELEMENT_UNITS[kind]))
+            if kind == "V":
+                r = 0.0
+                for extra in fields[4:]:
+                    key, _, value = extra.partition("=")
+                    if key.lower() != "r":
+                        raise ValueError(extra)
+                    r = units.parse_quantity(value, "Ω")
+                columns[4].append(r)
+        except ValueError as exc:
+            raise ValueError(f"Baris {lineno}: nilai tidak valid ({exc})") from None
+
+    r_cols, v_cols, i_cols = elements["R"], elements["V"], elements["I"]
+    return Netlist(
+        node_names=node_names,
+        r_names=r_cols[0], r_a=np.array(r_cols[1], dtype=np.int64),
+        r_b=np.array(r_cols[2], dtype=np.int64), r_value=np.array(r_cols[3], dtype=float),
+        v_names=v_cols[0], v_a=np.array(v_cols[1], dtype=np.int64),
+        v_b=np.array(v_cols[2], dtype=np.int64), v_emf=np.array(v_cols[3], dtype=float),
+        v_r=np.array(v_cols[4], dtype=float),
+        i_names=i_cols[0], i_a=np.array(i_cols[1], dtype=np.int64),
+        i_b=np.array(i_cols[2], dtype=np.int64), i_value=np.array(i_cols[3], dtype=float),
+    )
+
+
+def _stamp(rows, cols, vals, a, b, values):
+    # Stempel elemen dua terminal, baris/kolom ground (-1) dibuang
+    for ri, ci, sign in ((a, a, 1.0), (b, b, 1.0), (a, b, -1.0), (b, a, -1.0)):
+        keep = (ri >= 0) & (ci >= 0)
+        rows.append(ri[keep])
+        cols.append(ci[keep])
+        vals.append(sign * values[keep])
+
+
+def solve(netlist):
+    """Selesaikan netlist dan kembalikan :class:`Solution`."""
+    n = len(netlist.node_names)
+    # Hambatan 0 Ohm menjadi sumber tegangan 0 V tanpa hambatan dalam
+    short = netlist.r_value == 0
+    res = ~short
+    v_a = np.concatenate([netlist.v_a, netlist.r_a[short]])
+    v_b = np.concatenate([netlist.v_b, netlist.r_b[short]])
+    v_emf = np.concatenate([netlist.v_emf, np.zeros(short.sum())])
+    v_r = np.concatenate([netlist.v_r, np.zeros(short.sum())])
+    m = len(v_a)
+
+    rows, cols, vals = [], [], []
+    _stamp(rows, cols, vals, netlist.r_a[res], netlist.r_b[res], 1.0 / netlist.r_value[res])
+
+    # Variabel arus sumber k: arus keluar dari kutub + ke rangkaian luar
+    k = n + np.arange(m)
+    for node_idx, sign in ((v_a, -1.0), (v_b, 1.0)):
+        keep = node_idx >= 0
+        rows += [node_idx[keep], k[keep]]
+        cols += [k[keep], node_idx[keep]]
+        vals += [np.full(keep.sum(), sign)] * 2
+    rows.append(k)
+    cols.append(k)
+    vals.append(-v_r)
+
+    size = n + m
+    A = sp.csc_matrix(
+        (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(size, size),
+    )
+
+    rhs = np.zeros(size)
+    for node_idx, sign in ((netlist.i_a, -1.0), (netlist.i_b, 1.0)):
+        keep = node_idx >= 0
+        np.add.at(rhs, node_idx[keep], sign * netlist.i_value[keep])
+    rhs[n:] = -v_emf
+
+    # Matriks singular sudah dilaporkan lewat ValueError di bawah
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", MatrixRankWarning)
+        x = np.atleast_1d(spsolve(A, rhs)) if size else np.zeros(0)
+    if not np.all(np.isfinite(x)):
+        raise ValueError("Rangkaian tidak dapat diselesaikan (ada node mengambang atau loop sumber tegangan?)")
+
+    v = np.append(x[:n], 0.0)  # indeks -1 menunjuk ground
+    source_current = x[n:]
+
+    # Hambatan biasa
+    r_voltage = v[netlist.r_a] - v[netlist.r_b]
+    r_current = np.zeros(len(netlist.r_names))
+    r_current[res] = r_voltage[res] / netlist.r_value[res]
+    num_v = len(netlist.v_names)
+    r_current[short] = -source_current[num_v:]
+    r_power = r_current**2 * netlist.r_value
+
+    # Sumber tegangan: arus keluar kutub +, daya hilang di hambatan dalam
+    s_current = source_current[:num_v]
+    s_voltage = v[netlist.v_a] - v[netlist.v_b]
+    s_power = s_current**2 * netlist.v_r
+
+    # Sumber arus
+    i_voltage = v[netlist.i_a] - v[netlist.i_b]
+
+    return Solution(
+        node_names=list(netlist.node_names),
+        node_voltages=x[:n],
+        branch_names=list(netlist.r_names) + list(netlist.v_names) + list(netlist.i_names),
+        branch_voltages=np.concatenate([r_voltage, s_voltage, i_voltage]),
+        branch_currents=np.concatenate([r_current, s_current, netlist.i_value]),
+        branch_powers=np.concatenate([r_power, s_power, np.zeros(len(netlist.i_names))]),
+    )
+
+
+def grid_netlist(rows, cols, R=1.0, emf=1.0, r=0.0):
+    """Bangun netlist grid ``rows × cols`` hambatan identik secara langsung.
+
+    Baterai dipasang antara sudut kiri atas (kutub +) dan sudut kanan bawah
+    (ground). Berguna untuk uji skala tanpa mem-parse teks.
+    """
+    idx = np.arange(rows * cols).reshape(rows, cols)
+    a = np.concatenate([idx[:, :-1].ravel(), idx[:-1, :].ravel()])
+    b = np.concatenate([idx[:, 1:].ravel(), idx[1:, :].ravel()])
+    # Node terakhir adalah ground
+    a = np.where(a == rows * cols - 1, -1, a)
+    b = np.where(b == rows * cols - 1, -1, b)
+    empty_i = np.zeros(0, dtype=np.int64)
+    return Netlist(
+        node_names=[f"n{i}" for i in range(rows * cols - 1)],
+        r_names=[f"R{i+1}" for i in range(len(a))],
+        r_a=a, r_b=b, r_value=np.full(len(a), float(R)),
+        v_names=["V1"], v_a=np.array([0]), v_b=np.array([-1]),
+        v_emf=np.array([float(emf)]), v_r=np.array([float(r)]),
+        i_names=[], i_a=empty_i, i_b=empty_i, i_value=np.zeros(0),
+    )
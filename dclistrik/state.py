@@ -0,0 +1,53 @@
+"""Memo hasil turunan per sesi dengan pelacakan dependensi.
+
+:class:`Derived` menyimpan setiap hasil bersama nilai-nilai input yang
+menghasilkannya di sebuah mapping (di aplikasi: ``st.session_state``).
+Pada rerun berikutnya hasil hanya dihitung ulang bila salah satu
+dependensinya berubah. Modul ini tidak bergantung pada Streamlit.
+"""
+
+import statistics
+
+import numpy as np
+
+
+def _same(a, b):
+    if a is b:
+        return True
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return (isinstance(a, np.ndarray) and isinstance(b, np.ndarray)
+                and a.shape == b.shape and a.dtype == b.dtype and np.array_equal(a, b))
+    if isinstance(a, (tuple, list)) and isinstance(b, (tuple, list)):
+        return type(a) is type(b) and len(a) == len(b) and all(map(_same, a, b))
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):
+        return False
+
+
+class Derived:
+    """Hitung ``func(*deps)`` hanya bila ``deps`` berbeda dari rerun sebelumnya."""
+
+    def __init__(self, store, prefix="derived"):
+        self._store = store
+        self._prefix = prefix
+        self.recomputed = []  # nama hasil yang dihitung ulang pada rerun ini
+        self.reused = []
+
+    def get(self, name, func, *deps):
+        key = f"{self._prefix}:{name}"
+        entry = self._store.get(key)
+        if entry is not None and _same(entry[0], deps):
+            self.reused.append(name)
+            return entry[1]
+        value = func(*deps)
+        self._store[key] = (deps, value)
+        self.recomputed.append(name)
+        return value
+
+
+def record_latency(store, ms, key="rerun_ms", keep=50):
+    """Simpan latensi rerun terakhir (maksimal ``keep`` entri) dan kembalikan ringkasannya."""
+    history = (list(store.get(key, [])) + [ms])[-keep:]
+    store[key] = history
+    return {"terakhir": ms, "median": statistics.median(history), "maks": max(history), "jumlah": len(history)}
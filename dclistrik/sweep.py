@@ -0,0 +1,154 @@
+"""Sweep parameter multi-dimensi untuk model-model kalkulator.
+
+Pengguna memilih dua atau tiga masukan sebuah model beserta rentang dan
+resolusinya; masukan lain bernilai tetap. Grid penuh dihitung dengan
+broadcasting NumPy, dipotong per blok sepanjang sumbu pertama agar
+array antara tidak melebihi :data:`CHUNK_CELLS` elemen. Grid hasil
+sendiri dibatasi :data:`MAX_CELLS` elemen.
+"""
+
+import io
+from dataclasses import dataclass
+
+import numpy as np
+
+from dclistrik import core
+
+# Batas elemen per blok perhitungan (~32 MB float64 per array antara)
+CHUNK_CELLS = 4_000_000
+
+# Batas elemen grid hasil (200 MB float64), mis. 5000² atau 292³
+MAX_CELLS = 25_000_000
+
+# Batas baris tabel CSV yang diunduh langsung (~30 MB teks)
+MAX_TABLE_ROWS = 1_000_000
+
+
+def _terminal_voltage(epsilon, r, R):
+    I = core.ohm_current(epsilon, np.add(R, r))
+    return core.terminal_voltage(epsilon, I, r)
+
+
+def _load_power(epsilon, r, R):
+    I = core.ohm_current(epsilon, np.add(R, r))
+    return core.power_i2r(I, R)
+
+
+@dataclass(frozen=True)
+class Param:
+    key: str
+    label: str
+    default: float
+    minimum: float
+    maximum: float
+
+
+@dataclass(frozen=True)
+class Model:
+    params: tuple
+    func: object
+    output: str
+
+
+BATTERY_PARAMS = (
+    Param("epsilon", "GGL ε (V)", 12.0, 1.0, 24.0),
+    Param("r", "Hambatan Dalam r (Ω)", 1.0, 0.1, 5.0),
+    Param("R", "Hambatan Beban R (Ω)", 10.0, 0.1, 50.0),
+)
+
+MODELS = {
+    "Tegangan Jepit (ε, r, R)": Model(BATTERY_PARAMS, _terminal_voltage, "Tegangan Jepit (V)"),
+    "Daya Beban (ε, r, R)": Model(BATTERY_PARAMS, _load_power, "Daya Beban (W)"),
+    "Hukum Ohm (I = V / R)": Model(
+        (Param("V", "Tegangan V (V)", 12.0, 0.0, 24.0), Param("R", "Hambatan R (Ω)", 10.0, 1.0, 50.0)),
+        core.ohm_current, "Arus (A)"),
+    "Daya (P = V² / R)": Model(
+        (Param("V", "Tegangan V (V)", 12.0, 0.0, 24.0), Param("R", "Hambatan R (Ω)", 10.0, 1.0, 50.0)),
+        core.power_v2r, "Daya (W)"),
+    "Energi (W = P × t)": Model(
+        (Param("P", "Daya P (W)", 100.0, 0.0, 2000.0), Param("t", "Waktu t (jam)", 2.0, 0.0, 24.0)),
+        core.energy_kwh, "Energi (kWh)"),
+}
+
+
+def max_resolution(n_axes):
+    """Resolusi maksimum per sumbu agar grid ``n_axes`` dimensi muat dalam :data:`MAX_CELLS`."""
+    resolution = int(round(MAX_CELLS ** (1 / n_axes)))
+    while resolution ** n_axes > MAX_CELLS:
+        resolution -= 1
+    return resolution
+
+
+def check_size(shape):
+    """Tolak grid yang melebihi :data:`MAX_CELLS` sebelum dialokasikan."""
+    cells = int(np.prod(shape, dtype=object))
+    if cells > MAX_CELLS:
+        raise ValueError(f"Grid {' × '.join(str(n) for n in shape)} = {cells:,} titik melebihi "
+                         f"batas {MAX_CELLS:,} titik; kurangi resolusi.")
+    return cells
+
+
+def _blocks(model, axes, fixed, chunk_cells):
+    # Hasilkan (slice sumbu pertama, blok hasil) secara berurutan
+    names = list(axes)
+    shape = tuple(len(axes[name]) for name in names)
+    inner = int(np.prod(shape[1:], dtype=np.int64))
+    step = max(1, chunk_cells // max(inner, 1))
+    for start in range(0, shape[0], step):
+        rows = slice(start, min(start + step, shape[0]))
+        kwargs = dict(fixed)
+        for dim, name in enumerate(names):
+            values = np.asarray(axes[name], dtype=float)
+            if dim == 0:
+                values = values[rows]
+            kwargs[name] = values.reshape([-1 if d == dim else 1 for d in range(len(names))])
+        block = model.func(*[kwargs[p.key] for p in model.params])
+        yield rows, np.broadcast_to(block, (rows.stop - rows.start,) + shape[1:])
+
+
+def evaluate(model, axes, fixed=None, chunk_cells=CHUNK_CELLS):
+    """Hitung grid penuh; ``axes`` adalah dict berurutan nama → nilai 1-D.
+
+    Hasil berbentuk ``(len(axes[a]), len(axes[b])[, len(axes[c])])``.
+    """
+    fixed = fixed or {}
+    shape = tuple(len(values) for values in axes.values())
+    check_size(shape)
+    out = np.empty(shape)
+    for rows, block in _blocks(model, axes, fixed, chunk_cells):
+        out[rows] = block
+    return out
+
+
+def iter_table(model, axes, fixed=None, chunk_cells=CHUNK_CELLS):
+    """Hasilkan tabel hasil sebagai potongan teks CSV tanpa menyimpan grid penuh."""
+    fixed = fixed or {}
+    names = list(axes)
+    yield ",".join(names + [model.output]) + "\n"
+    for rows, block in _blocks(model, axes, fixed, chunk_cells):
+        grids = np.meshgrid(np.asarray(axes[names[0]], dtype=float)[rows],
+                            *[np.asarray(axes[name], dtype=float) for name in names[1:]],
+                            indexing="ij")
+        table = np.column_stack([g.ravel() for g in grids] + [block.ravel()])
+        buffer = io.StringIO()
+        np.savetxt(buffer, table, delimiter=",", fmt="%.6g")
+        yield buffer.getvalue()
+
+
+def table_axes(axes, max_rows=MAX_TABLE_ROWS):
+    """Sumbu untuk tabel unduhan: setiap n-titik di semua sumbu agar baris ≤ ``max_rows``.
+
+    Kembalikan ``(axes, n)``; ``n == 1`` berarti tabel lengkap.
+    """
+    lengths = [len(values) for values in axes.values()]
+    step = 1
+    while int(np.prod([-(-n // step) for n in lengths], dtype=np.int64)) > max_rows:
+        step += 1
+    return {name: np.asarray(values)[::step] for name, values in axes.items()}, step
+
+
+def thin(values, grid, max_cells_per_axis=400):
+    """Ambil setiap n-titik agar heatmap tetap ringan untuk dikirim ke browser."""
+    steps = [max(1, -(-len(v) // max_cells_per_axis)) for v in values]
+    thinned_grid = grid[tuple(slice(None, None, s) for s in steps)]
+    return [v[::s] for v, s in zip(values, steps)], thinned_grid
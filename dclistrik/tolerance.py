@@ -0,0 +1,115 @@
+"""Analisis toleransi Monte Carlo untuk susunan hambatan seri/paralel.
+
+Setiap hambatan diambil sampelnya sebagai ``R = R_nom × (1 + δ) × (1 + α ΔT)``
+dengan δ dari toleransi pabrikan dan α dari koefisien suhu (ppm/°C).
+Sampel dibuat per batch berukuran terbatas; setiap batch memakai turunan
+``SeedSequence`` sendiri sehingga hasil identik berapa pun jumlah worker.
+Pembagian batch ikut menentukan aliran acak, jadi hasil hanya dapat
+diulang untuk ``seed`` dan ``batch_cells`` yang sama.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from dclistrik import core, network
+
+# Batas elemen matriks sampel (batch × jumlah hambatan) per batch
+BATCH_CELLS = 2_000_000
+PERCENTILES = (1, 5, 50, 95, 99)
+
+
+@dataclass
+class ToleranceSpec:
+    tolerance: float = 0.05        # ±5%
+    distribution: str = "uniform"  # "uniform" atau "normal" (toleransi = 3σ)
+    tempco_ppm: float = 0.0        # ±ppm/°C
+    delta_T: float = 0.0           # selisih suhu terhadap 25 °C
+
+
+def sample_resistors(nominal, spec, n, rng):
+    """Matriks sampel ``(n, jumlah hambatan)``."""
+    nominal = np.asarray(nominal, dtype=float)
+    shape = (n, nominal.size)
+    if spec.distribution == "normal":
+        delta = rng.normal(0.0, spec.tolerance / 3, shape)
+    else:
+        delta = rng.uniform(-spec.tolerance, spec.tolerance, shape)
+    samples = nominal * (1 + delta)
+    if spec.tempco_ppm and spec.delta_T:
+        alpha = rng.uniform(-spec.tempco_ppm, spec.tempco_ppm, shape) * 1e-6
+        samples *= 1 + alpha * spec.delta_T
+    return samples
+
+
+def _batch(nominal, spec, arrangement, n, seed):
+    rng = np.random.default_rng(seed)
+    samples = sample_resistors(nominal, spec, n, rng)
+    if arrangement == "Seri":
+        total = core.series_resistance(samples, axis=1)
+    elif arrangement == "Paralel":
+        total = core.parallel_resistance(samples, axis=1)
+    else:  # ekspresi jaringan, mis. "R1 + (R2 || R3)"
+        net = network.Network(arrangement)
+        total = net.evaluate_arrays({name: samples[:, int(name[1:]) - 1] for name in net.names})
+    return np.asarray(total, dtype=np.float32)
+
+
+@dataclass
+class MonteCarloResult:
+    R_total: np.ndarray   # float32, satu nilai per sampel
+    V: float = None
+
+    def current(self):
+        """I = V / R_total per sampel."""
+        return core.ohm_current(self.V, self.R_total)
+
+    def power(self):
+        """P = V² / R_total per sampel."""
+        return core.power_v2r(self.V, self.R_total)
+
+    def percentiles(self, values, q=PERCENTILES):
+        return dict(zip(q, np.percentile(values, q)))
+
+
+def histogram(values, bins=60):
+    """Pusat ember dan jumlah sampel; hanya ini yang dikirim ke browser."""
+    counts, edges = np.histogram(values, bins=bins)
+    return (edges[:-1] + edges[1:]) / 2, counts
+
+
+def monte_carlo(nominal, spec, arrangement="Seri", n_samples=100_000, seed=0,
+                V=None, workers=1, batch_cells=BATCH_CELLS):
+    """Jalankan ``n_samples`` sampel dan kembalikan :class:`MonteCarloResult`.
+
+    ``arrangement`` adalah "Seri", "Paralel" atau ekspresi jaringan
+    (:mod:`dclistrik.network`) dengan nama ``R1..Rn`` sesuai ``nominal``.
+    Hanya R_total (float32) yang disimpan; arus dan daya diturunkan darinya
+    bila ``V`` diberikan. Dengan ``workers > 1`` batch dibagi ke process pool.
+
+    Hasil identik untuk ``seed`` dan ``batch_cells`` yang sama berapa pun
+    ``workers``; mengubah ``batch_cells`` (atau jumlah hambatan, yang
+    menentukan ukuran batch) menghasilkan sampel lain dengan distribusi sama.
+    """
+    nominal = np.asarray(nominal, dtype=float)
+    batch = max(1, batch_cells // max(nominal.size, 1))
+    sizes = [min(batch, n_samples - start) for start in range(0, n_samples, batch)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    out = np.empty(n_samples, dtype=np.float32)
+
+    jobs = [(nominal, spec, arrangement, size, child) for size, child in zip(sizes, seeds)]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_batch, *zip(*jobs))
+            _fill(out, sizes, results)
+    else:
+        _fill(out, sizes, (_batch(*job) for job in jobs))
+    return MonteCarloResult(R_total=out, V=V)
+
+
+def _fill(out, sizes, results):
+    start = 0
+    for size, values in zip(sizes, results):
+        out[start:start + size] = values
+        start += size
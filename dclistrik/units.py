@@ -0,0 +1,309 @@
+"""Besaran bersatuan: satu array NumPy + tag dimensi, dengan awalan SI.
+
+:class:`Quantity` menyimpan nilai dalam satuan dasar SI (V, A, Ω, W, J, s)
+sebagai satu array ``float64`` ditambah tuple dimensi, bukan objek per
+elemen. Satuan berawalan (mA, kΩ, MΩ, Wh, kWh, jam) hanya berarti satu
+perkalian skalar saat dibuat atau ditampilkan, dan pemeriksaan satuan
+dilakukan sekali per array sehingga jalur batch/vektor tetap secepat
+array biasa.
+
+:func:`compute` menjalankan rumus :mod:`dclistrik.core` pada besaran:
+setiap masukan diperiksa dan dikonversi ke satuan yang diharapkan rumus
+(lihat :data:`SIGNATURES`), hasilnya dikembalikan sebagai besaran::
+
+    I = Quantity(20, "mA")
+    R = Quantity(4.7, "kΩ")
+    f"{compute(core.ohm_voltage, I, R):.2f}"   # '94.00 V'
+"""
+
+import functools
+import math
+import re
+
+import numpy as np
+
+# Dimensi = pangkat (volt, ampere, detik): Ω = V/A, W = V·A, J = V·A·s
+DIMENSIONS = {
+    "": (0, 0, 0),
+    "V": (1, 0, 0),
+    "A": (0, 1, 0),
+    "s": (0, 0, 1),
+    "Ω": (1, -1, 0),
+    "S": (-1, 1, 0),
+    "W": (1, 1, 0),
+    "J": (1, 1, 1),
+}
+BASE_SYMBOL = {dim: symbol for symbol, dim in DIMENSIONS.items()}
+
+PREFIXES = {"p": 1e-12, "n": 1e-9, "µ": 1e-6, "u": 1e-6, "m": 1e-3, "k": 1e3, "M": 1e6, "G": 1e9}
+_AUTO_PREFIX = {-12: "p", -9: "n", -6: "µ", -3: "m", 0: "", 3: "k", 6: "M", 9: "G"}
+
+# Satuan lain: simbol → (satuan dasar, faktor)
+ALIASES = {
+    "Ohm": ("Ω", 1.0), "ohm": ("Ω", 1.0), "Wh": ("J", 3600.0),
+    "h": ("s", 3600.0), "jam": ("s", 3600.0), "min": ("s", 60.0), "menit": ("s", 60.0),
+}
+
+# Pilihan satuan masukan di UI per satuan dasar
+CHOICES = {
+    "V": ["mV", "V", "kV"],
+    "A": ["µA", "mA", "A", "kA"],
+    "Ω": ["mΩ", "Ω", "kΩ", "MΩ"],
+    "W": ["mW", "W", "kW", "MW"],
+    "jam": ["s", "menit", "jam"],
+}
+
+# Satuan masukan dan keluaran tiap rumus core; angka tanpa satuan dianggap
+# sudah dalam satuan masukan ini (perilaku lama)
+SIGNATURES = {
+    "ohm_voltage": (("A", "Ω"), "V"),
+    "ohm_current": (("V", "Ω"), "A"),
+    "ohm_resistance": (("V", "A"), "Ω"),
+    "series_resistance": (("Ω",), "Ω"),
+    "parallel_conductance": (("Ω",), "S"),
+    "parallel_resistance": (("Ω",), "Ω"),
+    "power_vi": (("V", "A"), "W"),
+    "power_i2r": (("A", "Ω"), "W"),
+    "power_v2r": (("V", "Ω"), "W"),
+    "energy_joule": (("W", "jam"), "J"),
+    "energy_kwh": (("W", "jam"), "kWh"),
+    "emf": (("V", "A", "Ω"), "V"),
+    "terminal_voltage": (("V", "A", "Ω"), "V"),
+    "internal_resistance": (("V", "V", "A"), "Ω"),
+}
+
+_NUMBER = re.compile(r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(\S*)\s*$")
+# Kode RKM (IEC 60062): huruf awalan menggantikan titik desimal, R = Ohm
+_RKM = re.compile(r"\s*(\d+[pnuµmkMG]|\d*R)(\d+)\s*$")
+
+
+@functools.lru_cache(maxsize=None)
+def parse_unit(symbol):
+    """``(dimensi, faktor ke SI)`` untuk simbol seperti ``"mA"`` atau ``"kWh"``."""
+    if symbol in DIMENSIONS:
+        return DIMENSIONS[symbol], 1.0
+    if symbol in ALIASES:
+        base, factor = ALIASES[symbol]
+        return DIMENSIONS[base], factor
+    prefix, rest = symbol[:1], symbol[1:]
+    if prefix in PREFIXES and rest and rest != "jam":
+        dim, factor = parse_unit(rest)
+        return dim, PREFIXES[prefix] * factor
+    raise ValueError(f"Satuan tidak dikenal: {symbol!r}")
+
+
+def _prefix_exponent(peak, symbol):
+    # Eksponen kelipatan 3 untuk awalan otomatis; detik tidak memakai ks/Ms
+    if peak == 0 or not math.isfinite(peak):
+        return 0
+    exponent = math.floor(math.log10(peak) / 3) * 3
+    return min(max(exponent, -12), 0 if symbol == "s" else 9)
+
+
+def format_si(value, symbol, spec=".3g"):
+    """Format cepat satu angka dengan awalan SI otomatis, mis. ``4700 → '4.7 kΩ'``."""
+    exponent = _prefix_exponent(abs(value), symbol)
+    return f"{format(value / 10.0 ** exponent, spec)} {_AUTO_PREFIX[exponent]}{symbol}"
+
+
+def _symbol(dim):
+    if dim in BASE_SYMBOL:
+        return BASE_SYMBOL[dim]
+    return "·".join(f"{base}^{power}" if power != 1 else base
+                    for base, power in zip(("V", "A", "s"), dim) if power)
+
+
+class Quantity:
+    """Array nilai (dalam satuan dasar SI) beserta dimensinya.
+
+    ``unit`` adalah satuan tampilan: besaran masukan ditampilkan dalam
+    satuan yang diketik pengguna, hasil hitungan (``unit=None``) memakai
+    awalan SI otomatis. Format ``f"{q:.3f kWh}"`` memaksa satuan tertentu.
+    """
+
+    __slots__ = ("value", "dim", "unit")
+    __array_priority__ = 1000  # ndarray * Quantity diserahkan ke Quantity
+
+    def __init__(self, value, unit=""):
+        dim, factor = parse_unit(unit)
+        value = np.asarray(value, dtype=float)
+        self.value = value * factor if factor != 1.0 else value
+        self.dim = dim
+        self.unit = unit
+
+    @classmethod
+    def base(cls, value, symbol, dim=None):
+        """Besaran dari nilai yang sudah dalam satuan dasar ``symbol``."""
+        q = cls.__new__(cls)
+        q.value = np.asarray(value, dtype=float)
+        q.dim = DIMENSIONS[symbol] if dim is None else dim
+        q.unit = None
+        return q
+
+    @property
+    def symbol(self):
+        return _symbol(self.dim)
+
+    def to(self, unit):
+        """Nilai dalam ``unit`` (array, atau skalar untuk besaran skalar)."""
+        dim, factor = parse_unit(unit)
+        if dim != self.dim:
+            raise ValueError(f"Satuan {self.symbol or '-'} tidak dapat dikonversi ke {unit}")
+        value = self.value / factor if factor != 1.0 else self.value
+        return value[()] if value.ndim == 0 else value
+
+    # Interoperabilitas NumPy: fungsi NumPy melihat nilai SI
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.value, dtype=dtype)
+
+    def __float__(self):
+        return float(self.value)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __getitem__(self, index):
+        q = Quantity.base(self.value[index], "", self.dim)
+        q.unit = self.unit
+        return q
+
+    @property
+    def shape(self):
+        return self.value.shape
+
+    # Aritmetika: dimensi dijumlah/dikurang, penjumlahan wajib berdimensi sama
+    def _same_dim(self, other, op):
+        if not isinstance(other, Quantity):
+            other = Quantity.base(other, "")
+        if other.dim != self.dim:
+            raise ValueError(f"Tidak dapat {op} {self.symbol or '-'} dengan {other.symbol or '-'}")
+        return other.value
+
+    def __add__(self, other):
+        return Quantity.base(self.value + self._same_dim(other, "menjumlahkan"), "", self.dim)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return Quantity.base(self.value - self._same_dim(other, "mengurangkan"), "", self.dim)
+
+    def __rsub__(self, other):
+        return Quantity.base(self._same_dim(other, "mengurangkan") - self.value, "", self.dim)
+
+    def __neg__(self):
+        return Quantity.base(-self.value, "", self.dim)
+
+    def __mul__(self, other):
+        if isinstance(other, Quantity):
+            return Quantity.base(self.value * other.value, "", tuple(a + b for a, b in zip(self.dim, other.dim)))
+        return Quantity.base(self.value * other, "", self.dim)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Quantity):
+            return Quantity.base(self.value / other.value, "", tuple(a - b for a, b in zip(self.dim, other.dim)))
+        return Quantity.base(self.value / other, "", self.dim)
+
+    def __rtruediv__(self, other):
+        return Quantity.base(other / self.value, "", tuple(-a for a in self.dim))
+
+    def __pow__(self, power):
+        if int(power) != power:
+            raise ValueError("Pangkat besaran bersatuan harus bilangan bulat")
+        return Quantity.base(self.value ** power, "", tuple(a * int(power) for a in self.dim))
+
+    # Tampilan
+    def _display(self):
+        # (skala, simbol) untuk satuan tampilan; awalan otomatis untuk hasil
+        if self.unit is not None:
+            return parse_unit(self.unit)[1], self.unit
+        symbol = self.symbol
+        if self.dim not in BASE_SYMBOL or not symbol:
+            return 1.0, symbol
+        finite = np.abs(self.value[np.isfinite(self.value)])
+        peak = finite.max() if finite.size else 0.0
+        exponent = _prefix_exponent(float(peak), symbol)
+        return 10.0 ** exponent, _AUTO_PREFIX[exponent] + symbol
+
+    def __format__(self, spec):
+        spec, _, unit = spec.partition(" ")
+        if unit:
+            scale, symbol = parse_unit(unit)[1], unit
+            self.to(unit)  # periksa dimensi
+        else:
+            scale, symbol = self._display()
+        value = self.value / scale
+        if value.ndim == 0:
+            text = format(float(value), spec or "g")
+        else:
+            text = np.array2string(value, threshold=6, edgeitems=2,
+                                   formatter={"float_kind": lambda x: format(x, spec or "g")})
+        return f"{text} {symbol}" if symbol else text
+
+    def __str__(self):
+        return format(self, "")
+
+    def __repr__(self):
+        return f"Quantity({format(self, '')!r})"
+
+
+def parse_quantity(text, unit):
+    """Baca teks seperti ``"4.7k"``, ``"4.7 kΩ"`` atau ``"20mA"`` sebagai nilai dalam ``unit``.
+
+    Akhiran boleh berupa awalan saja (``k``, ``M``, ``m``) atau satuan
+    lengkap yang dimensinya sama dengan ``unit``; tanpa akhiran angka
+    dianggap sudah dalam ``unit``. Kode RKM seperti ``"4k7"`` (4,7 k) dan
+    ``"4R7"`` (4,7 Ω) juga diterima.
+    """
+    rkm = _RKM.match(text)
+    if rkm is not None:
+        head, tail = rkm.groups()
+        number, suffix = float(f"{head[:-1] or 0}.{tail}"), head[-1]
+        suffix = "Ω" if suffix == "R" else suffix
+    else:
+        match = _NUMBER.match(text)
+        if match is None:
+            raise ValueError(f"Besaran tidak valid: {text!r}")
+        number, suffix = float(match.group(1)), match.group(2)
+    if not suffix:
+        return number
+    dim, factor = parse_unit(unit)
+    if suffix in PREFIXES:
+        suffix_dim, suffix_factor = dim, PREFIXES[suffix] * factor
+    else:
+        suffix_dim, suffix_factor = parse_unit(suffix)
+    if suffix_dim != dim:
+        raise ValueError(f"Satuan {suffix!r} tidak cocok untuk {unit}")
+    return number * suffix_factor / factor
+
+
+def parse_values(tokens, unit):
+    """Array nilai dalam ``unit`` dari daftar teks/angka; jalur cepat bila semuanya angka biasa."""
+    try:
+        return np.array(tokens, dtype=float)
+    except ValueError:
+        # Campuran angka (mis. dari JSON) dan teks berakhiran satuan
+        return np.array([parse_quantity(token, unit) if isinstance(token, str) else float(token)
+                         for token in tokens], dtype=float)
+
+
+def _magnitude(arg, unit):
+    # Nilai ``arg`` dalam ``unit``; angka biasa dianggap sudah dalam ``unit``
+    if not isinstance(arg, Quantity):
+        return arg
+    return arg.to(unit)
+
+
+def compute(func, *args):
+    """Jalankan rumus core ``func`` pada besaran dan kembalikan :class:`Quantity`.
+
+    Dimensi setiap masukan diperiksa terhadap :data:`SIGNATURES`
+    (``ValueError`` bila tidak cocok), lalu nilainya dikonversi ke satuan
+    yang diharapkan rumus dengan satu perkalian skalar.
+    """
+    inputs, output = SIGNATURES[func.__name__]
+    values = [_magnitude(arg, unit) for arg, unit in zip(args, inputs)]
+    dim, factor = parse_unit(output)
+    result = np.asarray(func(*values), dtype=float)
+    return Quantity.base(result * factor if factor != 1.0 else result, "", dim)
@@ -0,0 +1,41 @@
+"""Uji :mod:`dclistrik.assets`: minifikasi CSS tidak mengubah makna selektor."""
+
+import os
+import time
+
+import pytest
+
+from dclistrik import assets
+
+
+@pytest.mark.parametrize("source, expected", [
+    (".a :hover { color: red; }", ".a :hover{color:red}"),
+    (".a:hover , .b > c { margin : 0 ; }", ".a:hover,.b>c{margin :0}"),
+    ("/* komentar */ @media (max-width: 768px) { a { x: 1 } }", "@media (max-width:768px){a{x:1}}"),
+    ("::-webkit-scrollbar { width: 8px }", "::-webkit-scrollbar{width:8px}"),
+])
+def test_minify_css(source, expected):
+    assert assets.minify_css(source) == expected
+
+
+def test_build_stylesheet_is_content_addressed(tmp_path):
+    first = assets.build_stylesheet(str(tmp_path))
+    assert assets.build_stylesheet(str(tmp_path)) == first
+    assert (tmp_path / first).read_text(encoding="utf-8") == assets.minify_css(
+        open(assets.SOURCE_CSS, encoding="utf-8").read() + "\n" + assets.APP_CSS)
+
+
+def test_old_bundles_survive_grace_period(tmp_path):
+    now = time.time()
+    # Bundel lama: A digantikan B dua hari lalu, B baru digantikan sekarang
+    for name, age in [("physics_listrik.aaaaaaaaaaaa.min.css", 3), ("physics_listrik.bbbbbbbbbbbb.min.css", 2)]:
+        (tmp_path / name).write_text("a{}", encoding="utf-8")
+        os.utime(tmp_path / name, (now - age * 86400,) * 2)
+    (tmp_path / "lain.css").write_text("b{}", encoding="utf-8")
+    current = assets.build_stylesheet(str(tmp_path))
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        [current, "physics_listrik.bbbbbbbbbbbb.min.css", "lain.css"])
+    assert oct((tmp_path / current).stat().st_mode & 0o777) == oct(0o644)
+    # Setelah masa tenggang lewat, hanya bundel terkini yang tersisa
+    assets.remove_stale(str(tmp_path), current, now=now + 2 * assets.STALE_AFTER)
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([current, "lain.css"])
@@ -0,0 +1,52 @@
+"""Uji :mod:`dclistrik.batch`: hasil per rumus dan parsing satuan."""
+
+import io
+import json
+
+import pytest
+
+from dclistrik import batch
+
+
+def _results(rows, **kwargs):
+    return [result for _, result in batch.process(rows, **kwargs)]
+
+
+def test_formulas_known_answers():
+    rows = [
+        {"rumus": "ohm_current", "V": "12", "R": "4"},
+        {"rumus": "power_vi", "V": "230", "I": "500m"},
+        {"rumus": "series", "R": "4.7k 100"},
+        {"rumus": "parallel", "R": "10, 10"},
+        {"rumus": "terminal_voltage", "epsilon": "12", "I": "2", "r": "0.5"},
+    ]
+    values = [value for value, _ in _results(rows)]
+    assert values == pytest.approx([3.0, 115.0, 4800.0, 5.0, 11.0])
+
+
+def test_json_lists_accept_units():
+    # Daftar JSON dan teks menerima masukan yang sama
+    rows = [{"rumus": "series", "R": ["4.7k", 100]}, {"rumus": "series", "R": "4.7k 100"},
+            {"rumus": "parallel", "R": ["1k", "1kΩ"]}, {"rumus": "ohm_current", "V": 12, "R": "4k"}]
+    values = [value for value, _ in _results(rows)]
+    assert values == pytest.approx([4800.0, 4800.0, 500.0, 3e-3])
+
+
+def test_json_run():
+    output = io.StringIO()
+    batch.run(io.StringIO('{"rumus": "series", "R": ["4.7k", 100]}\n'), output, input_format="jsonl",
+              output_format="jsonl")
+    assert json.loads(output.getvalue())["hasil"] == pytest.approx(4800.0)
+
+
+def test_unknown_formula_and_missing_column():
+    with pytest.raises(ValueError, match="Rumus tidak dikenal"):
+        _results([{"rumus": "nope"}])
+    with pytest.raises(ValueError, match="wajib"):
+        _results([{"rumus": "ohm_current", "V": "12"}])
+
+
+def test_run_csv_roundtrip():
+    output = io.StringIO()
+    batch.run(io.StringIO("rumus,V,R\nohm_current,12,4k\n"), output)
+    assert output.getvalue().splitlines()[1].endswith("0.003,A")
@@ -0,0 +1,101 @@
+"""Uji :mod:`dclistrik.cache`: kunci kanonik, backend dan penolakan nilai besar."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from dclistrik import cache, tolerance
+
+
+def _backend(kind, tmp_path, **kwargs):
+    if kind == "memori":
+        return cache.MemoryBackend(**kwargs)
+    if kind == "sqlite":
+        return cache.SQLiteBackend(str(tmp_path / "cache.db"), **kwargs)
+    return cache.TieredBackend(cache.MemoryBackend(**kwargs), cache.SQLiteBackend(str(tmp_path / "cache.db"), **kwargs))
+
+
+def test_canonical_key_distinguishes_types():
+    assert cache.canonical_key("a", (1, 2.0)) == cache.canonical_key("a", (1, 2.0))
+    assert cache.canonical_key("a", 1) != cache.canonical_key("a", 1.0)
+    assert cache.canonical_key(np.arange(3)) != cache.canonical_key(np.arange(3.0))
+
+
+@pytest.mark.parametrize("kind", ["memori", "sqlite", "berlapis"])
+def test_get_or_compute_roundtrip(kind, tmp_path):
+    shared = cache.SharedCache(_backend(kind, tmp_path), version="uji")
+    calls = []
+    compute = lambda: calls.append(1) or np.arange(5.0)  # noqa: E731
+    first = shared.get_or_compute("ns", (1,), compute)
+    second = shared.get_or_compute("ns", (1,), compute)
+    np.testing.assert_array_equal(first, second)
+    assert len(calls) == 1
+
+
+class _CountingEncode:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+        return pickle.dumps(value)
+
+
+@pytest.mark.parametrize("kind", ["memori", "sqlite", "berlapis"])
+def test_oversize_results_are_not_encoded(kind, tmp_path):
+    backend = _backend(kind, tmp_path, max_item_bytes=2**20)
+    shared = cache.SharedCache(backend, version="uji")
+    encode = _CountingEncode()
+    big = tolerance.MonteCarloResult(R_total=np.zeros(2**20, dtype=np.float32))
+    assert shared.get_or_compute("besar", (), lambda: big, encode) is big
+    assert encode.calls == 0 and backend.stats()["dilewati"] == 1
+    shared.get_or_compute("kecil", (), lambda: (np.zeros(10), "ok"), encode)
+    assert encode.calls == 1
+
+
+def test_item_larger_than_total_budget_is_skipped():
+    backend = cache.MemoryBackend(max_bytes=100, max_item_bytes=2**20)
+    assert not backend.set("k", b"x" * 200)
+    assert backend.stats()["dilewati"] == 1 and backend.get("k") is None
+
+
+def test_ttl_expiry():
+    backend = cache.MemoryBackend()
+    backend.set("k", b"v", ttl=-1)
+    assert backend.get("k") is None and backend.stats()["kedaluwarsa"] == 1
+
+
+def test_tiered_copy_inherits_remaining_ttl(tmp_path, monkeypatch):
+    back = cache.SQLiteBackend(str(tmp_path / "cache.db"))
+    back.set("k", b"v", ttl=10)
+    tiered = cache.TieredBackend(cache.MemoryBackend(), back)
+    now = cache.time.time()
+    assert tiered.get("k") == b"v"
+    # Setelah TTL SQLite lewat, salinan memori juga tidak boleh disajikan
+    monkeypatch.setattr(cache.time, "time", lambda: now + 11)
+    assert tiered.get("k") is None
+
+
+def test_sqlite_running_total(tmp_path):
+    path = str(tmp_path / "cache.db")
+    backend = cache.SQLiteBackend(path, max_bytes=250)
+    backend.set("a", b"x" * 100)
+    backend.set("a", b"x" * 50)       # ganti nilai: total ikut turun
+    backend.set("b", b"x" * 100)
+    backend.set("c", b"x" * 100)      # melebihi 250: "a" digusur
+    backend.set("d", b"x" * 10, ttl=-1)
+    backend.set("e", b"x" * 10)       # "d" kedaluwarsa dibersihkan
+    db = backend._db()
+    actual = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+    assert backend.stats()["byte"] == actual == 210
+    # Proses lain (koneksi baru) melihat total yang sama
+    assert cache.SQLiteBackend(path).stats()["byte"] == 210
+
+
+def test_from_env_defaults_off(tmp_path):
+    assert cache.from_env({}) is None
+    with pytest.raises(ValueError):
+        cache.from_env({"DCLISTRIK_CACHE": "memory"})
+    shared = cache.from_env({"DCLISTRIK_CACHE": f"sqlite:{tmp_path / 'c.db'}"})
+    assert isinstance(shared.backend, cache.TieredBackend)
@@ -0,0 +1,18 @@
+"""Uji :mod:`dclistrik.export`: figure pool mengikuti argumen grafik."""
+
+import pytest
+
+from dclistrik import export
+
+
+def test_log_sweep_axis_and_reset():
+    pool = export.FigurePool()
+    ax = pool.draw("ohm_current", 12.0, 10.0, 1, 1e4, 200, True).axes[0]
+    assert ax.get_xscale() == "log"
+    assert pool.draw("ohm_current", 12.0, 10.0, 1, 50, 100, False).axes[0].get_xscale() == "linear"
+    assert pool.draw("ohm_current", 12.0, 10.0).axes[0].get_xscale() == "linear"
+
+
+@pytest.mark.parametrize("fmt, magic", [("png", b"\x89PNG"), ("svg", b"<?xml")])
+def test_render_formats(fmt, magic):
+    assert export.FigurePool().render("ohm_current", 12.0, 10.0, 1, 1e4, 200, True, fmt=fmt).startswith(magic)
@@ -0,0 +1,96 @@
+"""Uji :mod:`dclistrik.network`: pembaruan inkremental harus sama dengan evaluasi ulang penuh."""
+
+import random
+
+import numpy as np
+import pytest
+
+from dclistrik import network
+
+
+def _fresh(expression, values):
+    return network.Network(expression, values).total
+
+
+def test_known_answer():
+    net = network.Network("R1 + (R2 || R3)", {"R1": 10, "R2": 20, "R3": 20})
+    assert net.total == pytest.approx(20.0)
+    assert net.set("R3", 60) == pytest.approx(25.0)
+
+
+def test_parallel_binds_tighter_and_constants():
+    # R1 + R2 || R3 = R1 + (R2 || R3); 0 Ohm di paralel dilewati
+    assert network.Network("R1 + R2 || R3", {"R1": 1, "R2": 6, "R3": 3}).total == pytest.approx(3.0)
+    assert network.Network("(R1 + 2) || 0 || R1", {"R1": 4}).total == pytest.approx(2.4)
+    assert network.Network(network.ladder_expression(3), {"R1": 1, "R2": 2, "R3": 2}).total == pytest.approx(2.0)
+
+
+def test_shared_subexpressions_are_interned():
+    net = network.Network("(R1 || R2) + (R2 || R1) + R1", {"R1": 2, "R2": 2})
+    assert net.total == pytest.approx(4.0)
+    assert net.shared >= 1
+
+
+def test_changed_values_only_lists_differences():
+    previous = np.array([1.0, 2.0, 3.0])
+    assert network.changed_values(previous, previous) == {}
+    assert network.changed_values(previous, [1.0, 5.0, 3.0]) == {"R2": 5.0}
+    net = network.Network("R1 + (R2 || R3)", network.resistor_values(previous))
+    net.update(network.changed_values(previous, [1.0, 6.0, 3.0]))
+    assert net.total == pytest.approx(3.0)
+    assert net.recomputed == 2
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("R1 + 4k7", 5000.0),
+    ("R1 + 2.2k", 2500.0),
+    ("(R1 || 1kΩ) + 1e+3", 1000.0 + 300 * 1000 / 1300),
+    ("R1 + 4R7", 304.7),
+])
+def test_constants_accept_si_suffixes(expression, expected):
+    assert network.Network(expression, {"R1": 300}).total == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("expression", ["R1 +", "R1 + (R2", "R1 R2", "R1 ? R2", "", "R1 + )", "R1 + 4x", "R1 + 4kV"])
+def test_invalid_expression_raises(expression):
+    with pytest.raises(ValueError):
+        network.Network(expression)
+
+
+def test_delta_series_cancels_to_exact_zero():
+    # Sisa pembulatan (2.8e-17) tidak boleh menjadi "hambatan" seri yang
+    # diparalelkan dengan R0
+    expression = "R0 || (" + " + ".join(f"R{i}" for i in range(1, 18)) + ")"
+    values = {f"R{i}": 0.0 for i in range(18)}
+    values.update(R0=10.0, R1=0.1, R2=0.2)
+    net = network.Network(expression, values)
+    net.update({"R1": 0})
+    net.update({"R2": 0})
+    values.update(R1=0.0, R2=0.0)
+    assert net.total == _fresh(expression, values) == 10.0
+
+
+def test_delta_parallel_cancels_to_exact_zero():
+    expression = "R0 + (" + " || ".join(f"R{i}" for i in range(1, 18)) + ")"
+    values = {f"R{i}": 0.0 for i in range(18)}
+    values.update(R0=10.0, R1=10.0, R2=5.0)
+    net = network.Network(expression, values)
+    net.update({"R1": 0})
+    net.update({"R2": 0})
+    values.update(R1=0.0, R2=0.0)
+    assert net.total == _fresh(expression, values) == 10.0
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_matches_fresh(seed):
+    rng = random.Random(seed)
+    wide = " + ".join(f"X{i}" for i in range(20))
+    expression = "(A || B || (C + D)) + ((" + wide + ") || E) + (" + " || ".join(f"Y{i}" for i in range(20)) + ")"
+    pick = lambda: rng.choice([0.0, 0.0, 0.1, 0.2, 0.3, 0.7, 1e-3, 47.0])
+    values = {name: pick() for name in network.Network(expression).leaves}
+    net = network.Network(expression, values)
+    for _ in range(50):
+        change = {name: pick() for name in rng.sample(sorted(values), 3)}
+        values.update(change)
+        net.update(change)
+        assert net.total == pytest.approx(_fresh(expression, values), rel=1e-9, abs=1e-12)
@@ -0,0 +1,49 @@
+"""Uji :mod:`dclistrik.simulate`: langkah adaptif dan titik henti baterai."""
+
+import numpy as np
+import pytest
+
+from dclistrik import simulate
+
+
+def _run(**kwargs):
+    chunks = list(simulate.simulate_battery(simulate.Battery(), simulate.constant(20.0), 4 * 3600, **kwargs))
+    return chunks, sum(len(chunk.t) for chunk in chunks)
+
+
+def test_chunk_size_does_not_change_result():
+    # Iterasi prediktor-korektor konvergen, jadi chunk panjang tidak menggeser titik henti
+    (*_, long_chunk), _ = _run(dt=0.01)
+    (*_, short_chunk), _ = _run(dt=0.01, chunk_steps=1000)
+    assert long_chunk.t[-1] == pytest.approx(short_chunk.t[-1], abs=0.01)
+    assert long_chunk.energy[-1] == pytest.approx(short_chunk.energy[-1], rel=1e-6)
+
+
+def test_adaptive_step_matches_fixed_with_fewer_steps():
+    fixed, fixed_steps = _run(dt=0.01)
+    adaptive, adaptive_steps = _run(dt=0.01, adaptive=True)
+    assert adaptive_steps < fixed_steps / 20
+    assert adaptive[-1].stopped == fixed[-1].stopped == "baterai habis"
+    assert adaptive[-1].t[-1] == pytest.approx(fixed[-1].t[-1], rel=1e-4)
+    assert adaptive[-1].energy[-1] == pytest.approx(fixed[-1].energy[-1], rel=1e-4)
+    steps = np.diff(np.concatenate([chunk.t for chunk in adaptive]))
+    assert steps.max() == pytest.approx(1.0) and steps.min() >= 0.01 * (1 - 1e-9)
+
+
+def test_adaptive_step_stops_at_cutoff_like_fixed():
+    battery = simulate.Battery(cutoff_voltage=11.5)
+    fixed = list(simulate.simulate_battery(battery, simulate.constant(20.0), 4 * 3600, dt=0.01))
+    adaptive = list(simulate.simulate_battery(battery, simulate.constant(20.0), 4 * 3600, dt=0.01, adaptive=True))
+    assert adaptive[-1].stopped == fixed[-1].stopped == "tegangan di bawah batas"
+    assert adaptive[-1].t[-1] == pytest.approx(fixed[-1].t[-1], rel=1e-4)
+    # Chunk terakhir dihitung ulang dengan langkah terkecil
+    assert np.diff(adaptive[-1].t).max() == pytest.approx(0.01)
+
+
+def test_adaptive_step_tracks_pulsed_load():
+    profile = simulate.duty_cycle(40.0, 1.0, 0.25, 2.0)
+    kwargs = dict(dt=1 / 64, max_dt=0.25, chunk_steps=20_000)
+    fixed = list(simulate.simulate_battery(simulate.Battery(), profile, 4 * 3600, **kwargs))
+    adaptive = list(simulate.simulate_battery(simulate.Battery(), profile, 4 * 3600, adaptive=True, **kwargs))
+    assert adaptive[-1].energy[-1] == pytest.approx(fixed[-1].energy[-1], rel=1e-3)
+    assert adaptive[-1].t[-1] == pytest.approx(fixed[-1].t[-1], rel=5e-3)
@@ -0,0 +1,82 @@
+"""Uji :mod:`dclistrik.solver` terhadap jawaban yang dihitung tangan."""
+
+import numpy as np
+import pytest
+
+from dclistrik import solver
+
+
+def _solve(text):
+    solution = solver.solve(solver.parse_netlist(text))
+    voltages = dict(zip(solution.node_names, solution.node_voltages))
+    currents = dict(zip(solution.branch_names, solution.branch_currents))
+    powers = dict(zip(solution.branch_names, solution.branch_powers))
+    return solution, voltages, currents, powers
+
+
+def test_voltage_divider():
+    _, v, i, p = _solve("V1 in 0 12\nR1 in out 1k\nR2 out 0 2k")
+    assert v["in"] == pytest.approx(12.0)
+    assert v["out"] == pytest.approx(8.0)
+    assert i["R1"] == i["R2"] == pytest.approx(4e-3)
+    assert i["V1"] == pytest.approx(4e-3)  # keluar dari kutub +
+    assert p["R1"] == pytest.approx(16e-3)
+
+
+def test_unbalanced_wheatstone_bridge():
+    # vb + vc = 10 dan vb - vc = 10/11 dari KCL di node b dan c
+    _, v, i, _ = _solve("""
+        V1 a 0 10
+        R1 a b 100
+        R2 b 0 200
+        R3 a c 200
+        R4 c 0 100
+        R5 b c 50
+    """)
+    assert v["b"] == pytest.approx(60 / 11)
+    assert v["c"] == pytest.approx(50 / 11)
+    assert i["R5"] == pytest.approx(1 / 55)
+    assert i["V1"] == pytest.approx(i["R1"] + i["R3"])
+
+
+def test_internal_resistance():
+    solution, v, i, p = _solve("V1 1 0 12 r=1\nR1 1 0 5")
+    assert i["V1"] == pytest.approx(2.0)
+    assert v["1"] == pytest.approx(10.0)
+    assert p["V1"] == pytest.approx(4.0)
+    assert solution.total_power == pytest.approx(24.0)
+
+
+def test_current_source():
+    # Arus mengalir dari node+ (ground) melalui sumber ke node- (1)
+    _, v, i, _ = _solve("I1 0 1 2\nR1 1 0 5")
+    assert v["1"] == pytest.approx(10.0)
+    assert i["R1"] == pytest.approx(2.0)
+
+
+def test_zero_ohm_short():
+    _, v, i, p = _solve("V1 1 0 10\nR1 1 2 0\nR2 2 0 5")
+    assert v["2"] == pytest.approx(10.0)
+    assert i["R1"] == pytest.approx(2.0)
+    assert p["R1"] == 0.0
+
+
+def test_grid_netlist_matches_text():
+    grid = solver.solve(solver.grid_netlist(1, 3, R=2.0, emf=6.0))
+    # 1 × 3: dua hambatan 2 Ω seri dari n0 ke ground
+    np.testing.assert_allclose(grid.node_voltages, [6.0, 3.0])
+
+
+@pytest.mark.parametrize("text", [
+    "V1 1 0 5\nR1 1 0 10\nR2 2 3 10",         # node 2-3 mengambang
+    "V1 1 0 5\nV2 1 0 6\nR1 1 0 1",           # loop sumber tegangan
+])
+def test_singular_circuit_raises(text):
+    with pytest.raises(ValueError, match="tidak dapat diselesaikan"):
+        solver.solve(solver.parse_netlist(text))
+
+
+@pytest.mark.parametrize("text", ["X1 1 0 5", "R1 1 0", "R1 1 0 abc", "V1 1 0 5 q=1"])
+def test_invalid_netlist_raises(text):
+    with pytest.raises(ValueError, match="Baris 1"):
+        solver.parse_netlist(text)
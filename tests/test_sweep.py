@@ -0,0 +1,43 @@
+"""Uji :mod:`dclistrik.sweep`: nilai grid dan batas ukurannya."""
+
+import numpy as np
+import pytest
+
+from dclistrik import sweep
+
+
+def test_grid_matches_formula():
+    model = sweep.MODELS["Hukum Ohm (I = V / R)"]
+    axes = {"V": np.array([6.0, 12.0]), "R": np.array([2.0, 3.0, 4.0])}
+    grid = sweep.evaluate(model, axes, chunk_cells=2)
+    np.testing.assert_allclose(grid, axes["V"][:, None] / axes["R"][None, :])
+
+
+@pytest.mark.parametrize("n_axes", [2, 3])
+def test_max_resolution_fits(n_axes):
+    n = sweep.max_resolution(n_axes)
+    assert n ** n_axes <= sweep.MAX_CELLS < (n + 1) ** n_axes
+
+
+def test_oversize_grid_rejected_before_allocation():
+    model = sweep.MODELS["Tegangan Jepit (ε, r, R)"]
+    axes = {key: np.linspace(1.0, 2.0, 5000) for key in ("epsilon", "r", "R")}
+    with pytest.raises(ValueError, match="melebihi"):
+        sweep.evaluate(model, axes)
+
+
+def test_table_axes_caps_rows():
+    axes = {key: np.linspace(0.0, 1.0, 292) for key in ("epsilon", "r", "R")}
+    thinned, step = sweep.table_axes(axes)
+    rows = np.prod([len(v) for v in thinned.values()])
+    assert step > 1 and rows <= sweep.MAX_TABLE_ROWS
+    assert thinned["R"][0] == 0.0 and thinned["R"][1] == axes["R"][step]
+    small = {"V": np.arange(3.0), "R": np.arange(4.0)}
+    assert sweep.table_axes(small)[1] == 1
+
+
+def test_iter_table_streams_every_row():
+    model = sweep.MODELS["Hukum Ohm (I = V / R)"]
+    axes = {"V": np.array([6.0, 12.0]), "R": np.array([2.0, 3.0, 4.0])}
+    lines = "".join(sweep.iter_table(model, axes, chunk_cells=2)).splitlines()
+    assert lines[0] == "V,R,Arus (A)" and len(lines) == 7 and lines[-1] == "12,4,3"
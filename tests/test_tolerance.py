@@ -0,0 +1,40 @@
+"""Uji :mod:`dclistrik.tolerance`: batas sampel dan reprodusibilitas."""
+
+import numpy as np
+import pytest
+
+from dclistrik import tolerance
+
+
+def test_zero_tolerance_is_nominal():
+    spec = tolerance.ToleranceSpec(tolerance=0.0)
+    result = tolerance.monte_carlo([10.0, 20.0, 20.0], spec, "R1 + (R2 || R3)", n_samples=1000, V=10.0)
+    np.testing.assert_allclose(result.R_total, 20.0)
+    np.testing.assert_allclose(result.current(), 0.5)
+    np.testing.assert_allclose(result.power(), 5.0)
+
+
+@pytest.mark.parametrize("arrangement, low, high", [("Seri", 57.0, 63.0), ("Paralel", 19 / 3, 7.0)])
+def test_uniform_bounds(arrangement, low, high):
+    spec = tolerance.ToleranceSpec(tolerance=0.05)
+    result = tolerance.monte_carlo([20.0, 20.0, 20.0], spec, arrangement, n_samples=20_000)
+    # Seri/paralel ketiganya identik: batas R_total = nominal × (1 ± 5%)
+    assert low * (1 - 1e-6) <= result.R_total.min() and result.R_total.max() <= high * (1 + 1e-6)
+    assert result.R_total.mean() == pytest.approx((low + high) / 2, rel=5e-3)
+
+
+def test_identical_across_workers():
+    spec = tolerance.ToleranceSpec(tolerance=0.1, distribution="normal")
+    kwargs = dict(n_samples=5000, seed=3, batch_cells=1000)
+    serial = tolerance.monte_carlo([10.0, 47.0], spec, "Paralel", workers=1, **kwargs)
+    pooled = tolerance.monte_carlo([10.0, 47.0], spec, "Paralel", workers=2, **kwargs)
+    np.testing.assert_array_equal(serial.R_total, pooled.R_total)
+
+
+def test_batch_size_changes_samples_not_distribution():
+    # Aliran acak diturunkan per batch: batch_cells lain = sampel lain
+    spec = tolerance.ToleranceSpec(tolerance=0.1)
+    small = tolerance.monte_carlo([10.0, 47.0], spec, "Seri", n_samples=50_000, seed=3, batch_cells=1000)
+    large = tolerance.monte_carlo([10.0, 47.0], spec, "Seri", n_samples=50_000, seed=3, batch_cells=20_000)
+    assert not np.array_equal(small.R_total, large.R_total)
+    assert small.R_total.mean() == pytest.approx(large.R_total.mean(), rel=2e-3)
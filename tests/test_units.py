@@ -0,0 +1,53 @@
+"""Uji :mod:`dclistrik.units`: parsing awalan SI, konversi dan format."""
+
+import numpy as np
+import pytest
+
+from dclistrik import units
+
+
+@pytest.mark.parametrize("text, unit, expected", [
+    ("4.7k", "Ω", 4700.0),
+    ("2.2MΩ", "Ω", 2.2e6),
+    ("500mA", "A", 0.5),
+    ("1.5 kWh", "J", 5.4e6),
+    ("100", "V", 100.0),
+    ("4k7", "Ω", 4700.0),
+    ("4R7", "Ω", 4.7),
+    ("R47", "Ω", 0.47),
+    ("2M2", "Ω", 2.2e6),
+    ("4m7", "A", 4.7e-3),
+])
+def test_parse_quantity(text, unit, expected):
+    assert units.parse_quantity(text, unit) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("text", ["abc", "4.7kV", "", "4k7V", "k7"])
+def test_parse_quantity_rejects(text):
+    with pytest.raises(ValueError):
+        units.parse_quantity(text, "Ω")
+
+
+def test_rkm_ohm_code_checks_dimension():
+    with pytest.raises(ValueError):
+        units.parse_quantity("4R7", "V")
+
+
+def test_parse_values():
+    np.testing.assert_allclose(units.parse_values(["4.7k", "100", "1M"], "Ω"), [4700.0, 100.0, 1e6])
+    np.testing.assert_allclose(units.parse_values(["4.7k", 100, 2.5], "Ω"), [4700.0, 100.0, 2.5])
+
+
+def test_quantity_arithmetic_and_format():
+    V = units.Quantity(2, "A") * units.Quantity(5, "Ω")
+    assert f"{V:.2f}" == "10.00 V"
+    assert f"{units.Quantity.base(4700.0, 'Ω'):.2f}" == "4.70 kΩ"
+    assert f"{units.Quantity(3.6e6, 'J'):.3f kWh}" == "1.000 kWh"
+    assert units.Quantity(4700, "Ω").to("kΩ") == pytest.approx(4.7)
+    with pytest.raises(ValueError):
+        units.Quantity(1, "V") + units.Quantity(1, "A")
+
+
+@pytest.mark.parametrize("value, expected", [(4700, "4.7 kΩ"), (0.0047, "4.7 mΩ"), (0, "0 Ω")])
+def test_format_si(value, expected):
+    assert units.format_si(value, "Ω") == expected